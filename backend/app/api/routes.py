@@ -1,35 +1,122 @@
+import asyncio
+from functools import lru_cache
+import logging
 from fastapi import APIRouter, HTTPException, Header
 from app.models.schemas import (
     SearchRequest,
     SearchResponse,
+    SearchResult,
+    SearchResultSummary,
     ConnectedCalendarProvider,
+    Game,
+    TicketSummary,
     PlanCreateRequest,
     PlanResponse,
 )
-from app.services.store import store
-from app.services.scoring import is_available, score_game, WEIGHTS
+from app.services.store import async_store
+from app.services.audit import audit
+from app.services.scoring import ScoringColumns, explain, score_games, WEIGHTS
+from app.services.availability import available_games, buffered_windows
+from app.services.geo import distance_calculator
+from app.services.schedule import schedule_store
+from app.services.prefetch import prefetcher
+from app.services.ranking import decode_cursor, encode_cursor, top_k
 from app.providers.calendar import MockCalendarProvider
-from app.providers.tickets import ESPNProvider, SeatGeekProvider
+from app.providers.aggregate import AggregateTicketProvider
+from app.providers.tickets import ESPNProvider, PartialScheduleError, SeatGeekProvider
 from app.core.config import settings
 from app.services.security import TokenCipher
 from app.services.cache import TTLCache
 from app.services.rate_limit import rate_limiter
+from app.services.fanout import bounded_gather
+from app.services.freebusy import freebusy_cache
+from app.services.plan_availability import PlanAvailability
+from app.services.coalesce import SingleFlight, cached_fetch
+from app.services.http import http_pool
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
-games_cache = TTLCache(ttl_seconds=settings.games_cache_ttl_seconds)
-tickets_cache = TTLCache(ttl_seconds=settings.tickets_cache_ttl_seconds)
+games_cache = TTLCache(
+    ttl_seconds=settings.games_cache_ttl_seconds,
+    max_entries=settings.games_cache_max_entries,
+    max_bytes=settings.games_cache_max_bytes,
+    stale_seconds=settings.cache_stale_seconds if settings.cache_stale_while_revalidate else 0,
+)
+tickets_cache = TTLCache(
+    ttl_seconds=settings.tickets_cache_ttl_seconds,
+    max_entries=settings.tickets_cache_max_entries,
+    max_bytes=settings.tickets_cache_max_bytes,
+    stale_seconds=settings.cache_stale_seconds if settings.cache_stale_while_revalidate else 0,
+)
+games_flight = SingleFlight()
+tickets_flight = SingleFlight()
+calendar_provider = MockCalendarProvider()
+calendar_providers = {"google": calendar_provider, "microsoft": calendar_provider, "mock": calendar_provider}
+
+
+async def load_participants_busy(user_ids: list[str], time_min, time_max):
+    providers_by_participant = await async_store.get_users_providers(user_ids)
+    accounts_by_participant = {
+        uid: [(p.provider, p.account_email) for p in providers_by_participant[uid]] for uid in user_ids
+    }
+    return await freebusy_cache.get_participants_freebusy(calendar_providers, time_min, time_max, accounts_by_participant)
+
+
+plan_availability = PlanAvailability(
+    load_participants_busy,
+    horizon_days=settings.plan_bitmap_horizon_days,
+    slot_minutes=settings.plan_bitmap_slot_minutes,
+    # Bitmaps are read instead of the synced calendars, so they must not
+    # outlive a sync interval.
+    ttl_seconds=min(settings.plan_bitmap_ttl_seconds, settings.calendar_sync_interval_seconds),
+    max_plans=settings.plan_bitmap_max_entries,
+    max_bytes=settings.plan_bitmap_max_bytes,
+)
 
 
 def current_user_id(x_user_id: str | None) -> str:
     return x_user_id or "demo-user"
 
 
+def ticket_price_bounds(pref) -> tuple[float, float]:
+    min_p = max(0, pref.budget_total * pref.price_tier * 0.25)
+    max_p = pref.budget_total * (0.8 + pref.price_tier)
+    return min_p, max_p
+
+
+async def lookup_ticket(provider, game, pref):
+    min_p, max_p = ticket_price_bounds(pref)
+    ticket_cache_key = f"ticket:{game.game_id}:{pref.party_size}:{min_p:.2f}:{max_p:.2f}"
+    return await cached_fetch(
+        tickets_cache,
+        tickets_flight,
+        ticket_cache_key,
+        lambda: provider.search_tickets(game.game_id, pref.party_size, (min_p, max_p)),
+        stale_while_revalidate=settings.cache_stale_while_revalidate,
+    )
+
+
+@lru_cache(maxsize=1)
 def get_ticket_provider():
-    if settings.seargeek_client_id and settings.seargeek_client_secret:
-        return SeatGeekProvider(settings.seargeek_client_id, settings.seargeek_client_secret)
-    return ESPNProvider()
+    providers = []
+    for name in settings.ticket_providers.split(","):
+        name = name.strip().lower()
+        if name == "seatgeek" and settings.seargeek_client_id and settings.seargeek_client_secret:
+            providers.append(SeatGeekProvider(settings.seargeek_client_id, settings.seargeek_client_secret, http=http_pool))
+        elif name == "espn":
+            providers.append(ESPNProvider(http=http_pool))
+    if len(providers) <= 1:
+        return providers[0] if providers else ESPNProvider(http=http_pool)
+    return AggregateTicketProvider(
+        providers,
+        list_timeout_seconds=settings.provider_list_timeout_seconds,
+        ticket_budget_seconds=settings.provider_ticket_budget_seconds,
+        failure_threshold=settings.provider_failure_threshold,
+        reset_seconds=settings.provider_reset_seconds,
+        alias_ttl_seconds=settings.schedule_freshness_seconds,
+    )
 
 
 @router.post("/auth/{provider}/start")
@@ -53,16 +140,22 @@ async def auth_callback(
     cipher = TokenCipher(settings.fernet_key)
     token = cipher.encrypt(f"{provider}-refresh-token")
     cp = ConnectedCalendarProvider(provider=provider, account_email=account_email, token_encrypted=token, scopes=["freebusy.read"])
-    store.set_user_provider(user_id, cp)
-    store.log("provider_connected", {"provider": provider, "email": account_email, "user_id": user_id})
+    previous = [p.account_email for p in await async_store.get_user_providers(user_id) if p.provider == provider]
+    await async_store.set_user_provider(user_id, cp)
+    await freebusy_cache.forget(provider, account_email, *previous)
+    await plan_availability.refresh_user(user_id, await async_store.get_user_plan_ids(user_id))
+    await audit.log("provider_connected", {"provider": provider, "email": account_email, "user_id": user_id})
     return {"status": "connected", "provider": provider, "user_id": user_id, "account_email": account_email}
 
 
 @router.post("/disconnect/{provider}")
 async def disconnect(provider: str, x_user_id: str | None = Header(default=None)):
     user_id = current_user_id(x_user_id)
-    store.disconnect_user_provider(user_id, provider)
-    store.log("provider_disconnected", {"provider": provider, "user_id": user_id})
+    accounts = [p.account_email for p in await async_store.get_user_providers(user_id) if p.provider == provider]
+    await async_store.disconnect_user_provider(user_id, provider)
+    await freebusy_cache.forget(provider, *accounts)
+    await plan_availability.refresh_user(user_id, await async_store.get_user_plan_ids(user_id))
+    await audit.log("provider_disconnected", {"provider": provider, "user_id": user_id})
     return {"status": "disconnected", "provider": provider}
 
 
@@ -71,140 +164,213 @@ async def me(x_user_id: str | None = Header(default=None)):
     user_id = current_user_id(x_user_id)
     return {
         "user_id": user_id,
-        "connected_accounts": [p.model_dump(exclude={"token_encrypted"}) for p in store.get_user_providers(user_id)],
+        "connected_accounts": [p.model_dump(exclude={"token_encrypted"}) for p in await async_store.get_user_providers(user_id)],
     }
 
 
 @router.get("/preferences")
 async def get_preferences(x_user_id: str | None = Header(default=None)):
     user_id = current_user_id(x_user_id)
-    return store.get_preferences(user_id)
+    return await async_store.get_preferences(user_id)
 
 
 @router.put("/preferences")
 async def put_preferences(payload: SearchRequest, x_user_id: str | None = Header(default=None)):
     user_id = current_user_id(x_user_id)
-    store.set_preferences(user_id, payload.preferences)
+    await async_store.set_preferences(user_id, payload.preferences)
     return payload.preferences
 
 
+async def load_plan(plan_id: str):
+    try:
+        return await async_store.get_plan(plan_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="plan not found")
+
+
+async def plan_participants(plan) -> list[dict]:
+    counts = await async_store.count_user_providers(plan.participant_user_ids)
+    return [{"user_id": pid, "connected_accounts": counts[pid]} for pid in plan.participant_user_ids]
+
+
 @router.post("/plans", response_model=PlanResponse)
 async def create_plan(payload: PlanCreateRequest, x_user_id: str | None = Header(default=None)):
     user_id = current_user_id(x_user_id)
-    plan = store.create_plan(owner_user_id=user_id, name=payload.name)
-    store.log("plan_created", {"plan_id": plan.id, "owner": user_id})
-    return PlanResponse(
-        plan=plan,
-        participants=[{"user_id": user_id, "connected_accounts": len(store.get_user_providers(user_id))}],
-        share_url=f"/plan?joinPlan={plan.id}",
-    )
+    plan = await async_store.create_plan(owner_user_id=user_id, name=payload.name)
+    await audit.log("plan_created", {"plan_id": plan.id, "owner": user_id})
+    return PlanResponse(plan=plan, participants=await plan_participants(plan), share_url=f"/plan?joinPlan={plan.id}")
 
 
 @router.post("/plans/{plan_id}/join", response_model=PlanResponse)
 async def join_plan(plan_id: str, x_user_id: str | None = Header(default=None)):
     user_id = current_user_id(x_user_id)
-    if not store.plan_exists(plan_id):
+    if not await async_store.plan_exists(plan_id):
         raise HTTPException(status_code=404, detail="plan not found")
-    store.join_plan(plan_id, user_id)
-    plan = store.get_plan(plan_id)
-    store.log("plan_joined", {"plan_id": plan_id, "user_id": user_id})
-    participants = [
-        {"user_id": pid, "connected_accounts": len(store.get_user_providers(pid))}
-        for pid in plan.participant_user_ids
-    ]
-    return PlanResponse(plan=plan, participants=participants, share_url=f"/plan?joinPlan={plan.id}")
+    if await async_store.join_plan(plan_id, user_id):
+        await plan_availability.refresh_participant(plan_id, user_id)
+    plan = await async_store.get_plan(plan_id)
+    await audit.log("plan_joined", {"plan_id": plan_id, "user_id": user_id})
+    return PlanResponse(plan=plan, participants=await plan_participants(plan), share_url=f"/plan?joinPlan={plan.id}")
 
 
 @router.get("/plans/{plan_id}", response_model=PlanResponse)
 async def get_plan(plan_id: str):
-    if not store.plan_exists(plan_id):
-        raise HTTPException(status_code=404, detail="plan not found")
-    plan = store.get_plan(plan_id)
-    participants = [
-        {"user_id": pid, "connected_accounts": len(store.get_user_providers(pid))}
-        for pid in plan.participant_user_ids
-    ]
-    return PlanResponse(plan=plan, participants=participants, share_url=f"/plan?joinPlan={plan.id}")
+    plan = await load_plan(plan_id)
+    return PlanResponse(plan=plan, participants=await plan_participants(plan), share_url=f"/plan?joinPlan={plan.id}")
 
 
 @router.get("/plans/{plan_id}/readiness")
 async def plan_readiness(plan_id: str):
-    if not store.plan_exists(plan_id):
-        raise HTTPException(status_code=404, detail="plan not found")
-    plan = store.get_plan(plan_id)
-    participants = []
-    all_ready = True
-    for pid in plan.participant_user_ids:
-        connected = len(store.get_user_providers(pid))
-        ready = connected > 0
-        all_ready = all_ready and ready
-        participants.append({"user_id": pid, "connected_accounts": connected, "ready": ready})
-    return {"plan_id": plan_id, "all_ready": all_ready, "participants": participants}
+    plan = await load_plan(plan_id)
+    participants = [
+        {**p, "ready": p["connected_accounts"] > 0}
+        for p in await plan_participants(plan)
+    ]
+    all_ready = all(p["ready"] for p in participants)
+    response = {"plan_id": plan_id, "all_ready": all_ready, "participants": participants}
+    if all_ready:
+        bitmap = await plan_availability.get(plan_id, plan.participant_user_ids)
+        response["availability"] = bitmap.summary()
+    return response
 
 
 @router.get("/ready")
 async def ready():
     checks = {
         "fernet_key_configured": bool(settings.fernet_key),
-        "ticket_provider": "seatgeek" if (settings.seargeek_client_id and settings.seargeek_client_secret) else "espn",
+        "ticket_provider": get_ticket_provider().source,
+        "prefetch": prefetcher.status(),
     }
     return {"ok": checks["fernet_key_configured"], "checks": checks}
 
 
+@router.get("/stats")
+async def stats():
+    provider = get_ticket_provider()
+    return {
+        "http_pool": http_pool.stats(),
+        "audit": audit.stats(),
+        "games_cache": games_cache.stats(),
+        "schedule_upstream_fetches": schedule_store.upstream_fetches,
+        "espn": ESPNProvider.stats(),
+        "seatgeek": SeatGeekProvider.stats(),
+        "circuits": provider.stats() if isinstance(provider, AggregateTicketProvider) else {},
+        "tickets_cache": tickets_cache.stats(),
+        "freebusy_cache": freebusy_cache.stats(),
+        "plan_availability": plan_availability.stats(),
+        "inflight": {"games": len(games_flight), "tickets": len(tickets_flight)},
+    }
+
+
 @router.post("/search", response_model=SearchResponse)
 async def search(payload: SearchRequest, x_user_id: str | None = Header(default=None)):
     pref = payload.preferences
     user_id = current_user_id(x_user_id)
     if not rate_limiter.hit(f"search:{user_id}", limit=settings.search_rate_limit_per_minute):
         raise HTTPException(status_code=429, detail="search rate limit exceeded")
-    store.log("search_run", {"team": pref.team_text or pref.team_id, "plan_id": payload.plan_id, "user_id": user_id})
+    try:
+        offset = decode_cursor(payload.cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+    await audit.log("search_run", {"team": pref.team_text or pref.team_id, "plan_id": payload.plan_id, "user_id": user_id})
 
     participant_ids = ["demo-user"]
     if payload.plan_id:
-        if not store.plan_exists(payload.plan_id):
-            raise HTTPException(status_code=404, detail="plan not found")
-        participant_ids = store.get_plan(payload.plan_id).participant_user_ids
+        participant_ids = (await load_plan(payload.plan_id)).participant_user_ids
 
-    calendar = MockCalendarProvider()
-    busy_by_participant: dict[str, list] = {}
+    providers_by_participant = await async_store.get_users_providers(participant_ids)
+    accounts_by_participant: dict[str, list[tuple[str, str]]] = {}
     for pid in participant_ids:
-        accounts = [p.account_email for p in store.get_user_providers(pid)]
+        accounts = [(p.provider, p.account_email) for p in providers_by_participant[pid]]
         if payload.plan_id and not accounts:
             raise HTTPException(status_code=400, detail=f"participant {pid} has no connected calendars")
-        busy_by_participant[pid] = await calendar.get_freebusy(pref.date_start, pref.date_end, accounts or ["demo@example.com"])
+        accounts_by_participant[pid] = accounts or [("mock", "demo@example.com")]
 
     team = pref.team_text or pref.team_id or "Yankees"
     provider = get_ticket_provider()
     games_cache_key = f"games:{team}:{pref.date_start.isoformat()}:{pref.date_end.isoformat()}"
-    games = games_cache.get(games_cache_key)
-    if games is None:
-        games = await provider.list_games(team, pref.date_start, pref.date_end)
-        games_cache.set(games_cache_key, games)
-
-    ranked = []
-    for game in games:
-        available_for_all = all(is_available(game, busy_by_participant[pid], pref) for pid in participant_ids)
-        if not available_for_all:
-            continue
-        min_p = max(0, pref.budget_total * pref.price_tier * 0.25)
-        max_p = pref.budget_total * (0.8 + pref.price_tier)
-        ticket_cache_key = f"ticket:{game.game_id}:{pref.party_size}:{min_p:.2f}:{max_p:.2f}"
-        ticket = tickets_cache.get(ticket_cache_key)
-        if ticket is None:
-            ticket = await provider.search_tickets(game.game_id, pref.party_size, (min_p, max_p))
-            if ticket is not None:
-                tickets_cache.set(ticket_cache_key, ticket)
-        if not ticket:
-            continue
-        if ticket.estimated_total > pref.budget_total:
-            continue
-        distance = 10.0
-        result = score_game(game, ticket, pref, distance)
-        if pref.giveaway_only and not game.giveaway_text:
-            continue
-        if payload.plan_id:
-            result.why_recommended.append(f"All {len(participant_ids)} participants are available")
-        ranked.append(result)
-
-    ranked.sort(key=lambda r: r.score, reverse=True)
-    return SearchResponse(top_three=ranked[:3], ranked=ranked, scoring_weights=WEIGHTS)
+    try:
+        games = await cached_fetch(
+            games_cache,
+            games_flight,
+            games_cache_key,
+            lambda: schedule_store.list_games(provider, team, pref.date_start, pref.date_end),
+            stale_while_revalidate=settings.cache_stale_while_revalidate,
+        )
+    except PartialScheduleError as exc:
+        # Served uncached so the next search retries the failed days.
+        games = exc.games
+
+    filtered_games = [game for game in games if not (pref.giveaway_only and not game.giveaway_text)]
+    bitmap = await plan_availability.get(payload.plan_id, participant_ids) if payload.plan_id else None
+    windows = buffered_windows(filtered_games, pref)
+    if bitmap is not None and bitmap.covers(windows):
+        candidates = [game for game, free in zip(filtered_games, bitmap.available_mask(windows)) if free]
+    else:
+        busy_by_participant = await freebusy_cache.get_participants_freebusy(
+            calendar_providers, pref.date_start, pref.date_end, accounts_by_participant
+        )
+        candidates = available_games(filtered_games, busy_by_participant, pref)
+    try:
+        await asyncio.wait_for(
+            provider.prime_tickets([game.game_id for game in candidates]),
+            timeout=settings.ticket_lookup_timeout_seconds,
+        )
+    except Exception as exc:
+        # Lookups below still run per game; priming only saves upstream calls.
+        logger.warning("ticket priming failed for %s: %r", team, exc)
+    tickets = await bounded_gather(
+        [lambda game=game: lookup_ticket(provider, game, pref) for game in candidates],
+        limit=settings.ticket_lookup_concurrency,
+        timeout_seconds=settings.ticket_lookup_timeout_seconds,
+    )
+
+    priced = [
+        (game, ticket)
+        for game, ticket in zip(candidates, tickets)
+        if ticket and ticket.estimated_total <= pref.budget_total
+    ]
+    scored_games = [game for game, _ in priced]
+    scored_tickets = [ticket for _, ticket in priced]
+    distances = distance_calculator.venue_distances(pref.zip_code, scored_games)
+    scores = score_games(ScoringColumns.from_rows(scored_games, scored_tickets, distances), pref)
+    total = len(priced)
+    page_end = total if payload.limit is None else min(total, offset + payload.limit)
+    order = top_k(scores, max(page_end, 3))
+
+    built: dict[int, SearchResult | SearchResultSummary] = {}
+
+    def build(i: int) -> SearchResult | SearchResultSummary:
+        if i in built:
+            return built[i]
+        game, ticket = scored_games[i], scored_tickets[i]
+        if payload.fields == "summary":
+            result = SearchResultSummary(
+                game_id=game.game_id,
+                opponent=game.opponent,
+                start_time_utc=game.start_time_utc,
+                venue=game.venue,
+                score=scores[i],
+                estimated_total=ticket.estimated_total,
+                deep_link=ticket.deep_link,
+            )
+        else:
+            reasons = explain(game, ticket, pref, distances[i])
+            if payload.plan_id:
+                reasons.append(f"All {len(participant_ids)} participants are available")
+            result = SearchResult(
+                game=Game.model_validate(game),
+                ticket_summary=TicketSummary.model_validate(ticket),
+                score=scores[i],
+                why_recommended=reasons,
+            )
+        built[i] = result
+        return result
+
+    return SearchResponse(
+        top_three=[build(i) for i in order[:3]],
+        ranked=[build(i) for i in order[offset:page_end]],
+        scoring_weights=WEIGHTS,
+        total=total,
+        next_cursor=encode_cursor(page_end, total),
+    )
@@ -14,6 +14,59 @@ class Settings(BaseModel):
     search_rate_limit_per_minute: int = int(os.getenv("SEARCH_RATE_LIMIT_PER_MINUTE", "30"))
     games_cache_ttl_seconds: int = int(os.getenv("GAMES_CACHE_TTL_SECONDS", "900"))
     tickets_cache_ttl_seconds: int = int(os.getenv("TICKETS_CACHE_TTL_SECONDS", "900"))
+    espn_scoreboard_ttl_seconds: int = int(os.getenv("ESPN_SCOREBOARD_TTL_SECONDS", "900"))
+    espn_scoreboard_max_entries: int = int(os.getenv("ESPN_SCOREBOARD_MAX_ENTRIES", "64"))
+    espn_tickets_ttl_seconds: int = int(os.getenv("ESPN_TICKETS_TTL_SECONDS", "21600"))
+    espn_tickets_max_entries: int = int(os.getenv("ESPN_TICKETS_MAX_ENTRIES", "50000"))
+    ticket_providers: str = os.getenv("TICKET_PROVIDERS", "seatgeek,espn")
+    provider_list_timeout_seconds: float = float(os.getenv("PROVIDER_LIST_TIMEOUT_SECONDS", "8"))
+    provider_ticket_budget_seconds: float = float(os.getenv("PROVIDER_TICKET_BUDGET_SECONDS", "2"))
+    provider_failure_threshold: int = int(os.getenv("PROVIDER_FAILURE_THRESHOLD", "3"))
+    provider_reset_seconds: float = float(os.getenv("PROVIDER_RESET_SECONDS", "30"))
+    seatgeek_base_url: str = os.getenv("SEATGEEK_BASE_URL", "https://api.seatgeek.com/2")
+    seatgeek_per_page: int = int(os.getenv("SEATGEEK_PER_PAGE", "100"))
+    seatgeek_max_pages: int = int(os.getenv("SEATGEEK_MAX_PAGES", "10"))
+    seatgeek_concurrency: int = int(os.getenv("SEATGEEK_CONCURRENCY", "4"))
+    seatgeek_stats_ttl_seconds: int = int(os.getenv("SEATGEEK_STATS_TTL_SECONDS", "900"))
+    seatgeek_stats_max_entries: int = int(os.getenv("SEATGEEK_STATS_MAX_ENTRIES", "50000"))
+    freebusy_cache_ttl_seconds: int = int(os.getenv("FREEBUSY_CACHE_TTL_SECONDS", "300"))
+    freebusy_cache_max_entries: int = int(os.getenv("FREEBUSY_CACHE_MAX_ENTRIES", "10000"))
+    calendar_sync_enabled: bool = os.getenv("CALENDAR_SYNC_ENABLED", "true").lower() in {"1", "true", "yes"}
+    calendar_sync_interval_seconds: int = int(os.getenv("CALENDAR_SYNC_INTERVAL_SECONDS", "60"))
+    plan_bitmap_horizon_days: int = int(os.getenv("PLAN_BITMAP_HORIZON_DAYS", "120"))
+    plan_bitmap_slot_minutes: int = int(os.getenv("PLAN_BITMAP_SLOT_MINUTES", "15"))
+    plan_bitmap_ttl_seconds: int = int(os.getenv("PLAN_BITMAP_TTL_SECONDS", "60"))
+    plan_bitmap_max_entries: int = int(os.getenv("PLAN_BITMAP_MAX_ENTRIES", "1000"))
+    plan_bitmap_max_bytes: int = int(os.getenv("PLAN_BITMAP_MAX_BYTES", str(32 * 1024 * 1024)))
+    schedule_freshness_seconds: int = int(os.getenv("SCHEDULE_FRESHNESS_SECONDS", "21600"))
+    prefetch_enabled: bool = os.getenv("PREFETCH_ENABLED", "false").lower() in {"1", "true", "yes"}
+    # 0 follows the default search window (see prefetch.default_horizon_days).
+    prefetch_horizon_days: int = int(os.getenv("PREFETCH_HORIZON_DAYS") or "0")
+    prefetch_interval_seconds: int = int(os.getenv("PREFETCH_INTERVAL_SECONDS", "1800"))
+    prefetch_jitter_seconds: int = int(os.getenv("PREFETCH_JITTER_SECONDS", "30"))
+    prefetch_requests_per_minute: int = int(os.getenv("PREFETCH_REQUESTS_PER_MINUTE", "30"))
+    prefetch_warm_tickets: bool = os.getenv("PREFETCH_WARM_TICKETS", "true").lower() in {"1", "true", "yes"}
+    games_cache_max_entries: int = int(os.getenv("GAMES_CACHE_MAX_ENTRIES", "512"))
+    games_cache_max_bytes: int = int(os.getenv("GAMES_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    tickets_cache_max_entries: int = int(os.getenv("TICKETS_CACHE_MAX_ENTRIES", "20000"))
+    tickets_cache_max_bytes: int = int(os.getenv("TICKETS_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    cache_stale_while_revalidate: bool = os.getenv("CACHE_STALE_WHILE_REVALIDATE", "false").lower() in {"1", "true", "yes"}
+    cache_stale_seconds: int = int(os.getenv("CACHE_STALE_SECONDS", "300"))
+    store_pool_size: int = int(os.getenv("STORE_POOL_SIZE", "8"))
+    store_busy_timeout_ms: int = int(os.getenv("STORE_BUSY_TIMEOUT_MS", "5000"))
+    store_executor_workers: int = int(os.getenv("STORE_EXECUTOR_WORKERS", "8"))
+    store_statement_cache_size: int = int(os.getenv("STORE_STATEMENT_CACHE_SIZE", "256"))
+    audit_mode: str = os.getenv("AUDIT_MODE", "async").lower()
+    audit_batch_size: int = int(os.getenv("AUDIT_BATCH_SIZE", "100"))
+    audit_flush_interval_ms: int = int(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "500"))
+    audit_queue_size: int = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+    ticket_lookup_concurrency: int = int(os.getenv("TICKET_LOOKUP_CONCURRENCY", "8"))
+    ticket_lookup_timeout_seconds: float = float(os.getenv("TICKET_LOOKUP_TIMEOUT_SECONDS", "5"))
+    http_timeout_seconds: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "20"))
+    http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    http_max_keepalive_connections: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    http_keepalive_expiry_seconds: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    http2_enabled: bool = os.getenv("HTTP2_ENABLED", "true").lower() in {"1", "true", "yes"}
 
 
 settings = Settings()
@@ -1,9 +1,34 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import router
+from app.api.routes import get_ticket_provider, lookup_ticket, router
 from app.core.config import settings
+from app.services.http import http_pool
+from app.services.store import async_store, default_preferences, store
+from app.services.audit import audit
+from app.services.prefetch import prefetcher
 
-app = FastAPI(title="Gameday Dadvisor")
+
+async def warm_ticket(provider, game):
+    return await lookup_ticket(provider, game, default_preferences())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await http_pool.start()
+    await audit.start()
+    await prefetcher.start(get_ticket_provider, warm_ticket if settings.prefetch_warm_tickets else None)
+    try:
+        yield
+    finally:
+        await prefetcher.close()
+        await audit.close()
+        await http_pool.close()
+        async_store.close()
+        store.close()
+
+
+app = FastAPI(title="Gameday Dadvisor", lifespan=lifespan)
 
 origins = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
 
@@ -0,0 +1,96 @@
+"""Internal game and ticket records.
+
+Providers, caches, the schedule store and scoring pass these slotted records
+around; the pydantic ``Game``/``TicketSummary`` models in ``schemas`` are only
+built when a search response is serialized. Cached records are shared between
+requests, so they are never mutated in place (use ``dataclasses.replace``).
+"""
+from dataclasses import dataclass
+from datetime import datetime
+import json
+
+
+def _parse_datetime(value: datetime | str) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@dataclass(slots=True)
+class GameRecord:
+    game_id: str
+    league: str
+    team: str
+    opponent: str
+    start_time_utc: datetime
+    end_time_utc: datetime
+    venue: str
+    venue_zip: str
+    lat: float
+    lon: float
+    giveaway_text: str | None = None
+    ticket_url: str | None = None
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "GameRecord":
+        return cls(
+            game_id=str(row["game_id"]),
+            league=row["league"],
+            team=row["team"],
+            opponent=row["opponent"],
+            start_time_utc=_parse_datetime(row["start_time_utc"]),
+            end_time_utc=_parse_datetime(row["end_time_utc"]),
+            venue=row["venue"],
+            venue_zip=str(row["venue_zip"]),
+            lat=float(row["lat"]),
+            lon=float(row["lon"]),
+            giveaway_text=row.get("giveaway_text"),
+            ticket_url=row.get("ticket_url"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "GameRecord":
+        row = json.loads(text)
+        if isinstance(row, dict):
+            # Rows written by the pydantic model before records existed.
+            return cls.from_dict(row)
+        row[4] = datetime.fromisoformat(row[4])
+        row[5] = datetime.fromisoformat(row[5])
+        return cls(*row)
+
+
+@dataclass(slots=True)
+class TicketRecord:
+    game_id: str
+    min_price: float
+    median_price: float
+    availability_count: int
+    estimated_total: float
+    best_value_score: float
+    deep_link: str
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "TicketRecord":
+        return cls(
+            game_id=str(row["game_id"]),
+            min_price=float(row["min_price"]),
+            median_price=float(row["median_price"]),
+            availability_count=int(row["availability_count"]),
+            estimated_total=float(row["estimated_total"]),
+            best_value_score=float(row["best_value_score"]),
+            deep_link=row["deep_link"],
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "TicketRecord":
+        return cls(*json.loads(text))
+
+
+def game_to_json(game) -> str:
+    """Serialize a ``GameRecord`` (or a pydantic ``Game``) as a positional row for the schedule store."""
+    row = [getattr(game, name) for name in GameRecord.__slots__]
+    row[4] = row[4].isoformat()
+    row[5] = row[5].isoformat()
+    return json.dumps(row)
+
+
+def ticket_to_json(ticket: TicketRecord) -> str:
+    return json.dumps([getattr(ticket, name) for name in TicketRecord.__slots__])
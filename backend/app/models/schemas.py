@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal
 
 
@@ -31,6 +31,8 @@ class Preferences(BaseModel):
 
 
 class Game(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     game_id: str
     league: str
     team: str
@@ -46,6 +48,8 @@ class Game(BaseModel):
 
 
 class TicketSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     game_id: str
     min_price: float
     median_price: float
@@ -58,6 +62,9 @@ class TicketSummary(BaseModel):
 class SearchRequest(BaseModel):
     preferences: Preferences
     plan_id: str | None = None
+    limit: int | None = Field(default=None, ge=1, le=500)
+    cursor: str | None = None
+    fields: Literal["full", "summary"] = "full"
 
 
 class SearchResult(BaseModel):
@@ -67,10 +74,22 @@ class SearchResult(BaseModel):
     why_recommended: list[str] = Field(default_factory=list)
 
 
+class SearchResultSummary(BaseModel):
+    game_id: str
+    opponent: str
+    start_time_utc: datetime
+    venue: str
+    score: float
+    estimated_total: float | None = None
+    deep_link: str | None = None
+
+
 class SearchResponse(BaseModel):
-    top_three: list[SearchResult]
-    ranked: list[SearchResult]
+    top_three: list[SearchResult | SearchResultSummary]
+    ranked: list[SearchResult | SearchResultSummary]
     scoring_weights: dict[str, float]
+    total: int | None = None
+    next_cursor: str | None = None
 
 
 class PlanCreateRequest(BaseModel):
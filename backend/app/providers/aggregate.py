@@ -0,0 +1,200 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timezone
+import re
+from typing import Awaitable, Callable, TypeVar
+
+from app.models.records import GameRecord, TicketRecord
+from app.providers.tickets import PartialScheduleError, TicketProvider
+from app.services.cache import TTLCache
+from app.services.circuit import CircuitBreaker
+
+T = TypeVar("T")
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_FILLER = {"", "at", "vs", "v", "the"}
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+def _normalize(text: str | None) -> str:
+    return _NON_ALNUM.sub("", (text or "").lower())
+
+
+def _tokens(text: str | None) -> set[str]:
+    return set(_NON_ALNUM.split((text or "").lower())) - _FILLER
+
+
+def game_key(game: GameRecord) -> str:
+    start: datetime = game.start_time_utc
+    start = start.replace(tzinfo=timezone.utc) if start.tzinfo is None else start.astimezone(timezone.utc)
+    return start.strftime("%Y%m%d%H%M")
+
+
+def same_game(a: GameRecord, b: GameRecord) -> bool:
+    """Whether two listings with the same ``game_key`` are one game.
+
+    Sources name opponents differently (SeatGeek only has a ``short_title`` such
+    as "Red Sox at Yankees", ESPN the full "Boston Red Sox"), so a matching
+    venue or any shared opponent word is enough.
+    """
+    if _normalize(a.venue) == _normalize(b.venue):
+        return True
+    own = _tokens(a.team) | _tokens(b.team)
+    return bool((_tokens(a.opponent) - own) & (_tokens(b.opponent) - own))
+
+
+class AggregateTicketProvider(TicketProvider):
+    def __init__(
+        self,
+        providers: list[TicketProvider],
+        list_timeout_seconds: float = 8,
+        ticket_budget_seconds: float = 2,
+        failure_threshold: int = 3,
+        reset_seconds: float = 30,
+        alias_ttl_seconds: float = 21600,
+        alias_max_entries: int = 50000,
+    ):
+        self.providers = providers
+        self.source = "+".join(p.source for p in providers)
+        self.list_timeout_seconds = list_timeout_seconds
+        self.ticket_budget_seconds = ticket_budget_seconds
+        self.breakers = [CircuitBreaker(failure_threshold, reset_seconds) for _ in providers]
+        # Canonical game id -> {provider index: that provider's id for the same game}.
+        self._aliases: TTLCache[dict[int, str]] = TTLCache(alias_ttl_seconds, max_entries=alias_max_entries)
+
+    def stats(self) -> dict:
+        return {p.source: breaker.stats() for p, breaker in zip(self.providers, self.breakers)}
+
+    def owns_game_id(self, game_id: str) -> bool:
+        return any(p.owns_game_id(game_id) for p in self.providers)
+
+    def supports_team(self, team: str) -> bool:
+        return any(p.supports_team(team) for p in self.providers)
+
+    async def _guarded(self, index: int, call: Callable[[], Awaitable[T]], timeout_seconds: float | None) -> T:
+        breaker = self.breakers[index]
+        if not breaker.allow():
+            raise CircuitOpenError(self.providers[index].source)
+        try:
+            result = await asyncio.wait_for(call(), timeout=timeout_seconds)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return result
+
+    def _owners(self, game_id: str) -> dict[int, str]:
+        aliases = self._aliases.get(game_id)
+        if aliases is not None:
+            return aliases
+        return {i: game_id for i, p in enumerate(self.providers) if p.owns_game_id(game_id)}
+
+    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[GameRecord]:
+        results = await asyncio.gather(
+            *(
+                self._guarded(i, lambda p=p: p.list_games(team, date_start, date_end), self.list_timeout_seconds)
+                for i, p in enumerate(self.providers)
+            ),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if len(errors) == len(results):
+            raise errors[0]
+
+        buckets: dict[str, list[tuple[GameRecord, dict[int, str]]]] = {}
+        merged: list[tuple[GameRecord, dict[int, str]]] = []
+        for index, games in enumerate(results):
+            if isinstance(games, BaseException):
+                continue
+            for game in games:
+                bucket = buckets.setdefault(game_key(game), [])
+                match = next((entry for entry in bucket if index not in entry[1] and same_game(entry[0], game)), None)
+                if match is not None:
+                    match[1][index] = game.game_id
+                else:
+                    entry = (game, {index: game.game_id})
+                    bucket.append(entry)
+                    merged.append(entry)
+        for game, aliases in merged:
+            self._aliases.set(game.game_id, aliases)
+        games = [game for game, _ in merged]
+        if errors:
+            # Callers that persist schedules must not treat this as the full list.
+            failed = ", ".join(p.source for p, r in zip(self.providers, results) if isinstance(r, BaseException))
+            raise PartialScheduleError(f"ticket sources unavailable: {failed}", games)
+        return games
+
+    def _aliases_by_provider(self, game_ids: list[str]) -> dict[int, dict[str, str]]:
+        by_provider: dict[int, dict[str, str]] = {}
+        for game_id in game_ids:
+            for index, alias in self._owners(game_id).items():
+                by_provider.setdefault(index, {})[alias] = game_id
+        return by_provider
+
+    def indexed_tickets(self, game_ids: list[str]) -> dict[str, TicketRecord]:
+        found: dict[str, TicketRecord] = {}
+        for index, aliases in self._aliases_by_provider(game_ids).items():
+            for alias, ticket in self.providers[index].indexed_tickets(list(aliases)).items():
+                found.setdefault(aliases[alias], replace(ticket, game_id=aliases[alias]))
+        return found
+
+    def missing_tickets(self, game_ids: list[str]) -> list[str]:
+        missing: set[str] = set()
+        for index, aliases in self._aliases_by_provider(game_ids).items():
+            missing.update(aliases[alias] for alias in self.providers[index].missing_tickets(list(aliases)))
+        return [game_id for game_id in game_ids if game_id in missing]
+
+    def restore_tickets(self, tickets: dict[str, TicketRecord]):
+        for index, aliases in self._aliases_by_provider(list(tickets)).items():
+            self.providers[index].restore_tickets(
+                {alias: replace(tickets[game_id], game_id=alias) for alias, game_id in aliases.items()}
+            )
+
+    async def prime_tickets(self, game_ids: list[str]):
+        by_provider: dict[int, list[str]] = {}
+        for game_id in game_ids:
+            for index, alias in self._owners(game_id).items():
+                by_provider.setdefault(index, []).append(alias)
+        await asyncio.gather(
+            *(
+                self._guarded(i, lambda i=i, ids=ids: self.providers[i].prime_tickets(ids), self.ticket_budget_seconds)
+                for i, ids in by_provider.items()
+            ),
+            return_exceptions=True,
+        )
+
+    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketRecord | None:
+        tasks = {
+            asyncio.ensure_future(
+                self._guarded(
+                    i,
+                    lambda i=i, alias=alias: self.providers[i].search_tickets(alias, party_size, price_bounds),
+                    None,
+                )
+            ): i
+            for i, alias in self._owners(game_id).items()
+        }
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.ticket_budget_seconds
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=deadline - loop.time(), return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Providers still running past the budget count against their circuit.
+                    for task in pending:
+                        self.breakers[tasks[task]].record_failure()
+                    break
+                tickets = [task.result() for task in done if task.exception() is None]
+                ticket = next((t for t in tickets if t is not None), None)
+                if ticket is not None:
+                    return ticket if ticket.game_id == game_id else replace(ticket, game_id=game_id)
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
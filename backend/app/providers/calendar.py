@@ -1,7 +1,11 @@
-from dataclasses import dataclass
+import asyncio
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import accumulate
 import json
 from pathlib import Path
+import uuid
 
 
 @dataclass
@@ -10,26 +14,104 @@ class BusyInterval:
     end: datetime
 
 
+@dataclass
+class CalendarChanges:
+    upserts: dict[str, BusyInterval] = field(default_factory=dict)
+    deletes: list[str] = field(default_factory=list)
+    next_sync_token: str = ""
+    full: bool = False
+
+
 class CalendarProvider:
     provider_name: str
+    batch_size = 50
+    supports_sync = False
 
     async def get_freebusy(self, time_min: datetime, time_max: datetime, calendars: list[str]) -> list[BusyInterval]:
         raise NotImplementedError
 
+    async def get_freebusy_many(self, time_min: datetime, time_max: datetime, calendars: list[str]) -> dict[str, list[BusyInterval]]:
+        results = await asyncio.gather(*(self.get_freebusy(time_min, time_max, [calendar]) for calendar in calendars))
+        return dict(zip(calendars, results))
+
+    async def get_changes(self, calendar: str, sync_token: str | None) -> CalendarChanges:
+        """Busy events changed since ``sync_token``; a full snapshot when the token is missing or expired."""
+        raise NotImplementedError
+
 
 class MockCalendarProvider(CalendarProvider):
     provider_name = "mock"
+    supports_sync = True
 
     def __init__(self, fixture_path: str = "app/fixtures/freebusy.json"):
         self.fixture_path = fixture_path
-        self._data = json.loads(Path(fixture_path).read_text()) if Path(fixture_path).exists() else {"accounts": {}}
+        data = json.loads(Path(fixture_path).read_text()) if Path(fixture_path).exists() else {"accounts": {}}
+        self._events: dict[str, dict[str, BusyInterval]] = {}
+        # Change log of (sequence, account, event_id). Sync tokens are
+        # "<epoch>.<sequence>" so tokens issued by another instance force a full sync.
+        self._changes: list[tuple[int, str, str]] = []
+        self._sequence = 0
+        self._epoch = uuid.uuid4().hex[:12]
+        self.change_requests = 0
+        # Per account: starts sorted ascending, matching ends, and the running
+        # maximum of ends so the first possibly-overlapping interval is a bisect away.
+        self._accounts: dict[str, tuple[list[datetime], list[datetime], list[datetime]]] = {}
+        for account, items in data.get("accounts", {}).items():
+            self._events[account] = {
+                f"{account}#{i}": BusyInterval(datetime.fromisoformat(item["start"]), datetime.fromisoformat(item["end"]))
+                for i, item in enumerate(items)
+            }
+            self._reindex(account)
+
+    def _reindex(self, account: str):
+        parsed = sorted((i.start, i.end) for i in self._events.get(account, {}).values())
+        starts = [start for start, _ in parsed]
+        ends = [end for _, end in parsed]
+        self._accounts[account] = (starts, ends, list(accumulate(ends, max)))
+
+    def add_busy(self, account: str, start: datetime, end: datetime) -> str:
+        self._sequence += 1
+        event_id = f"{account}#e{self._sequence}"
+        self._events.setdefault(account, {})[event_id] = BusyInterval(start, end)
+        self._changes.append((self._sequence, account, event_id))
+        self._reindex(account)
+        return event_id
+
+    def remove_busy(self, account: str, event_id: str):
+        if self._events.get(account, {}).pop(event_id, None) is None:
+            return
+        self._sequence += 1
+        self._changes.append((self._sequence, account, event_id))
+        self._reindex(account)
 
     async def get_freebusy(self, time_min: datetime, time_max: datetime, calendars: list[str]) -> list[BusyInterval]:
-        intervals: list[BusyInterval] = []
+        by_account = await self.get_freebusy_many(time_min, time_max, calendars)
+        return [interval for account in calendars for interval in by_account[account]]
+
+    async def get_freebusy_many(self, time_min: datetime, time_max: datetime, calendars: list[str]) -> dict[str, list[BusyInterval]]:
+        results: dict[str, list[BusyInterval]] = {}
         for account in calendars:
-            for item in self._data.get("accounts", {}).get(account, []):
-                start = datetime.fromisoformat(item["start"])
-                end = datetime.fromisoformat(item["end"])
-                if start < time_max and end > time_min:
-                    intervals.append(BusyInterval(start=max(start, time_min), end=min(end, time_max)))
-        return intervals
+            intervals = results.setdefault(account, [])
+            if account not in self._accounts:
+                continue
+            starts, ends, max_ends = self._accounts[account]
+            for i in range(bisect_right(max_ends, time_min), bisect_left(starts, time_max)):
+                if ends[i] > time_min:
+                    intervals.append(BusyInterval(start=max(starts[i], time_min), end=min(ends[i], time_max)))
+        return results
+
+    async def get_changes(self, calendar: str, sync_token: str | None) -> CalendarChanges:
+        self.change_requests += 1
+        events = self._events.get(calendar, {})
+        token = f"{self._epoch}.{self._sequence}"
+        epoch, _, sequence = (sync_token or "").partition(".")
+        since = int(sequence) if epoch == self._epoch and sequence.isdigit() else None
+        if since is None or since > self._sequence:
+            return CalendarChanges(upserts=dict(events), next_sync_token=token, full=True)
+        first = bisect_right(self._changes, since, key=lambda change: change[0])
+        changed = dict.fromkeys(event_id for _, account, event_id in self._changes[first:] if account == calendar)
+        return CalendarChanges(
+            upserts={event_id: events[event_id] for event_id in changed if event_id in events},
+            deletes=[event_id for event_id in changed if event_id not in events],
+            next_sync_token=token,
+        )
@@ -1,42 +1,90 @@
+import asyncio
+from dataclasses import replace
 import json
 import re
 from pathlib import Path
-from datetime import datetime, timezone
-import httpx
-from app.models.schemas import Game, TicketSummary
+from datetime import datetime, timedelta, timezone
+from app.core.config import settings
+from app.models.records import GameRecord, TicketRecord
+from app.services.cache import TTLCache
+from app.services.coalesce import SingleFlight, cached_fetch
+from app.services.http import HttpPool, http_pool
+from app.services.jsonstream import iter_array_items
+
+
+class ProviderUnavailableError(RuntimeError):
+    pass
+
+
+class PartialScheduleError(ProviderUnavailableError):
+    """Raised when only some sources answered; ``games`` holds what did arrive."""
+
+    def __init__(self, message: str, games: list[GameRecord]):
+        super().__init__(message)
+        self.games = games
 
 
 class TicketProvider:
-    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[Game]:
+    source = "default"
+
+    def supports_team(self, team: str) -> bool:
+        return True
+
+    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[GameRecord]:
         raise NotImplementedError
 
-    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketSummary | None:
+    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketRecord | None:
         raise NotImplementedError
 
+    async def prime_tickets(self, game_ids: list[str]):
+        return None
+
+    # Providers that learn ticket summaries while listing games expose them so
+    # the schedule store can persist them next to the games and restore them
+    # into a fresh process that serves the schedule without refetching it.
+    def indexed_tickets(self, game_ids: list[str]) -> dict[str, TicketRecord]:
+        return {}
+
+    def missing_tickets(self, game_ids: list[str]) -> list[str]:
+        return []
+
+    def restore_tickets(self, tickets: dict[str, TicketRecord]):
+        return None
+
+    def owns_game_id(self, game_id: str) -> bool:
+        return True
+
 
 class MockProvider(TicketProvider):
+    source = "mock"
+
     def __init__(self, fixture_path: str = "app/fixtures/games.json"):
         self._data = json.loads(Path(fixture_path).read_text())
 
-    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[Game]:
+    def supports_team(self, team: str) -> bool:
+        return any(row["team"].lower() == team.lower() for row in self._data["games"])
+
+    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[GameRecord]:
         games = []
         for row in self._data["games"]:
             if row["team"].lower() == team.lower():
-                g = Game(**row)
+                g = GameRecord.from_dict(row)
                 if date_start <= g.start_time_utc <= date_end:
                     games.append(g)
         return games
 
-    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketSummary | None:
+    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketRecord | None:
         for row in self._data["tickets"]:
             if row["game_id"] == game_id:
-                t = TicketSummary(**row)
+                t = TicketRecord.from_dict(row)
                 if price_bounds[0] <= t.median_price <= price_bounds[1]:
                     return t
         return None
 
 
 class ESPNProvider(TicketProvider):
+    source = "espn"
+
     LEAGUES = {
         "MLB": ("baseball", "mlb"),
         "NFL": ("football", "nfl"),
@@ -67,11 +115,14 @@ class ESPNProvider(TicketProvider):
         "Toronto Maple Leafs": "NHL",
     }
 
-    def __init__(self):
-        self._ticket_cache: dict[str, TicketSummary] = {}
+    def __init__(self, http: HttpPool | None = None):
+        self._http = http or http_pool
+
+    def owns_game_id(self, game_id: str) -> bool:
+        return game_id.startswith("espn-")
 
     @staticmethod
-    def _ticket_from_summary(game_id: str, summary: str, link: str, party_size: int) -> TicketSummary | None:
+    def _ticket_from_summary(game_id: str, summary: str, link: str, party_size: int) -> TicketRecord | None:
         if not summary:
             return None
         match = re.search(r"\$([0-9]+(?:\.[0-9]{1,2})?)", summary)
@@ -79,7 +130,7 @@ class ESPNProvider(TicketProvider):
             return None
         min_price = float(match.group(1))
         median = round(min_price * 1.35, 2)
-        return TicketSummary(
+        return TicketRecord(
             game_id=game_id,
             min_price=min_price,
             median_price=median,
@@ -89,65 +140,111 @@ class ESPNProvider(TicketProvider):
             deep_link=link,
         )
 
-    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[Game]:
+    # Scoreboards and the ticket summaries parsed from them are shared by every
+    # provider instance, so all teams in a league are served from one upstream
+    # fetch per date range and tickets outlive the request that listed the games.
+    _scoreboards: TTLCache[dict[str, list[GameRecord]]] = TTLCache(
+        settings.espn_scoreboard_ttl_seconds, max_entries=settings.espn_scoreboard_max_entries
+    )
+    _scoreboard_flight = SingleFlight()
+    _tickets: TTLCache[TicketRecord] = TTLCache(
+        settings.espn_tickets_ttl_seconds, max_entries=settings.espn_tickets_max_entries
+    )
+    scoreboard_fetches = 0
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {
+            "scoreboard_fetches": cls.scoreboard_fetches,
+            "scoreboards": cls._scoreboards.stats(),
+            "tickets": cls._tickets.stats(),
+        }
+
+    def supports_team(self, team: str) -> bool:
+        return team in self.TEAM_LEAGUE
+
+    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[GameRecord]:
         league = self.TEAM_LEAGUE.get(team)
         if not league:
             return []
 
+        # Scoreboard dates are US local days, so a late game on local day D
+        # starts on D+1 in UTC; pad a day each side and filter in UTC below.
+        first, last = date_start - timedelta(days=1), date_end + timedelta(days=1)
+        dates = f"{first.strftime('%Y%m%d')}-{last.strftime('%Y%m%d')}"
+        scoreboard = await cached_fetch(
+            self._scoreboards,
+            self._scoreboard_flight,
+            f"{league}:{dates}",
+            lambda: self._fetch_scoreboard(league, dates),
+        )
+        if scoreboard is None:
+            raise ProviderUnavailableError(f"ESPN {league} scoreboard for {dates} unavailable")
+        return [g for g in scoreboard.get(team, []) if date_start <= g.start_time_utc <= date_end]
+
+    async def _fetch_scoreboard(self, league: str, dates: str) -> dict[str, list[GameRecord]] | None:
         sport_slug, league_slug = self.LEAGUES[league]
-        dates = f"{date_start.strftime('%Y%m%d')}-{date_end.strftime('%Y%m%d')}"
         url = f"https://site.api.espn.com/apis/site/v2/sports/{sport_slug}/{league_slug}/scoreboard"
-
+        first, last = (datetime.strptime(d, "%Y%m%d").replace(tzinfo=timezone.utc) for d in dates.split("-"))
+        window = (first, last + timedelta(days=1))
+        supported = {team for team, team_league in self.TEAM_LEAGUE.items() if team_league == league}
+        games_by_team: dict[str, list[GameRecord]] = {}
+        type(self).scoreboard_fetches += 1
         try:
-            async with httpx.AsyncClient(timeout=20) as client:
-                resp = await client.get(url, params={"dates": dates, "limit": 1000})
-                resp.raise_for_status()
-                payload = resp.json()
+            async with self._http.session() as client:
+                async with client.stream("GET", url, params={"dates": dates, "limit": 1000}) as resp:
+                    resp.raise_for_status()
+                    async for event in iter_array_items(resp.aiter_bytes(), "events"):
+                        self._index_event(league, supported, window, event, games_by_team)
         except Exception:
-            return []
+            return None
+        return games_by_team
 
-        games: list[Game] = []
-        for event in payload.get("events", []):
-            competitions = event.get("competitions") or []
-            if not competitions:
-                continue
-            comp = competitions[0]
-            competitors = comp.get("competitors") or []
-            team_comp = None
-            opp_comp = None
-            for c in competitors:
-                name = (c.get("team") or {}).get("displayName")
-                if name == team:
-                    team_comp = c
-                else:
-                    opp_comp = c
-            if not team_comp or not opp_comp:
-                continue
+    @classmethod
+    def _index_event(
+        cls,
+        league: str,
+        supported: set[str],
+        window: tuple[datetime, datetime],
+        event: dict,
+        games_by_team: dict[str, list[GameRecord]],
+    ):
+        competitions = event.get("competitions") or []
+        if not competitions:
+            return
+        comp = competitions[0]
+        competitors = comp.get("competitors") or []
+        names = [(c.get("team") or {}).get("displayName") for c in competitors]
+        teams = [name for name in names if name in supported]
+        if not teams or len(competitors) < 2:
+            return
 
-            start = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(timezone.utc)
-            if not (date_start <= start <= date_end):
-                continue
+        start = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone(timezone.utc)
+        if not (window[0] <= start < window[1]):
+            return
 
-            venue = (comp.get("venue") or {}).get("fullName") or "Unknown Venue"
-            address = (comp.get("venue") or {}).get("address") or {}
-            lat = float(address.get("latitude") or 0.0)
-            lon = float(address.get("longitude") or 0.0)
-            game_id = f"espn-{event.get('id')}"
+        venue = (comp.get("venue") or {}).get("fullName") or "Unknown Venue"
+        address = (comp.get("venue") or {}).get("address") or {}
+        lat = float(address.get("latitude") or 0.0)
+        lon = float(address.get("longitude") or 0.0)
+        game_id = f"espn-{event.get('id')}"
 
-            tickets = comp.get("tickets") or []
-            if tickets:
-                ticket_summary = tickets[0].get("summary", "")
-                ticket_link = tickets[0].get("links", [{}])[0].get("href", "")
-                prebuilt = self._ticket_from_summary(game_id, ticket_summary, ticket_link, 2)
-                if prebuilt:
-                    self._ticket_cache[game_id] = prebuilt
+        tickets = comp.get("tickets") or []
+        if tickets:
+            ticket_summary = tickets[0].get("summary", "")
+            ticket_link = tickets[0].get("links", [{}])[0].get("href", "")
+            prebuilt = cls._ticket_from_summary(game_id, ticket_summary, ticket_link, 2)
+            if prebuilt:
+                cls._tickets.set(game_id, prebuilt)
 
-            games.append(
-                Game(
+        for team in teams:
+            opponent = next((name for name in names if name != team), None)
+            games_by_team.setdefault(team, []).append(
+                GameRecord(
                     game_id=game_id,
                     league=league,
                     team=team,
-                    opponent=(opp_comp.get("team") or {}).get("displayName") or "Unknown Opponent",
+                    opponent=opponent or "Unknown Opponent",
                     start_time_utc=start,
                     end_time_utc=start,
                     venue=venue,
@@ -158,46 +255,105 @@ class ESPNProvider(TicketProvider):
                     ticket_url=(event.get("links") or [{}])[0].get("href"),
                 )
             )
-        return games
 
-    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketSummary | None:
-        ticket = self._ticket_cache.get(game_id)
-        if not ticket:
+    def indexed_tickets(self, game_ids: list[str]) -> dict[str, TicketRecord]:
+        found = {game_id: self._tickets.get(game_id) for game_id in game_ids}
+        return {game_id: ticket for game_id, ticket in found.items() if ticket is not None}
+
+    def missing_tickets(self, game_ids: list[str]) -> list[str]:
+        return [game_id for game_id in game_ids if self._tickets.get(game_id) is None]
+
+    def restore_tickets(self, tickets: dict[str, TicketRecord]):
+        for game_id, ticket in tickets.items():
+            if self._tickets.get(game_id) is None:
+                self._tickets.set(game_id, ticket)
+
+    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketRecord | None:
+        ticket = self._tickets.get(game_id)
+        if not ticket or not price_bounds[0] <= ticket.median_price <= price_bounds[1]:
             return None
-        adjusted = ticket.model_copy(
-            update={
-                "estimated_total": ticket.median_price * party_size * 1.25,
-            }
-        )
-        if price_bounds[0] <= adjusted.median_price <= price_bounds[1]:
-            return adjusted
-        return None
+        estimated_total = ticket.median_price * party_size * 1.25
+        # The indexed summary is returned as-is when the estimate already
+        # matches the party size; other sizes get their own copy.
+        if estimated_total == ticket.estimated_total:
+            return ticket
+        return replace(ticket, estimated_total=estimated_total)
 
 
 class SeatGeekProvider(TicketProvider):
-    def __init__(self, client_id: str, client_secret: str):
+    source = "seatgeek"
+
+    # Event stats arrive with every list/bulk response; keeping them lets
+    # search_tickets answer without a per-event request.
+    _stats: TTLCache[tuple[dict, str]] = TTLCache(
+        settings.seatgeek_stats_ttl_seconds, max_entries=settings.seatgeek_stats_max_entries
+    )
+    requests = 0
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {"requests": cls.requests, "event_stats": cls._stats.stats()}
+
+    def __init__(self, client_id: str, client_secret: str, http: HttpPool | None = None, base_url: str | None = None):
         self.client_id = client_id
         self.client_secret = client_secret
+        self._http = http or http_pool
+        self.base_url = (base_url or settings.seatgeek_base_url).rstrip("/")
+        self.per_page = settings.seatgeek_per_page
+        self.max_pages = settings.seatgeek_max_pages
+        self.concurrency = settings.seatgeek_concurrency
 
-    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[Game]:
-        async with httpx.AsyncClient(timeout=20) as client:
-            resp = await client.get(
-                "https://api.seatgeek.com/2/events",
-                params={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
+    def owns_game_id(self, game_id: str) -> bool:
+        return game_id.isdigit()
+
+    async def _get(self, client, path: str, params: dict) -> dict:
+        type(self).requests += 1
+        resp = await client.get(
+            f"{self.base_url}{path}",
+            params={"client_id": self.client_id, "client_secret": self.client_secret, **params},
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _get_pages(self, client, params: dict) -> list[dict]:
+        first = await self._get(client, "/events", {**params, "per_page": self.per_page, "page": 1})
+        events = list(first.get("events", []))
+        total = int((first.get("meta") or {}).get("total") or len(events))
+        pages = min(self.max_pages, -(-total // self.per_page))
+        if pages > 1:
+            semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+
+            async def page(number: int) -> dict:
+                async with semaphore:
+                    return await self._get(client, "/events", {**params, "per_page": self.per_page, "page": number})
+
+            for payload in await asyncio.gather(*(page(n) for n in range(2, pages + 1))):
+                events.extend(payload.get("events", []))
+        return events
+
+    def _remember(self, e: dict):
+        if e.get("stats") is not None:
+            self._stats.set(str(e["id"]), (e["stats"], e.get("url") or ""))
+
+    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[GameRecord]:
+        async with self._http.session() as client:
+            events = await self._get_pages(
+                client,
+                {
                     "q": team,
                     "datetime_utc.gte": date_start.isoformat(),
                     "datetime_utc.lte": date_end.isoformat(),
-                    "per_page": 20,
                 },
             )
-            resp.raise_for_status()
-            payload = resp.json()
         games = []
-        for e in payload.get("events", []):
+        seen: set[str] = set()
+        for e in events:
+            if str(e["id"]) in seen:
+                continue
+            seen.add(str(e["id"]))
+            self._remember(e)
             games.append(
-                Game(
+                GameRecord(
                     game_id=str(e["id"]),
                     league=(e.get("type") or "unknown").upper(),
                     team=team,
@@ -206,33 +362,48 @@ class SeatGeekProvider(TicketProvider):
                     end_time_utc=datetime.fromisoformat(e["datetime_utc"].replace("Z", "+00:00")),
                     venue=e.get("venue", {}).get("name", "Unknown Venue"),
                     venue_zip=e.get("venue", {}).get("postal_code", "00000"),
-                    lat=e.get("venue", {}).get("location", {}).get("lat", 0.0),
-                    lon=e.get("venue", {}).get("location", {}).get("lon", 0.0),
+                    lat=float(e.get("venue", {}).get("location", {}).get("lat", 0.0)),
+                    lon=float(e.get("venue", {}).get("location", {}).get("lon", 0.0)),
                     giveaway_text=None,
                     ticket_url=e.get("url"),
                 )
             )
         return games
 
-    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketSummary | None:
-        async with httpx.AsyncClient(timeout=20) as client:
-            resp = await client.get(
-                f"https://api.seatgeek.com/2/events/{game_id}",
-                params={"client_id": self.client_id, "client_secret": self.client_secret},
-            )
-            resp.raise_for_status()
-            e = resp.json()
-        stats = e.get("stats", {})
+    async def prime_tickets(self, game_ids: list[str]):
+        missing = [game_id for game_id in dict.fromkeys(game_ids) if self._stats.get(game_id) is None]
+        if not missing:
+            return
+        batches = [missing[i : i + self.per_page] for i in range(0, len(missing), self.per_page)]
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+        async with self._http.session() as client:
+
+            async def fetch(batch: list[str]) -> dict:
+                async with semaphore:
+                    return await self._get(client, "/events", {"id": ",".join(batch), "per_page": len(batch)})
+
+            for payload in await asyncio.gather(*(fetch(batch) for batch in batches)):
+                for e in payload.get("events", []):
+                    self._remember(e)
+
+    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketRecord | None:
+        cached = self._stats.get(game_id)
+        if cached is None:
+            async with self._http.session() as client:
+                e = await self._get(client, f"/events/{game_id}", {})
+            self._remember(e)
+            cached = (e.get("stats", {}), e.get("url") or "")
+        stats, url = cached
         median = float(stats.get("median_price") or stats.get("lowest_price") or 0)
         if median < price_bounds[0] or median > price_bounds[1]:
             return None
         min_p = float(stats.get("lowest_price") or median)
-        return TicketSummary(
+        return TicketRecord(
             game_id=game_id,
             min_price=min_p,
             median_price=median,
             availability_count=int(stats.get("listing_count") or 0),
             estimated_total=median * party_size * 1.25,
             best_value_score=max(0.0, 100 - median),
-            deep_link=e.get("url") or "",
+            deep_link=url,
         )
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timezone
+import logging
+
+from app.core.config import settings
+from app.services.store import AsyncSQLiteStore, async_store
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AuditWriter:
+    def __init__(
+        self,
+        store: AsyncSQLiteStore,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 0.5,
+        max_queue_size: int = 10000,
+        asynchronous: bool = True,
+    ):
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue_size = max_queue_size
+        self.asynchronous = asynchronous
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self.flushed = 0
+        self.batches = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if not self.asynchronous or self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if not self.running:
+            self._queue, self._task = None, None
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._queue, self._task = None, None
+
+    async def log(self, event: str, payload: dict):
+        entry = (event, payload, datetime.now(timezone.utc))
+        if not self.running:
+            await self.store.log_many([entry])
+            return
+        # put() waits while the queue is full, pushing back on request handlers
+        # instead of growing memory without bound.
+        await self._queue.put(entry)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = loop.time() + self.flush_interval_seconds
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list):
+        try:
+            await self.store.log_many(batch)
+        except Exception:
+            logger.exception("failed to write %d audit events", len(batch))
+            return
+        self.flushed += len(batch)
+        self.batches += 1
+
+    def stats(self) -> dict:
+        return {
+            "mode": "async" if self.running else "sync",
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "flushed": self.flushed,
+            "batches": self.batches,
+        }
+
+
+audit = AuditWriter(
+    async_store,
+    batch_size=settings.audit_batch_size,
+    flush_interval_seconds=settings.audit_flush_interval_ms / 1000,
+    max_queue_size=settings.audit_queue_size,
+    asynchronous=settings.audit_mode == "async",
+)
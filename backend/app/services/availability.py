@@ -0,0 +1,84 @@
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from app.models.records import GameRecord
+from app.models.schemas import Preferences
+from app.providers.calendar import BusyInterval
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(0, 0, value)
+
+
+class BusyIndex:
+    def __init__(self, starts: array, ends: array, inverted: list[tuple[int, int]] | None = None):
+        self.starts = starts
+        self.ends = ends
+        self.inverted = inverted or []
+
+    def __len__(self) -> int:
+        return len(self.starts) + len(self.inverted)
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[BusyInterval]) -> "BusyIndex":
+        return cls.from_spans((to_micros(interval.start), to_micros(interval.end)) for interval in intervals)
+
+    @classmethod
+    def from_spans(cls, pairs: Iterable[tuple[int, int]]) -> "BusyIndex":
+        spans = []
+        inverted = []
+        for start, end in pairs:
+            if end < start:
+                inverted.append((start, end))
+            else:
+                spans.append((start, end))
+        spans.sort()
+
+        starts, ends = array("q"), array("q")
+        for start, end in spans:
+            # Only strictly overlapping spans are merged. Touching spans stay
+            # separate so a zero-length window at the seam is still free, which
+            # keeps results identical to scoring.is_available.
+            if ends and start < ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        return cls(starts, ends, inverted)
+
+    @classmethod
+    def union(cls, busy_lists: Iterable[Iterable[BusyInterval]]) -> "BusyIndex":
+        return cls.from_intervals(interval for busy in busy_lists for interval in busy)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        i = bisect_right(self.ends, start)
+        if i < len(self.starts) and self.starts[i] < end:
+            return True
+        return any(start < i_end and end > i_start for i_start, i_end in self.inverted)
+
+    def available_mask(self, windows: Iterable[tuple[int, int]]) -> list[bool]:
+        return [not self.overlaps(start, end) for start, end in windows]
+
+
+def buffered_windows(games: list[GameRecord], pref: Preferences) -> list[tuple[int, int]]:
+    before = pref.buffer_before_mins * 60_000_000
+    after = pref.buffer_after_mins * 60_000_000
+    return [(to_micros(g.start_time_utc) - before, to_micros(g.end_time_utc) + after) for g in games]
+
+
+def available_games(games: list[GameRecord], busy_by_participant: dict[str, list[BusyInterval]], pref: Preferences) -> list[GameRecord]:
+    index = BusyIndex.union(busy_by_participant.values())
+    mask = index.available_mask(buffered_windows(games, pref))
+    return [game for game, free in zip(games, mask) if free]
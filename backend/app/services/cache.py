@@ -1,24 +1,144 @@
-from datetime import datetime, timedelta, timezone
-from typing import Generic, TypeVar
+from collections import OrderedDict, deque
+import sys
+import time
+from typing import Callable, Generic, TypeVar
 
 T = TypeVar("T")
 
 
+def approx_size(value, _seen: set[int] | None = None) -> int:
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(approx_size(k, seen) + approx_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(approx_size(v, seen) for v in value)
+    attrs = getattr(value, "__dict__", None)
+    if attrs is not None:
+        size += approx_size(attrs, seen)
+    for slot in getattr(type(value), "__slots__", ()):
+        if hasattr(value, slot):
+            size += approx_size(getattr(value, slot), seen)
+    return size
+
+
 class TTLCache(Generic[T]):
-    def __init__(self, ttl_seconds: int):
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        stale_seconds: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.ttl_seconds = ttl_seconds
-        self._store: dict[str, tuple[datetime, T]] = {}
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._store: OrderedDict[str, tuple[float, int, T]] = OrderedDict()
+        self._expiry_queue: deque[tuple[float, str]] = deque()
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
 
     def get(self, key: str) -> T | None:
+        entry = self._lookup(key, allow_stale=False)
+        return None if entry is None else entry[0]
+
+    def get_stale(self, key: str) -> tuple[T, bool] | None:
+        return self._lookup(key, allow_stale=True)
+
+    def set(self, key: str, payload: T):
+        now = self._clock()
+        self._sweep(now)
+        if key in self._store:
+            self._remove(key)
+        expiry = now + self.ttl_seconds
+        size = approx_size(payload) if self.max_bytes is not None else 0
+        self._store[key] = (expiry, size, payload)
+        self._expiry_queue.append((expiry, key))
+        self._bytes += size
+        self._evict()
+
+    def pop(self, key: str) -> T | None:
         value = self._store.get(key)
-        if not value:
+        if value is None:
             return None
-        expiry, payload = value
-        if datetime.now(timezone.utc) > expiry:
-            self._store.pop(key, None)
+        self._remove(key)
+        return value[2]
+
+    def clear(self):
+        self._store.clear()
+        self._expiry_queue.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._store),
+            "approx_bytes": self._bytes if self.max_bytes is not None else None,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _lookup(self, key: str, allow_stale: bool) -> tuple[T, bool] | None:
+        now = self._clock()
+        self._sweep(now)
+        value = self._store.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        expiry, _, payload = value
+        if now >= expiry + self.stale_seconds:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
             return None
-        return payload
+        if now >= expiry:
+            if not allow_stale:
+                self.misses += 1
+                return None
+            self._store.move_to_end(key)
+            self.stale_hits += 1
+            return payload, False
+        self._store.move_to_end(key)
+        self.hits += 1
+        return payload, True
 
-    def set(self, key: str, payload: T):
-        expiry = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
-        self._store[key] = (expiry, payload)
+    def _remove(self, key: str):
+        _, size, _ = self._store.pop(key)
+        self._bytes -= size
+
+    def _sweep(self, now: float):
+        # TTL is constant per cache, so the queue is ordered by expiry and only
+        # its head ever needs checking; entries re-set since are skipped.
+        queue = self._expiry_queue
+        while queue and queue[0][0] + self.stale_seconds <= now:
+            expiry, key = queue.popleft()
+            value = self._store.get(key)
+            if value is not None and value[0] == expiry:
+                self._remove(key)
+                self.expirations += 1
+
+    def _evict(self):
+        while self._store and (
+            (self.max_entries is not None and len(self._store) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._store))
+            self._remove(key)
+            self.evictions += 1
@@ -0,0 +1,45 @@
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.short_circuits = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._clock() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        # While half-open every caller is let through; the first result decides
+        # whether the circuit closes again or re-opens for another period.
+        if self.state == "open":
+            self.short_circuits += 1
+            return False
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+
+    def stats(self) -> dict:
+        return {"state": self.state, "failures": self.failures, "short_circuits": self.short_circuits}
@@ -0,0 +1,62 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from app.services.cache import TTLCache
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def start(self, key: str, fn: Callable[[], Awaitable[T]]) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        # A future left behind by a closed loop (e.g. a finished test client portal)
+        # can never resolve, so it must not capture new callers.
+        if future is not None and future.get_loop() is loop:
+            return future
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return future
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        return await asyncio.shield(self.start(key, fn))
+
+    def _finish(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
+
+
+async def cached_fetch(
+    cache: TTLCache[T],
+    flight: SingleFlight,
+    key: str,
+    fetch: Callable[[], Awaitable[T | None]],
+    stale_while_revalidate: bool = False,
+) -> T | None:
+    async def fill() -> T | None:
+        payload = await fetch()
+        if payload is not None:
+            cache.set(key, payload)
+        return payload
+
+    if stale_while_revalidate:
+        entry = cache.get_stale(key)
+        if entry is not None:
+            payload, fresh = entry
+            if not fresh:
+                flight.start(key, fill)
+            return payload
+    else:
+        payload = cache.get(key)
+        if payload is not None:
+            return payload
+    return await flight.do(key, fill)
@@ -0,0 +1,28 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+async def bounded_gather(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    limit: int,
+    timeout_seconds: float,
+) -> list[T | None]:
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run(call: Callable[[], Awaitable[T]]) -> T | None:
+        # A failed call leaves a gap in the results instead of failing the batch.
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(call(), timeout=timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning("fan-out call timed out after %ss", timeout_seconds)
+            except Exception:
+                logger.exception("fan-out call failed")
+            return None
+
+    return list(await asyncio.gather(*(run(call) for call in calls)))
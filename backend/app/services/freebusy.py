@@ -0,0 +1,190 @@
+import asyncio
+from datetime import datetime
+import itertools
+import logging
+import time
+from typing import Callable
+
+from app.core.config import settings
+from app.providers.calendar import BusyInterval, CalendarProvider
+from app.services.availability import from_micros, to_micros
+from app.services.cache import TTLCache
+from app.services.coalesce import SingleFlight
+from app.services.store import AsyncSQLiteStore, async_store
+
+logger = logging.getLogger(__name__)
+
+
+class FreeBusyCache:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int | None = None,
+        store: AsyncSQLiteStore | None = None,
+        sync_interval_seconds: float = 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._cache: TTLCache[list[BusyInterval]] = TTLCache(ttl_seconds, max_entries=max_entries)
+        # Bumping an account's generation orphans its cached windows, which then
+        # age out through the LRU instead of being hunted down key by key.
+        # Generations are unique and outlive every window cached under the
+        # previous one (including fetches still in flight when it was bumped),
+        # so they only need keeping for a couple of cache TTLs.
+        self._generations: TTLCache[int] = TTLCache(ttl_seconds * 2)
+        self._next_generation = itertools.count(1)
+        self.store = store
+        self.sync_interval_seconds = sync_interval_seconds
+        self._clock = clock
+        self._sync_flight = SingleFlight()
+        self.upstream_batches = 0
+        self.upstream_syncs = 0
+
+    def _key(self, provider: CalendarProvider, account: str, time_min: datetime, time_max: datetime) -> str:
+        generation = self._generations.get(account) or 0
+        return f"{provider.provider_name}:{account}:{generation}:{time_min.isoformat()}:{time_max.isoformat()}"
+
+    async def get_freebusy_many(
+        self,
+        provider: CalendarProvider,
+        time_min: datetime,
+        time_max: datetime,
+        accounts: list[str],
+    ) -> dict[str, list[BusyInterval]]:
+        keys = {account: self._key(provider, account, time_min, time_max) for account in dict.fromkeys(accounts)}
+        cached = {account: self._cache.get(key) for account, key in keys.items()}
+        missing = [account for account, value in cached.items() if value is None]
+        size = max(provider.batch_size, 1)
+        batches = [missing[i : i + size] for i in range(0, len(missing), size)]
+        self.upstream_batches += len(batches)
+        for fetched in await asyncio.gather(*(provider.get_freebusy_many(time_min, time_max, batch) for batch in batches)):
+            for account, intervals in fetched.items():
+                # A connect/disconnect during the fetch moved the generation on,
+                # so the result is stored under the old key and never served.
+                self._cache.set(keys[account], intervals)
+                cached[account] = intervals
+        return {account: cached[account] or [] for account in keys}
+
+    async def get_freebusy(
+        self,
+        provider: CalendarProvider,
+        time_min: datetime,
+        time_max: datetime,
+        accounts: list[str],
+    ) -> list[BusyInterval]:
+        by_account = await self.get_freebusy_many(provider, time_min, time_max, accounts)
+        return [interval for intervals in by_account.values() for interval in intervals]
+
+    async def _sync_account(self, provider: CalendarProvider, name: str, account: str, sync_token: str | None) -> str:
+        self.upstream_syncs += 1
+        changes = await provider.get_changes(account, sync_token)
+        await self.store.apply_calendar_changes(
+            name,
+            account,
+            [(event_id, to_micros(i.start), to_micros(i.end)) for event_id, i in changes.upserts.items()],
+            changes.deletes,
+            changes.full,
+            changes.next_sync_token,
+            self._clock(),
+        )
+        return changes.next_sync_token
+
+    async def get_synced_freebusy(
+        self,
+        provider: CalendarProvider,
+        time_min: datetime,
+        time_max: datetime,
+        accounts: list[str],
+        name: str | None = None,
+    ) -> dict[str, list[BusyInterval]]:
+        # Searches read the locally synced intervals; upstream is only asked for
+        # deltas, at most once per sync interval per account, whatever the window.
+        # ``name`` is the connection the accounts belong to ("google", ...);
+        # several connections may share one provider implementation.
+        name = name or provider.provider_name
+        accounts = list(dict.fromkeys(accounts))
+        states = await self.store.get_calendar_sync(name, accounts)
+        tokens = {account: token for account, (token, _) in states.items()}
+        now = self._clock()
+        due = [a for a in accounts if a not in states or now - states[a][1] >= self.sync_interval_seconds]
+        results = await asyncio.gather(
+            *(
+                self._sync_flight.do(
+                    f"{name}:{account}",
+                    lambda account=account: self._sync_account(provider, name, account, tokens.get(account)),
+                )
+                for account in due
+            ),
+            return_exceptions=True,
+        )
+        for account, result in zip(due, results):
+            if isinstance(result, BaseException):
+                # Local data may be missing or behind; ask upstream directly.
+                logger.warning("calendar sync failed for %s %s: %r", name, account, result)
+                tokens.pop(account, None)
+            else:
+                tokens[account] = result
+        unsynced = [a for a in accounts if a not in tokens]
+
+        # Decoded windows are cached under the sync token they were read at, so
+        # any applied change makes the next read go back to the table.
+        keys = {a: f"{name}:{self._key(provider, a, time_min, time_max)}:{tokens[a]}" for a in accounts if a in tokens}
+        busy = {a: self._cache.get(key) for a, key in keys.items()}
+        missing = [a for a, value in busy.items() if value is None]
+        if missing:
+            lo, hi = to_micros(time_min), to_micros(time_max)
+            stored = await self.store.get_busy_intervals(name, missing, lo, hi)
+            for account, spans in stored.items():
+                # Clip in integer microseconds; aware datetime comparisons cost more than the conversion.
+                busy[account] = [BusyInterval(start=from_micros(max(s, lo)), end=from_micros(min(e, hi))) for s, e in spans]
+                self._cache.set(keys[account], busy[account])
+        if unsynced:
+            busy.update(await self.get_freebusy_many(provider, time_min, time_max, unsynced))
+        return busy
+
+    async def get_participants_freebusy(
+        self,
+        providers: dict[str, CalendarProvider],
+        time_min: datetime,
+        time_max: datetime,
+        accounts_by_participant: dict[str, list[tuple[str, str]]],
+    ) -> dict[str, list[BusyInterval]]:
+        # One batch stage per calendar provider for the whole plan, run
+        # concurrently, then fanned back out to each participant's accounts.
+        accounts_by_provider: dict[str, list[str]] = {}
+        for accounts in accounts_by_participant.values():
+            for provider_name, account in accounts:
+                accounts_by_provider.setdefault(provider_name, []).append(account)
+        names = list(accounts_by_provider)
+        fetched = await asyncio.gather(
+            *(
+                self.get_synced_freebusy(providers[name], time_min, time_max, accounts_by_provider[name], name)
+                if self.store is not None and providers[name].supports_sync
+                else self.get_freebusy_many(providers[name], time_min, time_max, accounts_by_provider[name])
+                for name in names
+            )
+        )
+        by_provider = dict(zip(names, fetched))
+        return {
+            pid: [interval for provider_name, account in accounts for interval in by_provider[provider_name][account]]
+            for pid, accounts in accounts_by_participant.items()
+        }
+
+    def invalidate(self, *accounts: str):
+        for account in accounts:
+            self._generations.set(account, next(self._next_generation))
+
+    async def forget(self, provider: str, *accounts: str):
+        self.invalidate(*accounts)
+        if self.store is not None and accounts:
+            await self.store.clear_calendar_sync(provider, list(accounts))
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "upstream_batches": self.upstream_batches, "upstream_syncs": self.upstream_syncs}
+
+
+freebusy_cache = FreeBusyCache(
+    settings.freebusy_cache_ttl_seconds,
+    max_entries=settings.freebusy_cache_max_entries,
+    store=async_store if settings.calendar_sync_enabled else None,
+    sync_interval_seconds=settings.calendar_sync_interval_seconds,
+)
@@ -0,0 +1,117 @@
+from array import array
+from bisect import bisect_left
+import csv
+from functools import lru_cache
+import mmap
+from pathlib import Path
+import struct
+import sys
+
+from app.models.records import GameRecord
+from app.services.scoring import haversine_miles
+
+DEFAULT_DISTANCE_MILES = 10.0
+ZIP_INDEX_MAGIC = b"ZIPC"
+DEFAULT_ZIP_INDEX_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "zip_centroids.bin"
+
+# File layout (little-endian): magic, uint32 count, then count sorted uint32 ZIPs,
+# count float32 latitudes and count float32 longitudes.
+_HEADER = struct.Struct("<4sI")
+
+
+def build_zip_index(csv_path: Path, out_path: Path) -> int:
+    rows = []
+    with Path(csv_path).open(newline="") as fh:
+        for row in csv.DictReader(fh):
+            rows.append((int(row["zip"]), float(row["lat"]), float(row["lon"])))
+    rows.sort()
+    zips = array("I", [r[0] for r in rows])
+    lats = array("f", [r[1] for r in rows])
+    lons = array("f", [r[2] for r in rows])
+    if sys.byteorder == "big":
+        for column in (zips, lats, lons):
+            column.byteswap()
+    with Path(out_path).open("wb") as fh:
+        fh.write(_HEADER.pack(ZIP_INDEX_MAGIC, len(rows)))
+        for column in (zips, lats, lons):
+            column.tofile(fh)
+    return len(rows)
+
+
+class ZipIndex:
+    def __init__(self, path: Path = DEFAULT_ZIP_INDEX_PATH):
+        self.path = Path(path)
+        self._mmap: mmap.mmap | None = None
+        self._zips = self._lats = self._lons = ()
+        if self.path.exists() and self.path.stat().st_size >= _HEADER.size:
+            self._open()
+
+    def _open(self):
+        with self.path.open("rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != ZIP_INDEX_MAGIC:
+            raise ValueError(f"{self.path} is not a ZIP centroid index")
+        view = memoryview(self._mmap)
+        offset = _HEADER.size
+        columns = []
+        for fmt in ("I", "f", "f"):
+            column = view[offset : offset + 4 * count].cast(fmt)
+            if sys.byteorder == "big":
+                column = array(fmt, column.tobytes())
+                column.byteswap()
+            columns.append(column)
+            offset += 4 * count
+        self._zips, self._lats, self._lons = columns
+
+    def __len__(self) -> int:
+        return len(self._zips)
+
+    def lookup(self, zip_code: str) -> tuple[float, float] | None:
+        digits = zip_code.strip()[:5]
+        if not digits.isdigit():
+            return None
+        key = int(digits)
+        i = bisect_left(self._zips, key)
+        if i < len(self._zips) and self._zips[i] == key:
+            return float(self._lats[i]), float(self._lons[i])
+        return None
+
+
+class DistanceCalculator:
+    def __init__(self, zip_index: ZipIndex, max_pairs: int = 50_000):
+        self.zip_index = zip_index
+        self._lookup_zip = lru_cache(maxsize=4096)(zip_index.lookup)
+        self._pairs: dict[tuple[str, str, float, float], float] = {}
+        self.max_pairs = max_pairs
+
+    def venue_distances(self, zip_code: str, games: list[GameRecord]) -> list[float]:
+        origin = self._lookup_zip(zip_code)
+        if origin is None:
+            return [DEFAULT_DISTANCE_MILES] * len(games)
+
+        distances: list[float | None] = []
+        missing: dict[tuple[str, str, float, float], list[int]] = {}
+        for i, game in enumerate(games):
+            if not game.lat and not game.lon:
+                distances.append(DEFAULT_DISTANCE_MILES)
+                continue
+            key = (zip_code, game.venue, game.lat, game.lon)
+            cached = self._pairs.get(key)
+            distances.append(cached)
+            if cached is None:
+                missing.setdefault(key, []).append(i)
+
+        if missing:
+            keys = list(missing)
+            computed = [haversine_miles(origin[0], origin[1], k[2], k[3]) for k in keys]
+            if len(self._pairs) + len(keys) > self.max_pairs:
+                self._pairs.clear()
+            for key, miles in zip(keys, computed):
+                self._pairs[key] = miles
+                for i in missing[key]:
+                    distances[i] = miles
+        return distances
+
+
+distance_calculator = DistanceCalculator(ZipIndex())
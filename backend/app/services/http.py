@@ -0,0 +1,84 @@
+from contextlib import asynccontextmanager
+import importlib.util
+from typing import AsyncIterator
+
+import httpx
+
+from app.core.config import settings
+
+
+class HttpPool:
+    def __init__(
+        self,
+        timeout_seconds: float = 20,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 30,
+        http2: bool = True,
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._client: httpx.AsyncClient | None = None
+        self.requests = 0
+        self.connections_opened = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient | None:
+        return self._client
+
+    async def start(self, transport: httpx.AsyncBaseTransport | None = None):
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout_seconds,
+            limits=self.limits,
+            http2=self.http2,
+            transport=transport,
+            event_hooks={"request": [self._on_request]},
+        )
+
+    async def close(self):
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client is not None:
+            yield self._client
+            return
+        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+            yield client
+
+    async def _on_request(self, request: httpx.Request):
+        self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: dict):
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+    def stats(self) -> dict:
+        return {
+            "started": self._client is not None,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": max(0, self.requests - self.connections_opened),
+        }
+
+
+http_pool = HttpPool(
+    timeout_seconds=settings.http_timeout_seconds,
+    max_connections=settings.http_max_connections,
+    max_keepalive_connections=settings.http_max_keepalive_connections,
+    keepalive_expiry_seconds=settings.http_keepalive_expiry_seconds,
+    http2=settings.http2_enabled,
+)
@@ -0,0 +1,93 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.exhausted = False
+
+    async def fill(self) -> bool:
+        if self.exhausted:
+            return False
+        # Drop what has already been consumed so the buffer stays around one
+        # chunk plus the item currently being decoded.
+        if self.pos:
+            self.text, self.pos = self.text[self.pos:], 0
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.exhausted = True
+            self.text += self._utf8.decode(b"", final=True)
+            return False
+        self.text += self._utf8.decode(chunk)
+        return True
+
+    async def peek(self) -> str:
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                raise ValueError("unexpected end of JSON stream")
+
+    async def expect(self, char: str):
+        if await self.peek() != char:
+            raise ValueError(f"expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    async def value(self) -> Any:
+        await self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not await self.fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self.text) and not self.exhausted and not isinstance(value, (dict, list, str)):
+                await self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+async def iter_array_items(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """Yield the items of the top-level ``key`` array of a JSON object one at a time."""
+    buffer = _Buffer(chunks)
+    await buffer.expect("{")
+    if await buffer.peek() == "}":
+        return
+    while True:
+        name = await buffer.value()
+        await buffer.expect(":")
+        if name == key and await buffer.peek() == "[":
+            buffer.pos += 1
+            if await buffer.peek() == "]":
+                buffer.pos += 1
+            else:
+                while True:
+                    yield await buffer.value()
+                    separator = await buffer.peek()
+                    buffer.pos += 1
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError(f"expected ',' or ']' at offset {buffer.pos - 1}")
+        else:
+            await buffer.value()
+        separator = await buffer.peek()
+        buffer.pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"expected ',' or '}}' at offset {buffer.pos - 1}")
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Awaitable, Callable, Iterable
+
+from app.providers.calendar import BusyInterval
+from app.services.availability import BusyIndex, to_micros
+from app.services.cache import TTLCache
+from app.services.coalesce import SingleFlight
+
+BusyLoader = Callable[[list[str], datetime, datetime], Awaitable[dict[str, list[BusyInterval]]]]
+
+
+class PlanBitmap:
+    """Plan-wide busy slots over a fixed horizon, backed by an exact BusyIndex.
+
+    Bit ``i`` is set when any participant is busy at some point inside slot
+    ``i``. A window whose slots are all clear is free; otherwise the exact
+    index decides, so answers always match ``available_games``.
+    """
+
+    def __init__(self, origin: datetime, slot_minutes: int, slots: int):
+        self.origin = origin
+        self.origin_us = to_micros(origin)
+        self.slot_us = slot_minutes * 60_000_000
+        self.slots = slots
+        self.end_us = self.origin_us + self.slot_us * slots
+        self.participants: dict[str, tuple[int, list[tuple[int, int]]]] = {}
+        self.bits = 0
+        self.index = BusyIndex.from_spans([])
+        self.built_at = time.monotonic()
+
+    @property
+    def end(self) -> datetime:
+        return self.origin + timedelta(microseconds=self.end_us - self.origin_us)
+
+    def _participant_bits(self, spans: list[tuple[int, int]]) -> int:
+        bits = 0
+        for start, end in spans:
+            if end < start:
+                # Inverted intervals overlap in ways slots cannot express; mark
+                # everything so every check takes the exact path.
+                return (1 << self.slots) - 1
+            if end < self.origin_us or start >= self.end_us:
+                continue
+            first = max(start - self.origin_us, 0) // self.slot_us
+            last = (min(max(end - 1, start), self.end_us - 1) - self.origin_us) // self.slot_us
+            bits |= ((1 << (last - first + 1)) - 1) << first
+        return bits
+
+    def set_participant(self, user_id: str, busy: list[BusyInterval]):
+        spans = [(to_micros(interval.start), to_micros(interval.end)) for interval in busy]
+        self.participants[user_id] = (self._participant_bits(spans), spans)
+
+    def remove_participant(self, user_id: str):
+        self.participants.pop(user_id, None)
+
+    def rebuild(self):
+        bits = 0
+        for participant_bits, _ in self.participants.values():
+            bits |= participant_bits
+        self.bits = bits
+        self.index = BusyIndex.from_spans(span for _, spans in self.participants.values() for span in spans)
+        self.built_at = time.monotonic()
+
+    def covers(self, windows: Iterable[tuple[int, int]]) -> bool:
+        return all(self.origin_us <= start and end <= self.end_us for start, end in windows)
+
+    def _window_bits(self, start_us: int, end_us: int) -> int:
+        first = (start_us - self.origin_us) // self.slot_us
+        last = (max(end_us - 1, start_us) - self.origin_us) // self.slot_us
+        return (self.bits >> first) & ((1 << (last - first + 1)) - 1)
+
+    def busy_slots(self, start_us: int, end_us: int) -> int:
+        return self._window_bits(start_us, end_us).bit_count()
+
+    def is_free(self, start_us: int, end_us: int) -> bool:
+        if not self._window_bits(start_us, end_us):
+            return True
+        return not self.index.overlaps(start_us, end_us)
+
+    def available_mask(self, windows: Iterable[tuple[int, int]]) -> list[bool]:
+        return [self.is_free(start, end) for start, end in windows]
+
+    def summary(self) -> dict:
+        busy = self.bits.bit_count()
+        return {
+            "horizon_start": self.origin.isoformat(),
+            "horizon_end": self.end.isoformat(),
+            "slot_minutes": self.slot_us // 60_000_000,
+            "participants_indexed": len(self.participants),
+            "free_slots": self.slots - busy,
+            "busy_slots": busy,
+        }
+
+
+class PlanAvailability:
+    def __init__(
+        self,
+        load_busy: BusyLoader,
+        horizon_days: int = 120,
+        slot_minutes: int = 15,
+        ttl_seconds: float = 300,
+        max_plans: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.load_busy = load_busy
+        self.horizon_days = horizon_days
+        self.slot_minutes = slot_minutes
+        self._plans: TTLCache[PlanBitmap] = TTLCache(ttl_seconds, max_entries=max_plans, max_bytes=max_bytes)
+        self._flight = SingleFlight()
+        self.builds = 0
+        self.incremental_updates = 0
+
+    def _origin(self) -> datetime:
+        return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    async def get(self, plan_id: str, participant_ids: list[str]) -> PlanBitmap:
+        bitmap = self._plans.get(plan_id)
+        if bitmap is not None and set(bitmap.participants) == set(participant_ids) and bitmap.origin == self._origin():
+            return bitmap
+        return await self._flight.do(plan_id, lambda: self._build(plan_id, participant_ids))
+
+    async def _build(self, plan_id: str, participant_ids: list[str]) -> PlanBitmap:
+        self.builds += 1
+        origin = self._origin()
+        bitmap = PlanBitmap(origin, self.slot_minutes, self.horizon_days * 24 * 60 // self.slot_minutes)
+        busy = await self.load_busy(participant_ids, origin, bitmap.end)
+        for user_id in participant_ids:
+            bitmap.set_participant(user_id, busy.get(user_id, []))
+        bitmap.rebuild()
+        self._plans.set(plan_id, bitmap)
+        return bitmap
+
+    async def refresh_participant(self, plan_id: str, user_id: str):
+        # Only plans that are already materialized are patched; others are
+        # built on first use.
+        bitmap = self._plans.get(plan_id)
+        if bitmap is None:
+            return
+        self.incremental_updates += 1
+        busy = await self.load_busy([user_id], bitmap.origin, bitmap.end)
+        bitmap.set_participant(user_id, busy.get(user_id, []))
+        bitmap.rebuild()
+
+    async def refresh_user(self, user_id: str, plan_ids: list[str]):
+        for plan_id in plan_ids:
+            await self.refresh_participant(plan_id, user_id)
+
+    def drop(self, plan_id: str):
+        self._plans.pop(plan_id)
+
+    def stats(self) -> dict:
+        return {**self._plans.stats(), "builds": self.builds, "incremental_updates": self.incremental_updates}
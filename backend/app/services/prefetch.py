@@ -0,0 +1,144 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import logging
+import random
+import time
+from typing import Awaitable, Callable
+
+from app.core.config import settings
+from app.models.records import GameRecord
+from app.providers.tickets import ESPNProvider, TicketProvider
+from app.services.schedule import ScheduleStore, schedule_store
+from app.services.store import default_preferences
+
+logger = logging.getLogger(__name__)
+
+TicketWarmer = Callable[[TicketProvider, GameRecord], Awaitable[object]]
+
+
+class UpstreamBudget:
+    def __init__(self, requests_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = max(1, requests_per_minute)
+        self.rate_per_second = self.capacity / 60
+        self._tokens = float(self.capacity)
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
+                self._refill()
+            self._tokens -= 1
+
+
+class SchedulePrefetcher:
+    def __init__(
+        self,
+        schedule: ScheduleStore,
+        teams: list[str],
+        horizon_days: int,
+        interval_seconds: float,
+        jitter_seconds: float,
+        requests_per_minute: int,
+        enabled: bool = True,
+    ):
+        self.schedule = schedule
+        self.teams = teams
+        self.horizon_days = horizon_days
+        self.interval_seconds = interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self.budget = UpstreamBudget(requests_per_minute)
+        self.enabled = enabled
+        self._provider_factory: Callable[[], TicketProvider] | None = None
+        self._warm_ticket: TicketWarmer | None = None
+        self._task: asyncio.Task | None = None
+        self._warmed_at: dict[str, float] = {}
+        self._errors: dict[str, str] = {}
+        self.cycles = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self, provider_factory: Callable[[], TicketProvider], warm_ticket: TicketWarmer | None = None):
+        self._provider_factory = provider_factory
+        self._warm_ticket = warm_ticket
+        if self.enabled and not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        while True:
+            await self.run_once(stagger=True)
+
+    async def run_once(self, stagger: bool = False):
+        spacing = self.interval_seconds / max(len(self.teams), 1)
+        for team in self.teams:
+            try:
+                await self.warm_team(team)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("prefetch failed for %s: %s", team, exc)
+                self._errors[team] = str(exc)
+            if stagger:
+                await asyncio.sleep(spacing + random.uniform(0, self.jitter_seconds))
+        self.cycles += 1
+
+    async def warm_team(self, team: str):
+        provider = self._provider_factory()
+        now = datetime.now(timezone.utc)
+        await self.budget.acquire()
+        games = await self.schedule.list_games(provider, team, now, now + timedelta(days=self.horizon_days), strict=True)
+        if self._warm_ticket is not None:
+            for game in games:
+                await self.budget.acquire()
+                await self._warm_ticket(provider, game)
+        self._warmed_at[team] = time.time()
+        self._errors.pop(team, None)
+
+    def status(self) -> dict:
+        fresh_after = time.time() - 2 * self.interval_seconds
+        warm = [team for team, at in self._warmed_at.items() if at >= fresh_after]
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "teams": len(self.teams),
+            "warm_teams": len(warm),
+            "cycles": self.cycles,
+            "errors": dict(self._errors),
+        }
+
+
+def default_horizon_days() -> int:
+    # A default-preferences search must not reach past the warmed days; the
+    # extra day covers searches made after midnight UTC following a cycle.
+    window = default_preferences()
+    return (window.date_end - window.date_start).days + 1
+
+
+prefetcher = SchedulePrefetcher(
+    schedule_store,
+    teams=list(ESPNProvider.TEAM_LEAGUE),
+    horizon_days=settings.prefetch_horizon_days or default_horizon_days(),
+    interval_seconds=settings.prefetch_interval_seconds,
+    jitter_seconds=settings.prefetch_jitter_seconds,
+    requests_per_minute=settings.prefetch_requests_per_minute,
+    enabled=settings.prefetch_enabled,
+)
@@ -0,0 +1,22 @@
+import heapq
+
+
+def top_k(scores: list[float], k: int) -> list[int]:
+    # (-score, index) keeps equal scores in input order, the same as a stable
+    # sort by score descending.
+    if k >= len(scores):
+        return sorted(range(len(scores)), key=lambda i: -scores[i])
+    return heapq.nsmallest(k, range(len(scores)), key=lambda i: (-scores[i], i))
+
+
+def decode_cursor(cursor: str | None) -> int:
+    if not cursor:
+        return 0
+    offset = int(cursor)
+    if offset < 0:
+        raise ValueError(cursor)
+    return offset
+
+
+def encode_cursor(offset: int, total: int) -> str | None:
+    return str(offset) if offset < total else None
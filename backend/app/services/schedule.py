@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+import time as clock_time
+from typing import Callable
+
+from app.core.config import settings
+from app.models.records import GameRecord
+from app.providers.tickets import PartialScheduleError, TicketProvider
+from app.services.availability import to_micros
+from app.services.store import AsyncSQLiteStore, async_store
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _day_runs(days: list[date]) -> list[tuple[date, date]]:
+    runs: list[tuple[date, date]] = []
+    for day in days:
+        if runs and runs[-1][1] + timedelta(days=1) == day:
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+class ScheduleStore:
+    def __init__(
+        self,
+        store: AsyncSQLiteStore,
+        freshness_seconds: float,
+        clock: Callable[[], float] = clock_time.time,
+    ):
+        self.store = store
+        self.freshness_seconds = freshness_seconds
+        self._clock = clock
+        self.upstream_fetches = 0
+        self.failed_refreshes = 0
+        self._pruned_through: date | None = None
+
+    async def list_games(
+        self,
+        provider: TicketProvider,
+        team: str,
+        date_start: datetime,
+        date_end: datetime,
+        strict: bool = False,
+    ) -> list[GameRecord]:
+        if not provider.supports_team(team):
+            return []
+        date_start, date_end = _as_utc(date_start), _as_utc(date_end)
+        now = self._clock()
+        await self._prune(now)
+        first, last = date_start.date(), date_end.date()
+        days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+        coverage = await self.store.get_schedule_coverage(provider.source, team, [d.isoformat() for d in days])
+        stale = [d for d in days if now - coverage.get(d.isoformat(), float("-inf")) > self.freshness_seconds]
+        partial: list[GameRecord] = []
+        errors: list[Exception] = []
+        if stale:
+            refreshed = await asyncio.gather(*(self._refresh(provider, team, start, end, now) for start, end in _day_runs(stale)))
+            errors = [error for _, error in refreshed if error is not None]
+            if strict and errors:
+                raise errors[0]
+            for games, error in refreshed:
+                if error is not None:
+                    partial.extend(games)
+        stored = await self.store.get_scheduled_games(provider.source, team, to_micros(date_start), to_micros(date_end))
+        await self._restore_tickets(provider, team, stored)
+        if not errors:
+            return stored
+        merged = {g.game_id: g for g in stored}
+        merged.update((g.game_id, g) for g in partial if date_start <= _as_utc(g.start_time_utc) <= date_end)
+        games = sorted(merged.values(), key=lambda g: (_as_utc(g.start_time_utc), g.game_id))
+        # Best effort for this request only; callers must not cache it.
+        raise PartialScheduleError(f"schedule for {team} is incomplete: {errors[0]}", games)
+
+    async def _refresh(
+        self, provider: TicketProvider, team: str, first: date, last: date, now: float
+    ) -> tuple[list[GameRecord], Exception | None]:
+        # Only a complete answer replaces the stored days and marks them fresh.
+        # Partial answers are served for this request alone; on failure the
+        # previously stored games keep being served and the days stay stale.
+        start = datetime.combine(first, time.min, tzinfo=timezone.utc)
+        end = datetime.combine(last + timedelta(days=1), time.min, tzinfo=timezone.utc)
+        self.upstream_fetches += 1
+        try:
+            games = await provider.list_games(team, start, end - timedelta(microseconds=1))
+        except PartialScheduleError as exc:
+            self.failed_refreshes += 1
+            logger.warning("partial schedule for %s %s..%s: %s", team, first, last, exc)
+            return exc.games, exc
+        except Exception as exc:
+            self.failed_refreshes += 1
+            logger.warning("schedule refresh failed for %s %s..%s: %s", team, first, last, exc)
+            return [], exc
+        games = [g for g in games if start <= _as_utc(g.start_time_utc) < end]
+        days = [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+        tickets = provider.indexed_tickets([g.game_id for g in games])
+        await self.store.replace_schedule(provider.source, team, days, to_micros(start), to_micros(end), games, now, tickets)
+        return games, None
+
+    async def _restore_tickets(self, provider: TicketProvider, team: str, games: list[GameRecord]):
+        # Games served from the store were listed by another process (or before
+        # a restart); hand the provider the ticket summaries it indexed then.
+        missing = provider.missing_tickets([g.game_id for g in games])
+        if missing:
+            provider.restore_tickets(await self.store.get_scheduled_tickets(provider.source, team, missing))
+
+    async def _prune(self, now: float):
+        today = datetime.fromtimestamp(now, timezone.utc).date()
+        if self._pruned_through == today:
+            return
+        await self.store.prune_schedule(today.isoformat(), to_micros(datetime.combine(today, time.min, tzinfo=timezone.utc)))
+        self._pruned_through = today
+
+
+schedule_store = ScheduleStore(async_store, freshness_seconds=settings.schedule_freshness_seconds)
@@ -1,5 +1,7 @@
+from dataclasses import dataclass
 from datetime import timedelta
-from app.models.schemas import Game, TicketSummary, Preferences, SearchResult
+from app.models.records import GameRecord, TicketRecord
+from app.models.schemas import Preferences, SearchResult
 from app.providers.calendar import BusyInterval
 import math
 
@@ -21,7 +23,7 @@ def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float
     return 2 * r * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
-def is_available(game: Game, busy: list[BusyInterval], pref: Preferences) -> bool:
+def is_available(game: GameRecord, busy: list[BusyInterval], pref: Preferences) -> bool:
     start = game.start_time_utc - timedelta(minutes=pref.buffer_before_mins)
     end = game.end_time_utc + timedelta(minutes=pref.buffer_after_mins)
     for interval in busy:
@@ -30,7 +32,7 @@ def is_available(game: Game, busy: list[BusyInterval], pref: Preferences) -> boo
     return True
 
 
-def score_game(game: Game, ticket: TicketSummary, pref: Preferences, distance_miles: float) -> SearchResult:
+def score_game(game: GameRecord, ticket: TicketRecord, pref: Preferences, distance_miles: float) -> SearchResult:
     reasons = []
     price_score = max(0.0, min(1.0, 1 - (ticket.estimated_total / max(pref.budget_total, 1))))
     if price_score > 0.6:
@@ -68,3 +70,89 @@ def score_game(game: Game, ticket: TicketSummary, pref: Preferences, distance_mi
     )
 
     return SearchResult(game=game, ticket_summary=ticket, score=round(score, 3), why_recommended=reasons)
+
+
+@dataclass
+class ScoringColumns:
+    totals: list[float]
+    weekdays: list[int]
+    hours: list[int]
+    distances: list[float]
+    giveaway_texts: list[str | None]
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    @classmethod
+    def from_rows(cls, games: list[GameRecord], tickets: list[TicketRecord], distances: list[float]) -> "ScoringColumns":
+        return cls(
+            totals=[t.estimated_total for t in tickets],
+            weekdays=[g.start_time_utc.weekday() for g in games],
+            hours=[g.start_time_utc.hour for g in games],
+            distances=list(distances),
+            giveaway_texts=[g.giveaway_text for g in games],
+        )
+
+
+def _giveaway_matches(text: str, keywords: list[str], lowered: list[str]) -> list[str]:
+    text = text.lower()
+    return [k for k, low in zip(keywords, lowered) if low in text]
+
+
+def score_games(columns: ScoringColumns, pref: Preferences) -> list[float]:
+    w_price, w_giveaway, w_day_time = WEIGHTS["price_value"], WEIGHTS["giveaway"], WEIGHTS["day_time"]
+    w_travel, w_availability = WEIGHTS["travel"], WEIGHTS["availability"]
+    budget = max(pref.budget_total, 1)
+    max_miles = max(pref.max_miles, 1)
+    keywords = pref.giveaway_keywords
+    lowered = [k.lower() for k in keywords]
+    keyword_div = max(len(keywords), 1)
+    no_giveaway_score = -1 if pref.giveaway_only else 0.0
+    dows = set(pref.dow_prefs)
+    tods = set(pref.tod_prefs)
+    # Scores for each weekday/hour are the same for every game, so they are
+    # computed once instead of per candidate.
+    dow_scores = [1.0 if (not dows or d in dows) else 0.3 for d in range(7)]
+    tod_scores = [
+        1.0 if (not tods or ("morning" if h < 12 else "afternoon" if h < 17 else "evening") in tods) else 0.3
+        for h in range(24)
+    ]
+
+    scores = []
+    for total, weekday, hour, distance, text in zip(
+        columns.totals, columns.weekdays, columns.hours, columns.distances, columns.giveaway_texts
+    ):
+        price_score = max(0.0, min(1.0, 1 - (total / budget)))
+        if text:
+            if not keywords:
+                giveaway_score = 0.7
+            else:
+                giveaway_score = min(1.0, len(_giveaway_matches(text, keywords, lowered)) / keyword_div)
+        else:
+            giveaway_score = no_giveaway_score
+        day_time_score = (dow_scores[weekday] + tod_scores[hour]) / 2
+        travel_score = max(0.0, 1 - (distance / max_miles))
+        score = (
+            w_price * price_score
+            + w_giveaway * max(giveaway_score, 0)
+            + w_day_time * day_time_score
+            + w_travel * travel_score
+            + w_availability * 1
+        )
+        scores.append(round(score, 3))
+    return scores
+
+
+def explain(game: GameRecord, ticket: TicketRecord, pref: Preferences, distance_miles: float) -> list[str]:
+    reasons = []
+    price_score = max(0.0, min(1.0, 1 - (ticket.estimated_total / max(pref.budget_total, 1))))
+    if price_score > 0.6:
+        reasons.append("Fits your budget comfortably")
+    if game.giveaway_text and pref.giveaway_keywords:
+        lowered = [k.lower() for k in pref.giveaway_keywords]
+        matches = _giveaway_matches(game.giveaway_text, pref.giveaway_keywords, lowered)
+        if matches:
+            reasons.append(f"Matches giveaway keyword(s): {', '.join(matches)}")
+    if distance_miles <= pref.max_miles:
+        reasons.append("Within travel distance preference")
+    return reasons
@@ -1,10 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 import json
 import os
 from pathlib import Path
+import queue
 import sqlite3
+import threading
+from typing import Any, Callable, Iterator
 import uuid
+from app.core.config import settings
+from app.models.records import GameRecord, TicketRecord, game_to_json, ticket_to_json
 from app.models.schemas import Preferences, ConnectedCalendarProvider, Plan
+from app.services.availability import to_micros
 
 
 def default_preferences() -> Preferences:
@@ -12,52 +21,301 @@ def default_preferences() -> Preferences:
     return Preferences(date_start=now, date_end=now + timedelta(days=90))
 
 
+def _provider_from_row(row: sqlite3.Row) -> ConnectedCalendarProvider:
+    return ConnectedCalendarProvider(
+        provider=row["provider"],
+        account_email=row["account_email"],
+        token_encrypted=row["token_encrypted"],
+        scopes=json.loads(row["scopes_json"]),
+        created_at=row["created_at"],
+    )
+
+
+def _migration_1_baseline(conn: sqlite3.Connection):
+    for statement in (
+        """
+        CREATE TABLE IF NOT EXISTS preferences (
+            user_id TEXT PRIMARY KEY,
+            preferences_json TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS providers (
+            user_id TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            provider_json TEXT NOT NULL,
+            PRIMARY KEY (user_id, provider)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS plans (
+            plan_id TEXT PRIMARY KEY,
+            plan_json TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS plan_preferences (
+            plan_id TEXT PRIMARY KEY,
+            preferences_json TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS audit (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event TEXT NOT NULL,
+            payload_json TEXT NOT NULL,
+            ts TEXT NOT NULL
+        )
+        """,
+    ):
+        conn.execute(statement)
+
+
+def _migration_2_normalize_plans_and_providers(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE providers_v2 (
+            user_id TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            account_email TEXT NOT NULL,
+            token_encrypted TEXT NOT NULL,
+            scopes_json TEXT NOT NULL DEFAULT '[]',
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (user_id, provider)
+        )
+        """
+    )
+    for row in conn.execute("SELECT user_id, provider_json FROM providers").fetchall():
+        cp = ConnectedCalendarProvider.model_validate_json(row["provider_json"])
+        conn.execute(
+            "INSERT INTO providers_v2 VALUES (?, ?, ?, ?, ?, ?)",
+            (row["user_id"], cp.provider, cp.account_email, cp.token_encrypted, json.dumps(cp.scopes), cp.created_at.isoformat()),
+        )
+    conn.execute("DROP TABLE providers")
+    conn.execute("ALTER TABLE providers_v2 RENAME TO providers")
+    conn.execute("CREATE INDEX idx_providers_account ON providers(account_email)")
+
+    conn.execute(
+        """
+        CREATE TABLE plans_v2 (
+            plan_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            owner_user_id TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE plan_participants (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            plan_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            joined_at TEXT NOT NULL,
+            UNIQUE (plan_id, user_id)
+        )
+        """
+    )
+    for row in conn.execute("SELECT plan_json FROM plans").fetchall():
+        plan = Plan.model_validate_json(row["plan_json"])
+        conn.execute(
+            "INSERT INTO plans_v2 VALUES (?, ?, ?, ?)",
+            (plan.id, plan.name, plan.owner_user_id, plan.created_at.isoformat()),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO plan_participants(plan_id, user_id, joined_at) VALUES (?, ?, ?)",
+            [(plan.id, user_id, plan.created_at.isoformat()) for user_id in plan.participant_user_ids],
+        )
+    conn.execute("DROP TABLE plans")
+    conn.execute("ALTER TABLE plans_v2 RENAME TO plans")
+    conn.execute("CREATE INDEX idx_plans_owner ON plans(owner_user_id)")
+    conn.execute("CREATE INDEX idx_plan_participants_user ON plan_participants(user_id, plan_id)")
+
+
+def _migration_3_schedule_cache(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE games (
+            source TEXT NOT NULL,
+            team TEXT NOT NULL,
+            game_id TEXT NOT NULL,
+            league TEXT NOT NULL,
+            start_us INTEGER NOT NULL,
+            game_json TEXT NOT NULL,
+            PRIMARY KEY (source, team, game_id)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX idx_games_team_start ON games(source, team, start_us)")
+    conn.execute(
+        """
+        CREATE TABLE schedule_coverage (
+            source TEXT NOT NULL,
+            team TEXT NOT NULL,
+            day TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (source, team, day)
+        ) WITHOUT ROWID
+        """
+    )
+
+
+def _migration_4_calendar_sync(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE busy_intervals (
+            account TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            start_us INTEGER NOT NULL,
+            end_us INTEGER NOT NULL,
+            PRIMARY KEY (account, event_id)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("CREATE INDEX idx_busy_intervals_account_start ON busy_intervals(account, start_us, end_us)")
+    conn.execute(
+        """
+        CREATE TABLE calendar_sync (
+            account TEXT PRIMARY KEY,
+            provider TEXT NOT NULL,
+            sync_token TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        )
+        """
+    )
+
+
+def _migration_5_schedule_tickets(conn: sqlite3.Connection):
+    conn.execute("ALTER TABLE games ADD COLUMN ticket_json TEXT")
+
+
+def _migration_6_calendar_sync_by_provider(conn: sqlite3.Connection):
+    # The same address can be connected through more than one calendar provider.
+    conn.execute(
+        """
+        CREATE TABLE calendar_sync_v2 (
+            provider TEXT NOT NULL,
+            account TEXT NOT NULL,
+            sync_token TEXT NOT NULL,
+            synced_at REAL NOT NULL,
+            PRIMARY KEY (provider, account)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE busy_intervals_v2 (
+            provider TEXT NOT NULL,
+            account TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            start_us INTEGER NOT NULL,
+            end_us INTEGER NOT NULL,
+            PRIMARY KEY (provider, account, event_id)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("INSERT INTO calendar_sync_v2 SELECT provider, account, sync_token, synced_at FROM calendar_sync")
+    conn.execute(
+        """
+        INSERT INTO busy_intervals_v2
+        SELECT s.provider, b.account, b.event_id, b.start_us, b.end_us
+        FROM busy_intervals b JOIN calendar_sync s ON s.account = b.account
+        """
+    )
+    conn.execute("DROP TABLE busy_intervals")
+    conn.execute("DROP TABLE calendar_sync")
+    conn.execute("ALTER TABLE busy_intervals_v2 RENAME TO busy_intervals")
+    conn.execute("ALTER TABLE calendar_sync_v2 RENAME TO calendar_sync")
+    conn.execute("CREATE INDEX idx_busy_intervals_account_start ON busy_intervals(provider, account, start_us, end_us)")
+
+
+MIGRATIONS: list[tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _migration_1_baseline),
+    (2, _migration_2_normalize_plans_and_providers),
+    (3, _migration_3_schedule_cache),
+    (4, _migration_4_calendar_sync),
+    (5, _migration_5_schedule_tickets),
+    (6, _migration_6_calendar_sync_by_provider),
+]
+
+
 class SQLiteStore:
-    def __init__(self, db_path: str | None = None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        pool_size: int | None = None,
+        busy_timeout_ms: int | None = None,
+        statement_cache_size: int | None = None,
+    ):
         default_path = Path(__file__).resolve().parents[2] / "data" / "gameday.db"
         self.db_path = Path(db_path or os.getenv("STORE_DB_PATH", str(default_path)))
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool_size = max(1, pool_size or settings.store_pool_size)
+        self.busy_timeout_ms = busy_timeout_ms if busy_timeout_ms is not None else settings.store_busy_timeout_ms
+        self.statement_cache_size = statement_cache_size or settings.store_statement_cache_size
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._pool_lock = threading.Lock()
+        self._opened = 0
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=self.statement_cache_size,
+            check_same_thread=False,
+        )
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
         return conn
 
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if self._opened < self.pool_size:
+                self._opened += 1
+                return self._open_connection()
+        return self._pool.get()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._pool_lock:
+                self._opened -= 1
+
     def _init_db(self):
         with self._connect() as conn:
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS preferences (
-                    user_id TEXT PRIMARY KEY,
-                    preferences_json TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS providers (
-                    user_id TEXT NOT NULL,
-                    provider TEXT NOT NULL,
-                    provider_json TEXT NOT NULL,
-                    PRIMARY KEY (user_id, provider)
-                );
-
-                CREATE TABLE IF NOT EXISTS plans (
-                    plan_id TEXT PRIMARY KEY,
-                    plan_json TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS plan_preferences (
-                    plan_id TEXT PRIMARY KEY,
-                    preferences_json TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS audit (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event TEXT NOT NULL,
-                    payload_json TEXT NOT NULL,
-                    ts TEXT NOT NULL
-                );
-                """
-            )
+            # BEGIN IMMEDIATE takes the write lock before reading the version so
+            # concurrently starting workers apply each migration exactly once.
+            conn.execute("BEGIN IMMEDIATE")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for target, migrate in MIGRATIONS:
+                if target > version:
+                    migrate(conn)
+                    conn.execute(f"PRAGMA user_version = {target}")
+
+    @property
+    def schema_version(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
 
     def get_preferences(self, user_id: str) -> Preferences:
         with self._connect() as conn:
@@ -85,22 +343,64 @@ class SQLiteStore:
     def get_user_providers(self, user_id: str) -> list[ConnectedCalendarProvider]:
         with self._connect() as conn:
             rows = conn.execute(
-                "SELECT provider_json FROM providers WHERE user_id = ? ORDER BY provider",
+                """
+                SELECT provider, account_email, token_encrypted, scopes_json, created_at
+                FROM providers WHERE user_id = ? ORDER BY provider
+                """,
                 (user_id,),
             ).fetchall()
-            return [ConnectedCalendarProvider.model_validate_json(r["provider_json"]) for r in rows]
+            return [_provider_from_row(r) for r in rows]
 
     def set_user_provider(self, user_id: str, provider: ConnectedCalendarProvider):
         with self._connect() as conn:
             conn.execute(
                 """
-                INSERT INTO providers(user_id, provider, provider_json)
-                VALUES (?, ?, ?)
-                ON CONFLICT(user_id, provider) DO UPDATE SET provider_json = excluded.provider_json
+                INSERT INTO providers(user_id, provider, account_email, token_encrypted, scopes_json, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, provider) DO UPDATE SET
+                    account_email = excluded.account_email,
+                    token_encrypted = excluded.token_encrypted,
+                    scopes_json = excluded.scopes_json,
+                    created_at = excluded.created_at
                 """,
-                (user_id, provider.provider, provider.model_dump_json()),
+                (
+                    user_id,
+                    provider.provider,
+                    provider.account_email,
+                    provider.token_encrypted,
+                    json.dumps(provider.scopes),
+                    provider.created_at.isoformat(),
+                ),
             )
 
+    def count_user_providers(self, user_ids: list[str]) -> dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT user_id, COUNT(*) AS n FROM providers
+                WHERE user_id IN (SELECT value FROM json_each(?))
+                GROUP BY user_id
+                """,
+                (json.dumps(user_ids),),
+            ).fetchall()
+        counts = {r["user_id"]: r["n"] for r in rows}
+        return {user_id: counts.get(user_id, 0) for user_id in user_ids}
+
+    def get_users_providers(self, user_ids: list[str]) -> dict[str, list[ConnectedCalendarProvider]]:
+        providers: dict[str, list[ConnectedCalendarProvider]] = {user_id: [] for user_id in user_ids}
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT user_id, provider, account_email, token_encrypted, scopes_json, created_at
+                FROM providers WHERE user_id IN (SELECT value FROM json_each(?))
+                ORDER BY user_id, provider
+                """,
+                (json.dumps(user_ids),),
+            ).fetchall()
+        for r in rows:
+            providers[r["user_id"]].append(_provider_from_row(r))
+        return providers
+
     def disconnect_user_provider(self, user_id: str, provider_name: str):
         with self._connect() as conn:
             conn.execute("DELETE FROM providers WHERE user_id = ? AND provider = ?", (user_id, provider_name))
@@ -109,19 +409,30 @@ class SQLiteStore:
         plan_id = str(uuid.uuid4())
         plan = Plan(id=plan_id, name=name, owner_user_id=owner_user_id, participant_user_ids=[owner_user_id])
         with self._connect() as conn:
-            conn.execute("INSERT INTO plans(plan_id, plan_json) VALUES (?, ?)", (plan_id, plan.model_dump_json()))
+            conn.execute(
+                "INSERT INTO plans(plan_id, name, owner_user_id, created_at) VALUES (?, ?, ?, ?)",
+                (plan_id, name, owner_user_id, plan.created_at.isoformat()),
+            )
+            conn.execute(
+                "INSERT INTO plan_participants(plan_id, user_id, joined_at) VALUES (?, ?, ?)",
+                (plan_id, owner_user_id, plan.created_at.isoformat()),
+            )
             conn.execute(
                 "INSERT INTO plan_preferences(plan_id, preferences_json) VALUES (?, ?)",
                 (plan_id, default_preferences().model_dump_json()),
             )
         return plan
 
-    def join_plan(self, plan_id: str, user_id: str):
-        plan = self.get_plan(plan_id)
-        if user_id not in plan.participant_user_ids:
-            plan.participant_user_ids.append(user_id)
-            with self._connect() as conn:
-                conn.execute("UPDATE plans SET plan_json = ? WHERE plan_id = ?", (plan.model_dump_json(), plan_id))
+    def join_plan(self, plan_id: str, user_id: str) -> bool:
+        with self._connect() as conn:
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO plan_participants(plan_id, user_id, joined_at)
+                SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM plans WHERE plan_id = ?)
+                """,
+                (plan_id, user_id, datetime.now(timezone.utc).isoformat(), plan_id),
+            )
+            return cur.rowcount > 0
 
     def plan_exists(self, plan_id: str) -> bool:
         with self._connect() as conn:
@@ -130,11 +441,178 @@ class SQLiteStore:
 
     def get_plan(self, plan_id: str) -> Plan:
         with self._connect() as conn:
-            row = conn.execute("SELECT plan_json FROM plans WHERE plan_id = ?", (plan_id,)).fetchone()
+            row = conn.execute(
+                "SELECT plan_id, name, owner_user_id, created_at FROM plans WHERE plan_id = ?",
+                (plan_id,),
+            ).fetchone()
             if row is None:
                 raise KeyError(plan_id)
-            return Plan.model_validate_json(row["plan_json"])
+            participants = conn.execute(
+                "SELECT user_id FROM plan_participants WHERE plan_id = ? ORDER BY id",
+                (plan_id,),
+            ).fetchall()
+            return Plan(
+                id=row["plan_id"],
+                name=row["name"],
+                owner_user_id=row["owner_user_id"],
+                created_at=row["created_at"],
+                participant_user_ids=[p["user_id"] for p in participants],
+            )
+
+    def get_user_plan_ids(self, user_id: str) -> list[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT plan_id FROM plan_participants WHERE user_id = ? ORDER BY id",
+                (user_id,),
+            ).fetchall()
+            return [r["plan_id"] for r in rows]
 
+    def get_schedule_coverage(self, source: str, team: str, days: list[str]) -> dict[str, float]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT day, fetched_at FROM schedule_coverage
+                WHERE source = ? AND team = ? AND day IN (SELECT value FROM json_each(?))
+                """,
+                (source, team, json.dumps(days)),
+            ).fetchall()
+            return {r["day"]: r["fetched_at"] for r in rows}
+
+    def replace_schedule(
+        self,
+        source: str,
+        team: str,
+        days: list[str],
+        start_us: int,
+        end_us: int,
+        games: list[GameRecord],
+        fetched_at: float,
+        tickets: dict[str, TicketRecord] | None = None,
+    ):
+        tickets = tickets or {}
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM games WHERE source = ? AND team = ? AND start_us >= ? AND start_us < ?",
+                (source, team, start_us, end_us),
+            )
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO games(source, team, game_id, league, start_us, game_json, ticket_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        source,
+                        team,
+                        g.game_id,
+                        g.league,
+                        to_micros(g.start_time_utc),
+                        game_to_json(g),
+                        ticket_to_json(tickets[g.game_id]) if g.game_id in tickets else None,
+                    )
+                    for g in games
+                ],
+            )
+            conn.executemany(
+                """
+                INSERT INTO schedule_coverage(source, team, day, fetched_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(source, team, day) DO UPDATE SET fetched_at = excluded.fetched_at
+                """,
+                [(source, team, day, fetched_at) for day in days],
+            )
+
+    def get_scheduled_tickets(self, source: str, team: str, game_ids: list[str]) -> dict[str, TicketRecord]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT game_id, ticket_json FROM games
+                WHERE source = ? AND team = ? AND ticket_json IS NOT NULL
+                AND game_id IN (SELECT value FROM json_each(?))
+                """,
+                (source, team, json.dumps(game_ids)),
+            ).fetchall()
+            return {r["game_id"]: TicketRecord.from_json(r["ticket_json"]) for r in rows}
+
+    def prune_schedule(self, before_day: str, before_us: int):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM games WHERE start_us < ?", (before_us,))
+            conn.execute("DELETE FROM schedule_coverage WHERE day < ?", (before_day,))
+
+    def get_scheduled_games(self, source: str, team: str, start_us: int, end_us: int) -> list[GameRecord]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT game_json FROM games
+                WHERE source = ? AND team = ? AND start_us >= ? AND start_us <= ?
+                ORDER BY start_us, game_id
+                """,
+                (source, team, start_us, end_us),
+            ).fetchall()
+            return [GameRecord.from_json(r["game_json"]) for r in rows]
+
+    def get_calendar_sync(self, provider: str, accounts: list[str]) -> dict[str, tuple[str, float]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT account, sync_token, synced_at FROM calendar_sync
+                WHERE provider = ? AND account IN (SELECT value FROM json_each(?))
+                """,
+                (provider, json.dumps(accounts)),
+            ).fetchall()
+            return {r["account"]: (r["sync_token"], r["synced_at"]) for r in rows}
+
+    def apply_calendar_changes(
+        self,
+        provider: str,
+        account: str,
+        upserts: list[tuple[str, int, int]],
+        deletes: list[str],
+        full: bool,
+        sync_token: str,
+        synced_at: float,
+    ):
+        with self._connect() as conn:
+            if full:
+                conn.execute("DELETE FROM busy_intervals WHERE provider = ? AND account = ?", (provider, account))
+            conn.executemany(
+                "DELETE FROM busy_intervals WHERE provider = ? AND account = ? AND event_id = ?",
+                [(provider, account, event_id) for event_id in deletes],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO busy_intervals(provider, account, event_id, start_us, end_us) VALUES (?, ?, ?, ?, ?)",
+                [(provider, account, event_id, start_us, end_us) for event_id, start_us, end_us in upserts],
+            )
+            conn.execute(
+                """
+                INSERT INTO calendar_sync(provider, account, sync_token, synced_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(provider, account) DO UPDATE SET
+                    sync_token = excluded.sync_token, synced_at = excluded.synced_at
+                """,
+                (provider, account, sync_token, synced_at),
+            )
+
+    def get_busy_intervals(self, provider: str, accounts: list[str], start_us: int, end_us: int) -> dict[str, list[tuple[int, int]]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT account, start_us, end_us FROM busy_intervals
+                WHERE provider = ? AND account IN (SELECT value FROM json_each(?)) AND start_us < ? AND end_us > ?
+                ORDER BY account, start_us
+                """,
+                (provider, json.dumps(accounts), end_us, start_us),
+            ).fetchall()
+        result: dict[str, list[tuple[int, int]]] = {account: [] for account in accounts}
+        for r in rows:
+            result[r["account"]].append((r["start_us"], r["end_us"]))
+        return result
+
+    def clear_calendar_sync(self, provider: str, accounts: list[str]):
+        with self._connect() as conn:
+            for table in ("busy_intervals", "calendar_sync"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE provider = ? AND account IN (SELECT value FROM json_each(?))",
+                    (provider, json.dumps(accounts)),
+                )
 
     def reset(self):
         with self._connect() as conn:
@@ -142,18 +620,136 @@ class SQLiteStore:
                 """
                 DELETE FROM providers;
                 DELETE FROM preferences;
+                DELETE FROM plan_participants;
                 DELETE FROM plans;
                 DELETE FROM plan_preferences;
                 DELETE FROM audit;
+                DELETE FROM games;
+                DELETE FROM schedule_coverage;
+                DELETE FROM busy_intervals;
+                DELETE FROM calendar_sync;
                 """
             )
 
     def log(self, event: str, payload: dict):
+        self.log_many([(event, payload, datetime.now(timezone.utc))])
+
+    def log_many(self, events: list[tuple[str, dict, datetime]]):
         with self._connect() as conn:
-            conn.execute(
+            conn.executemany(
                 "INSERT INTO audit(event, payload_json, ts) VALUES (?, ?, ?)",
-                (event, json.dumps(payload), datetime.now(timezone.utc).isoformat()),
+                [(event, json.dumps(payload), ts.isoformat()) for event, payload, ts in events],
             )
 
 
+class AsyncSQLiteStore:
+    def __init__(self, store: SQLiteStore, max_workers: int | None = None):
+        self.store = store
+        self.max_workers = max(1, max_workers or store.pool_size)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="store")
+            return self._executor
+
+    async def _run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), lambda: fn(*args, **kwargs))
+
+    def close(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def get_preferences(self, user_id: str) -> Preferences:
+        return await self._run(self.store.get_preferences, user_id)
+
+    async def set_preferences(self, user_id: str, preferences: Preferences):
+        return await self._run(self.store.set_preferences, user_id, preferences)
+
+    async def get_user_providers(self, user_id: str) -> list[ConnectedCalendarProvider]:
+        return await self._run(self.store.get_user_providers, user_id)
+
+    async def set_user_provider(self, user_id: str, provider: ConnectedCalendarProvider):
+        return await self._run(self.store.set_user_provider, user_id, provider)
+
+    async def count_user_providers(self, user_ids: list[str]) -> dict[str, int]:
+        return await self._run(self.store.count_user_providers, user_ids)
+
+    async def get_users_providers(self, user_ids: list[str]) -> dict[str, list[ConnectedCalendarProvider]]:
+        return await self._run(self.store.get_users_providers, user_ids)
+
+    async def disconnect_user_provider(self, user_id: str, provider_name: str):
+        return await self._run(self.store.disconnect_user_provider, user_id, provider_name)
+
+    async def create_plan(self, owner_user_id: str, name: str) -> Plan:
+        return await self._run(self.store.create_plan, owner_user_id=owner_user_id, name=name)
+
+    async def join_plan(self, plan_id: str, user_id: str):
+        return await self._run(self.store.join_plan, plan_id, user_id)
+
+    async def plan_exists(self, plan_id: str) -> bool:
+        return await self._run(self.store.plan_exists, plan_id)
+
+    async def get_plan(self, plan_id: str) -> Plan:
+        return await self._run(self.store.get_plan, plan_id)
+
+    async def get_user_plan_ids(self, user_id: str) -> list[str]:
+        return await self._run(self.store.get_user_plan_ids, user_id)
+
+    async def get_schedule_coverage(self, source: str, team: str, days: list[str]) -> dict[str, float]:
+        return await self._run(self.store.get_schedule_coverage, source, team, days)
+
+    async def replace_schedule(
+        self,
+        source: str,
+        team: str,
+        days: list[str],
+        start_us: int,
+        end_us: int,
+        games: list[GameRecord],
+        fetched_at: float,
+        tickets: dict[str, TicketRecord] | None = None,
+    ):
+        return await self._run(self.store.replace_schedule, source, team, days, start_us, end_us, games, fetched_at, tickets)
+
+    async def get_scheduled_tickets(self, source: str, team: str, game_ids: list[str]) -> dict[str, TicketRecord]:
+        return await self._run(self.store.get_scheduled_tickets, source, team, game_ids)
+
+    async def prune_schedule(self, before_day: str, before_us: int):
+        return await self._run(self.store.prune_schedule, before_day, before_us)
+
+    async def get_scheduled_games(self, source: str, team: str, start_us: int, end_us: int) -> list[GameRecord]:
+        return await self._run(self.store.get_scheduled_games, source, team, start_us, end_us)
+
+    async def get_calendar_sync(self, provider: str, accounts: list[str]) -> dict[str, tuple[str, float]]:
+        return await self._run(self.store.get_calendar_sync, provider, accounts)
+
+    async def apply_calendar_changes(
+        self,
+        provider: str,
+        account: str,
+        upserts: list[tuple[str, int, int]],
+        deletes: list[str],
+        full: bool,
+        sync_token: str,
+        synced_at: float,
+    ):
+        return await self._run(self.store.apply_calendar_changes, provider, account, upserts, deletes, full, sync_token, synced_at)
+
+    async def get_busy_intervals(self, provider: str, accounts: list[str], start_us: int, end_us: int) -> dict[str, list[tuple[int, int]]]:
+        return await self._run(self.store.get_busy_intervals, provider, accounts, start_us, end_us)
+
+    async def clear_calendar_sync(self, provider: str, accounts: list[str]):
+        return await self._run(self.store.clear_calendar_sync, provider, accounts)
+
+    async def log_many(self, events: list[tuple[str, dict, datetime]]):
+        return await self._run(self.store.log_many, events)
+
+
 store = SQLiteStore()
+async_store = AsyncSQLiteStore(store, max_workers=settings.store_executor_workers)
@@ -0,0 +1,62 @@
+"""Availability gate: per-pair scoring.is_available scan vs. the merged BusyIndex.
+
+Run from backend/: python -m benchmarks.bench_availability [--games 1000 --participants 20 --intervals 2000]
+"""
+import argparse
+from datetime import datetime, timedelta, timezone
+import random
+import time
+
+from app.models.schemas import Preferences
+from app.providers.calendar import BusyInterval
+from app.services.availability import available_games
+from app.services.scoring import is_available
+from benchmarks.common import make_games
+
+
+def build_calendars(participants: int, intervals: int, horizon_days: int, rng: random.Random) -> dict[str, list[BusyInterval]]:
+    # Mostly working-hours meetings plus the odd evening commitment, so most
+    # evening games stay available and the per-pair scan cannot short-circuit.
+    base = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    busy = {}
+    for p in range(participants):
+        items = []
+        for _ in range(intervals):
+            day = base + timedelta(days=rng.randrange(0, horizon_days))
+            hour = rng.randrange(13, 21) if rng.random() < 0.995 else rng.randrange(21, 24)
+            start = day + timedelta(hours=hour, minutes=rng.choice([0, 15, 30, 45]))
+            items.append(BusyInterval(start=start, end=start + timedelta(minutes=rng.choice([15, 30, 60]))))
+        busy[f"p{p}"] = items
+    return busy
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--participants", type=int, default=20)
+    parser.add_argument("--intervals", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    horizon_days = args.games + 2
+    games = make_games("Bench Yankees", args.games, start=datetime.now(timezone.utc).replace(hour=23, minute=5) + timedelta(days=1))
+    busy = build_calendars(args.participants, args.intervals, horizon_days, rng)
+    now = datetime.now(timezone.utc)
+    pref = Preferences(date_start=now, date_end=now + timedelta(days=horizon_days))
+
+    started = time.perf_counter()
+    expected = [g for g in games if all(is_available(g, busy[p], pref) for p in busy)]
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = available_games(games, busy, pref)
+    index_seconds = time.perf_counter() - started
+
+    assert [g.game_id for g in actual] == [g.game_id for g in expected]
+    print(f"{args.games} games x {args.participants} participants x {args.intervals} intervals -> {len(actual)} available")
+    print(f"is_available loop  {loop_seconds * 1000:10.1f}ms")
+    print(f"BusyIndex          {index_seconds * 1000:10.1f}ms  ({loop_seconds / index_seconds:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Free/busy per search: full-window fetch vs. locally synced intervals with incremental deltas.
+
+Run from backend/: python -m benchmarks.bench_calendar_sync [--accounts 10 --intervals 3000 --searches 20]
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import random
+import tempfile
+import time
+
+from app.providers.calendar import MockCalendarProvider
+from app.services.freebusy import FreeBusyCache
+from app.services.store import AsyncSQLiteStore, SQLiteStore
+from benchmarks.common import percentiles
+
+
+class CountingMockCalendar(MockCalendarProvider):
+    """Adds per-request latency and counts busy intervals sent over the wire."""
+
+    def __init__(self, fixture_path: str, latency_seconds: float):
+        super().__init__(fixture_path)
+        self.latency_seconds = latency_seconds
+        self.transferred = 0
+        self.requests = 0
+
+    async def get_freebusy_many(self, time_min, time_max, calendars):
+        self.requests += 1
+        await asyncio.sleep(self.latency_seconds)
+        results = await super().get_freebusy_many(time_min, time_max, calendars)
+        self.transferred += sum(len(v) for v in results.values())
+        return results
+
+    async def get_changes(self, calendar, sync_token):
+        self.requests += 1
+        await asyncio.sleep(self.latency_seconds)
+        changes = await super().get_changes(calendar, sync_token)
+        self.transferred += len(changes.upserts) + len(changes.deletes)
+        return changes
+
+
+def write_fixture(path: Path, accounts: int, intervals: int, base: datetime, rng: random.Random) -> list[str]:
+    data = {"accounts": {}}
+    for a in range(accounts):
+        items = []
+        for _ in range(intervals):
+            start = base + timedelta(days=rng.randrange(0, 730), hours=rng.randrange(8, 20))
+            items.append({"start": start.isoformat(), "end": (start + timedelta(minutes=45)).isoformat()})
+        data["accounts"][f"user{a}@example.com"] = items
+    path.write_text(json.dumps(data))
+    return list(data["accounts"])
+
+
+async def run(fixture: str, db: str, accounts: list[str], base: datetime, days: int, args, synced: bool):
+    provider = CountingMockCalendar(fixture, args.latency_ms / 1000)
+    now = [0.0]
+    # Without sync the cache must stay off to keep results fresh; with sync,
+    # freshness is bounded by the sync interval and decoded windows can be reused.
+    cache = FreeBusyCache(
+        ttl_seconds=300 if synced else 0,
+        store=AsyncSQLiteStore(SQLiteStore(db)) if synced else None,
+        sync_interval_seconds=60,
+        clock=lambda: now[0],
+    )
+    rng = random.Random(days)
+    participants = {f"u{i}": [("mock", account)] for i, account in enumerate(accounts)}
+    providers = {"mock": provider}
+    window = (base, base + timedelta(days=days))
+    await cache.get_participants_freebusy(providers, *window, participants)
+    provider.transferred = provider.requests = 0
+    samples = []
+    for _ in range(args.searches):
+        start = base + timedelta(days=rng.randrange(0, days), hours=rng.randrange(8, 20))
+        provider.add_busy(rng.choice(accounts), start, start + timedelta(hours=1))
+        now[0] += args.search_gap_seconds
+        started = time.perf_counter()
+        await cache.get_participants_freebusy(providers, *window, participants)
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples), provider.transferred / args.searches, provider.requests / args.searches
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--intervals", type=int, default=3000)
+    parser.add_argument("--searches", type=int, default=60)
+    parser.add_argument("--latency-ms", type=float, default=40)
+    parser.add_argument("--search-gap-seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    base = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture = str(Path(tmp) / "freebusy.json")
+        accounts = write_fixture(Path(fixture), args.accounts, args.intervals, base, random.Random(3))
+        print(
+            f"{args.accounts} accounts x {args.intervals} busy intervals over 2 years, {args.latency_ms:.0f}ms per upstream request, "
+            f"a search every {args.search_gap_seconds:.0f}s with one new event between searches"
+        )
+        for days in (7, 30, 90, 365):
+            full = asyncio.run(run(fixture, "", accounts, base, days, args, synced=False))
+            synced = asyncio.run(run(fixture, str(Path(tmp) / f"sync{days}.db"), accounts, base, days, args, synced=True))
+            print(
+                f"{days:4d}-day window  full fetch: {full[1]:8.1f} intervals {full[2]:4.1f} req/search p50={full[0]['p50_ms']:7.2f}ms"
+                f"   synced: {synced[1]:5.1f} intervals {synced[2]:4.1f} req/search p50={synced[0]['p50_ms']:7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Load test: concurrent /me and /search requests against a slow-disk store.
+
+Compares calling the store inline on the event loop with the executor-backed
+AsyncSQLiteStore. Run from backend/: python -m benchmarks.bench_concurrent_routes
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import tempfile
+import time
+
+import httpx
+
+from app.api import routes
+from app.core.config import settings
+from app.main import app
+from app.services import audit as audit_module
+from app.services.store import AsyncSQLiteStore
+from benchmarks.common import LatencyTicketProvider, percentiles
+from benchmarks.slow_store import InlineAsyncStore, SlowDiskStore
+
+
+async def run(async_store: AsyncSQLiteStore, requests: int) -> tuple[float, dict[str, float]]:
+    routes.async_store = async_store
+    audit_module.audit.store = async_store
+    provider = LatencyTicketProvider("Bench Mets", games=10, latency_seconds=0)
+    routes.get_ticket_provider = lambda: provider
+    settings.search_rate_limit_per_minute = 10**9
+    now = datetime.now(timezone.utc)
+    body = {
+        "preferences": {
+            "team_text": "Bench Mets",
+            "date_start": now.isoformat(),
+            "date_end": (now + timedelta(days=30)).isoformat(),
+            "budget_total": 300,
+        }
+    }
+
+    samples: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one(i: int):
+            started = time.perf_counter()
+            if i % 2:
+                resp = await client.get("/me", headers={"X-User-Id": f"u{i}"})
+            else:
+                resp = await client.post("/search", json=body, headers={"X-User-Id": f"u{i}"})
+            resp.raise_for_status()
+            samples.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        wall = time.perf_counter() - started
+    async_store.close()
+    return wall, percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--disk-delay-ms", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=settings.store_executor_workers)
+    args = parser.parse_args()
+
+    delay = args.disk_delay_ms / 1000
+    with tempfile.TemporaryDirectory() as tmp:
+        inline = InlineAsyncStore(SlowDiskStore(f"{tmp}/inline.db", delay))
+        executor = AsyncSQLiteStore(SlowDiskStore(f"{tmp}/executor.db", delay, pool_size=args.workers), max_workers=args.workers)
+        for label, candidate in (("inline on event loop", inline), (f"executor x{args.workers}", executor)):
+            wall, pct = asyncio.run(run(candidate, args.requests))
+            print(f"{label:<22} wall={wall * 1000:8.1f}ms  p50={pct['p50_ms']:8.1f}ms  p99={pct['p99_ms']:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
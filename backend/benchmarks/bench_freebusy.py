@@ -0,0 +1,84 @@
+"""Free/busy lookup: per-request fixture parse + linear scan vs. long-lived indexed provider + cache.
+
+Run from backend/: python -m benchmarks.bench_freebusy [--accounts 20 --intervals 5000 --searches 50]
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import random
+import tempfile
+import time
+
+from app.providers.calendar import BusyInterval, MockCalendarProvider
+from app.services.freebusy import FreeBusyCache
+from benchmarks.common import percentiles
+
+
+class LegacyMockCalendarProvider:
+    provider_name = "legacy"
+
+    def __init__(self, fixture_path: str):
+        self._data = json.loads(Path(fixture_path).read_text())
+
+    async def get_freebusy(self, time_min, time_max, calendars):
+        intervals = []
+        for account in calendars:
+            for item in self._data.get("accounts", {}).get(account, []):
+                start = datetime.fromisoformat(item["start"])
+                end = datetime.fromisoformat(item["end"])
+                if start < time_max and end > time_min:
+                    intervals.append(BusyInterval(start=max(start, time_min), end=min(end, time_max)))
+        return intervals
+
+
+def write_fixture(path: Path, accounts: int, intervals: int, rng: random.Random) -> list[str]:
+    base = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    data = {"accounts": {}}
+    for a in range(accounts):
+        items = []
+        for _ in range(intervals):
+            start = base + timedelta(days=rng.randrange(-365, 365), hours=rng.randrange(8, 20))
+            items.append({"start": start.isoformat(), "end": (start + timedelta(minutes=rng.choice([30, 60]))).isoformat()})
+        data["accounts"][f"user{a}@example.com"] = items
+    path.write_text(json.dumps(data))
+    return list(data["accounts"])
+
+
+async def run(fixture: str, accounts: list[str], searches: int, indexed: bool) -> dict[str, float]:
+    now = datetime.now(timezone.utc)
+    window = (now, now + timedelta(days=30))
+    long_lived = MockCalendarProvider(fixture)
+    cache = FreeBusyCache(ttl_seconds=300)
+    samples = []
+    for i in range(searches):
+        members = accounts[i % len(accounts) :] + accounts[: i % len(accounts)]
+        started = time.perf_counter()
+        if indexed:
+            await cache.get_freebusy(long_lived, *window, members[:4])
+        else:
+            await LegacyMockCalendarProvider(fixture).get_freebusy(*window, members[:4])
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--accounts", type=int, default=20)
+    parser.add_argument("--intervals", type=int, default=5000)
+    parser.add_argument("--searches", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture = str(Path(tmp) / "freebusy.json")
+        accounts = write_fixture(Path(fixture), args.accounts, args.intervals, random.Random(5))
+        before = asyncio.run(run(fixture, accounts, args.searches, indexed=False))
+        after = asyncio.run(run(fixture, accounts, args.searches, indexed=True))
+    print(f"{args.accounts} accounts x {args.intervals} intervals, 4 accounts per search, 30-day window")
+    print(f"parse per request  p50={before['p50_ms']:8.2f}ms  p99={before['p99_ms']:8.2f}ms")
+    print(f"indexed + cache    p50={after['p50_ms']:8.2f}ms  p99={after['p99_ms']:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Plan free/busy stage: one upstream call per participant in sequence vs. per-provider batches in parallel.
+
+Run from backend/: python -m benchmarks.bench_participant_freebusy [--participants 6 --latency-ms 80]
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import time
+
+from app.services.freebusy import FreeBusyCache
+from benchmarks.common import LatencyCalendarProvider, percentiles
+
+
+def plan_accounts(participants: int) -> dict[str, list[tuple[str, str]]]:
+    accounts = {}
+    for p in range(participants):
+        linked = [("google", f"p{p}@gmail.example")]
+        if p % 2 == 0:
+            linked.append(("microsoft", f"p{p}@outlook.example"))
+        accounts[f"user-{p}"] = linked
+    return accounts
+
+
+async def run(participants: int, latency: float, iterations: int, batched: bool) -> tuple[dict[str, float], int]:
+    providers = {name: LatencyCalendarProvider(name, latency) for name in ("google", "microsoft")}
+    accounts = plan_accounts(participants)
+    now = datetime.now(timezone.utc)
+    window = (now, now + timedelta(days=30))
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        if batched:
+            await FreeBusyCache(ttl_seconds=0).get_participants_freebusy(providers, *window, accounts)
+        else:
+            for linked in accounts.values():
+                for name, account in linked:
+                    await providers[name].get_freebusy(*window, [account])
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples), sum(p.calls for p in providers.values()) // iterations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--participants", type=int, default=6)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    before, before_calls = asyncio.run(run(args.participants, latency, args.iterations, batched=False))
+    after, after_calls = asyncio.run(run(args.participants, latency, args.iterations, batched=True))
+    print(f"{args.participants} participants (google + some microsoft), {args.latency_ms:.0f}ms per upstream call")
+    print(f"sequential per account  calls={before_calls:3d}  p50={before['p50_ms']:8.1f}ms  p99={before['p99_ms']:8.1f}ms")
+    print(f"batched per provider    calls={after_calls:3d}  p50={after['p50_ms']:8.1f}ms  p99={after['p99_ms']:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
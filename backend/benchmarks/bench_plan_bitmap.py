@@ -0,0 +1,72 @@
+"""Plan availability per search: union BusyIndex rebuilt every search vs. the materialized plan bitmap.
+
+Run from backend/: python -m benchmarks.bench_plan_bitmap [--searches 200 --games 90 --participants 20 --intervals 2000]
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import random
+import time
+
+from app.models.schemas import Preferences
+from app.services.availability import available_games, buffered_windows
+from app.services.plan_availability import PlanAvailability
+from benchmarks.bench_availability import build_calendars
+from benchmarks.common import make_games, percentiles
+
+
+async def run(args):
+    rng = random.Random(42)
+    busy = build_calendars(args.participants, args.intervals, args.horizon_days, rng)
+    participants = list(busy)
+
+    async def load(user_ids, time_min, time_max):
+        return {uid: busy[uid] for uid in user_ids}
+
+    now = datetime.now(timezone.utc)
+    games = make_games("Bench Yankees", args.games, start=now.replace(hour=23, minute=5) + timedelta(days=1))
+    pref = Preferences(date_start=now, date_end=now + timedelta(days=args.games + 2))
+    availability = PlanAvailability(load, horizon_days=args.horizon_days)
+
+    started = time.perf_counter()
+    bitmap = await availability.get("bench", participants[:-1])
+    build_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    await availability.refresh_participant("bench", participants[-1])
+    join_ms = (time.perf_counter() - started) * 1000
+
+    recompute, materialized = [], []
+    for _ in range(args.searches):
+        started = time.perf_counter()
+        expected = available_games(games, await load(participants, pref.date_start, pref.date_end), pref)
+        recompute.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        bitmap = await availability.get("bench", participants)
+        windows = buffered_windows(games, pref)
+        assert bitmap.covers(windows)
+        actual = [game for game, free in zip(games, bitmap.available_mask(windows)) if free]
+        materialized.append(time.perf_counter() - started)
+        assert [g.game_id for g in actual] == [g.game_id for g in expected]
+
+    print(
+        f"{args.searches} searches, {args.games} games x {args.participants} participants x {args.intervals} intervals "
+        f"-> {len(actual)} available; bitmap {args.horizon_days}d, build {build_ms:.1f}ms, join {join_ms:.1f}ms"
+    )
+    for name, samples in (("recompute", recompute), ("bitmap", materialized)):
+        stats = percentiles(samples)
+        print(f"{name:10} p50 {stats['p50_ms']:8.3f}ms  p99 {stats['p99_ms']:8.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--searches", type=int, default=200)
+    parser.add_argument("--games", type=int, default=90)
+    parser.add_argument("--participants", type=int, default=20)
+    parser.add_argument("--intervals", type=int, default=2000)
+    parser.add_argument("--horizon-days", type=int, default=120)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
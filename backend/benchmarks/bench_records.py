@@ -0,0 +1,97 @@
+"""Game/ticket representation: pydantic models vs. slotted records.
+
+Measures retained memory for cached games and the allocations of one search's
+hot path (load the schedule rows, price every game, build scoring columns).
+
+Run from backend/: python -m benchmarks.bench_records [--games 10000 --search-games 500]
+"""
+import argparse
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+import gc
+import time
+import tracemalloc
+
+from app.models.records import GameRecord, TicketRecord, game_to_json
+from app.models.schemas import Game, TicketSummary
+from app.services.scoring import ScoringColumns
+from benchmarks.common import make_games
+
+
+def timed(fn) -> float:
+    # Timings run without tracemalloc, which slows Python-level allocations far
+    # more than pydantic-core's.
+    gc.collect()
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def retained(build) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, len(value)
+
+
+def search_stage(rows: list[str], tickets: dict, load_game, adjust):
+    games = [load_game(row) for row in rows]
+    priced = [adjust(tickets[g.game_id]) for g in games]
+    ScoringColumns.from_rows(games, priced, [5.0] * len(games))
+
+
+def allocations(stage) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    stage()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+    return peak, blocks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--search-games", type=int, default=500)
+    args = parser.parse_args()
+
+    start = datetime.now(timezone.utc).replace(hour=23, minute=5, second=0, microsecond=0) + timedelta(days=1)
+    games = make_games("Bench Yankees", args.games, start=start)
+    # Each representation reads the schedule rows its own code path writes.
+    model_rows = [Game.model_validate(g).model_dump_json() for g in games]
+    rows = [game_to_json(g) for g in games]
+    ticket_rows = [
+        {"game_id": g.game_id, "min_price": 30.0, "median_price": 40.5 + i % 50, "availability_count": 10,
+         "estimated_total": (40.5 + i % 50) * 2.5, "best_value_score": 59.5, "deep_link": f"https://t/{g.game_id}"}
+        for i, g in enumerate(games)
+    ]
+
+    print(f"{args.games} cached games")
+    for name, build in (
+        ("pydantic", lambda: [Game.model_validate_json(row) for row in model_rows]),
+        ("records", lambda: [GameRecord.from_json(row) for row in rows]),
+    ):
+        size, count = retained(build)
+        seconds = min(timed(build) for _ in range(3))
+        print(f"  {name:8} {size / 1024 / 1024:7.2f} MiB  {size / count:6.0f} B/game  load {seconds * 1000:7.1f}ms")
+
+    models = {t["game_id"]: TicketSummary(**t) for t in ticket_rows}
+    records = {t["game_id"]: TicketRecord.from_dict(t) for t in ticket_rows}
+    n = args.search_games
+    print(f"search hot path, {n} games")
+    for name, stage in (
+        ("pydantic", lambda: search_stage(model_rows[:n], models, Game.model_validate_json, lambda t: t.model_copy(update={"estimated_total": t.median_price * 5}))),
+        ("records", lambda: search_stage(rows[:n], records, GameRecord.from_json, lambda t: replace(t, estimated_total=t.median_price * 5))),
+    ):
+        peak, blocks = allocations(stage)
+        seconds = min(timed(stage) for _ in range(5))
+        print(f"  {name:8} peak {peak / 1024:8.1f} KiB  allocated blocks {blocks:6d}  {seconds * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
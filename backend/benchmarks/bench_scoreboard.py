@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import itertools
+import time
+
+import httpx
+
+from app.providers.tickets import ESPNProvider
+from app.services.http import HttpPool
+
+
+def league_payload(league: str, events: int, start: datetime) -> dict:
+    teams = [team for team, team_league in ESPNProvider.TEAM_LEAGUE.items() if team_league == league]
+    teams += [f"{league} Rival {i}" for i in range(25)]
+    pairs = itertools.cycle(itertools.combinations(teams, 2))
+    rows = []
+    for i, (home, away) in zip(range(events), pairs):
+        rows.append(
+            {
+                "id": f"{league}-{i}",
+                "date": (start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%MZ"),
+                "links": [{"href": "https://espn.example/game"}],
+                "competitions": [
+                    {
+                        "competitors": [{"team": {"displayName": home}}, {"team": {"displayName": away}}],
+                        "venue": {"fullName": f"{home} Arena", "address": {"zipCode": "10451", "latitude": 40.8, "longitude": -73.9}},
+                        "tickets": [{"summary": "Tickets as low as $35", "links": [{"href": "https://tickets.example"}]}],
+                    }
+                ],
+            }
+        )
+    return {"events": rows}
+
+
+async def run(shared: bool, events: int, latency: float) -> tuple[float, int]:
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    end = start + timedelta(days=30)
+    payloads = {
+        league: league_payload(league, events, start) for league in ESPNProvider.LEAGUES
+    }
+    slugs = {slug: league for league, (_, slug) in ESPNProvider.LEAGUES.items()}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, json=payloads[slugs[request.url.path.split("/")[-2]]])
+
+    pool = HttpPool()
+    await pool.start(transport=httpx.MockTransport(handler))
+    ESPNProvider._scoreboards.clear()
+    before = ESPNProvider.scoreboard_fetches
+    started = time.perf_counter()
+    for team in ESPNProvider.TEAM_LEAGUE:
+        if not shared:
+            ESPNProvider._scoreboards.clear()
+        await ESPNProvider(http=pool).list_games(team, start, end)
+    elapsed = time.perf_counter() - started
+    await pool.close()
+    ESPNProvider._scoreboards.clear()
+    return elapsed, ESPNProvider.scoreboard_fetches - before
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    per_team, per_team_calls = asyncio.run(run(False, args.events, latency))
+    shared, shared_calls = asyncio.run(run(True, args.events, latency))
+    teams = len(ESPNProvider.TEAM_LEAGUE)
+    print(f"{teams} teams, {args.events} events per league scoreboard, {args.latency_ms:.0f}ms upstream latency")
+    print(f"per-team fetch  upstream={per_team_calls:3d}  total={per_team * 1000:8.1f}ms")
+    print(f"league index    upstream={shared_calls:3d}  total={shared * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+import time
+import tracemalloc
+
+import httpx
+
+from app.providers.tickets import ESPNProvider
+from app.services.http import HttpPool
+
+from benchmarks.bench_scoreboard import league_payload
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, chunk_size: int):
+        self.body = body
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for i in range(0, len(self.body), self.chunk_size):
+            yield self.body[i : i + self.chunk_size]
+
+
+def fatten(payload: dict) -> dict:
+    # Real scoreboard events carry records, leaders, odds and broadcasts that the
+    # provider never reads; pad the synthetic events to a comparable size.
+    for event in payload["events"]:
+        comp = event["competitions"][0]
+        for competitor in comp["competitors"]:
+            competitor["records"] = [{"name": name, "summary": "52-40"} for name in ("overall", "home", "away")]
+            competitor["statistics"] = [{"name": f"stat{i}", "displayValue": f"{i * 1.5:.1f}"} for i in range(25)]
+            competitor["leaders"] = [
+                {"name": f"leader{i}", "leaders": [{"displayValue": "23 HR", "athlete": {"fullName": f"Player {i}", "headshot": "https://a.espncdn.com/i/headshots/mlb/players/full/12345.png"}}]}
+                for i in range(4)
+            ]
+        comp["broadcasts"] = [{"market": "national", "names": ["ESPN", "MLB.TV"]}]
+        comp["odds"] = [{"details": "NYY -150", "overUnder": 8.5, "provider": {"name": "consensus"}}]
+        comp["notes"] = [{"headline": "Regular season game with a fairly long descriptive note attached"}] * 3
+    return payload
+
+
+async def run(body: bytes, start: datetime, end: datetime, streaming: bool, chunk_size: int) -> tuple[float, int, int]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=ChunkedStream(body, chunk_size))
+
+    pool = HttpPool()
+    await pool.start(transport=httpx.MockTransport(handler))
+    ESPNProvider._scoreboards.clear()
+    provider = ESPNProvider(http=pool)
+    tracemalloc.start()
+    started = time.perf_counter()
+    if streaming:
+        games = await provider.list_games("New York Yankees", start, end)
+    else:
+        async with pool.session() as client:
+            resp = await client.get("https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard")
+            payload = resp.json()
+        supported = {team for team, league in ESPNProvider.TEAM_LEAGUE.items() if league == "MLB"}
+        index: dict = {}
+        for event in payload.get("events", []):
+            provider._index_event("MLB", supported, (start, end + timedelta(days=1)), event, index)
+        games = index.get("New York Yankees", [])
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await pool.close()
+    ESPNProvider._scoreboards.clear()
+    return elapsed, peak, len(games)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    end = start + timedelta(days=60)
+    body = json.dumps(fatten(league_payload("MLB", args.events, start))).encode()
+    chunk_size = args.chunk_kb * 1024
+    full = asyncio.run(run(body, start, end, False, chunk_size))
+    streamed = asyncio.run(run(body, start, end, True, chunk_size))
+    print(f"{args.events} events, {len(body) / 1e6:.1f} MB scoreboard, {args.chunk_kb} KB chunks")
+    print(f"resp.json()  parse={full[0] * 1000:7.1f}ms  peak={full[1] / 1e6:7.2f} MB  games={full[2]}")
+    print(f"streaming    parse={streamed[0] * 1000:7.1f}ms  peak={streamed[1] / 1e6:7.2f} MB  games={streamed[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Per-game score_game loop vs. column-oriented score_games batch.
+
+Run from backend/: python -m benchmarks.bench_scoring [--games 5000 --top 20]
+"""
+import argparse
+from datetime import datetime, timedelta, timezone
+import time
+
+from app.models.records import TicketRecord
+from app.models.schemas import Preferences, SearchResult
+from app.services.scoring import ScoringColumns, explain, score_game, score_games
+from benchmarks.common import make_games
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    games = make_games("Bench Yankees", args.games)
+    tickets = [
+        TicketRecord(game_id=g.game_id, min_price=30, median_price=50 + i % 50, availability_count=10, estimated_total=100 + i % 200, best_value_score=1, deep_link="x")
+        for i, g in enumerate(games)
+    ]
+    distances = [float(i % 60) for i in range(args.games)]
+    now = datetime.now(timezone.utc)
+    pref = Preferences(date_start=now, date_end=now + timedelta(days=365), budget_total=300, giveaway_keywords=["bobblehead", "cap"], tod_prefs=["evening"], dow_prefs=[4, 5, 6])
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        per_game = [score_game(g, t, pref, d) for g, t, d in zip(games, tickets, distances)]
+        per_game.sort(key=lambda r: r.score, reverse=True)
+        per_game = per_game[: args.top]
+    loop_seconds = (time.perf_counter() - started) / args.repeat
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        scores = score_games(ScoringColumns.from_rows(games, tickets, distances), pref)
+        order = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[: args.top]
+        batch = [
+            SearchResult(game=games[i], ticket_summary=tickets[i], score=scores[i], why_recommended=explain(games[i], tickets[i], pref, distances[i]))
+            for i in order
+        ]
+    batch_seconds = (time.perf_counter() - started) / args.repeat
+
+    assert [r.score for r in batch] == [r.score for r in per_game]
+    print(f"{args.games} games, top {args.top} materialized")
+    print(f"score_game loop   {loop_seconds * 1000:8.1f}ms")
+    print(f"score_games batch {batch_seconds * 1000:8.1f}ms  ({loop_seconds / batch_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare /search latency with sequential vs. bounded-concurrency ticket lookups.
+
+Run from backend/: python -m benchmarks.bench_search_fanout
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import time
+
+import httpx
+
+from app.api import routes
+from app.core.config import settings
+from app.main import app
+from app.services.cache import TTLCache
+from benchmarks.common import LatencyTicketProvider, percentiles
+
+
+async def run(concurrency: int, iterations: int, games: int, latency: float) -> dict[str, float]:
+    team = "Bench Yankees"
+    provider = LatencyTicketProvider(team, games=games, latency_seconds=latency)
+    routes.get_ticket_provider = lambda: provider
+    routes.games_cache = TTLCache(ttl_seconds=3600)
+    settings.ticket_lookup_concurrency = concurrency
+    settings.search_rate_limit_per_minute = 10**9
+
+    now = datetime.now(timezone.utc)
+    body = {
+        "preferences": {
+            "team_text": team,
+            "date_start": now.isoformat(),
+            "date_end": (now + timedelta(days=90)).isoformat(),
+            "budget_total": 300,
+        }
+    }
+    samples = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(iterations):
+            routes.tickets_cache = TTLCache(ttl_seconds=0)
+            started = time.perf_counter()
+            resp = await client.post("/search", json=body)
+            samples.append(time.perf_counter() - started)
+            resp.raise_for_status()
+    return percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, default=settings.ticket_lookup_concurrency)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    before = asyncio.run(run(1, args.iterations, args.games, latency))
+    after = asyncio.run(run(args.concurrency, args.iterations, args.games, latency))
+    print(f"{args.games} games, {args.latency_ms:.0f}ms per ticket lookup, {args.iterations} searches")
+    print(f"sequential      p50={before['p50_ms']:8.1f}ms  p99={before['p99_ms']:8.1f}ms")
+    print(f"concurrency={args.concurrency:<3} p50={after['p50_ms']:8.1f}ms  p99={after['p99_ms']:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""/search response size and serialization time for a 500-game result set.
+
+Compares the full ranked list with limit-based pages and the summary field set.
+Run from backend/: python -m benchmarks.bench_search_response
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import time
+
+import httpx
+
+from app.api import routes
+from app.core.config import settings
+from app.main import app
+from app.services.cache import TTLCache
+from benchmarks.common import LatencyTicketProvider, percentiles
+
+
+async def run(games: int, iterations: int) -> None:
+    team = "Bench Dodgers"
+    provider = LatencyTicketProvider(team, games=games, latency_seconds=0)
+    routes.get_ticket_provider = lambda: provider
+    routes.games_cache = TTLCache(ttl_seconds=3600)
+    routes.tickets_cache = TTLCache(ttl_seconds=3600)
+    settings.search_rate_limit_per_minute = 10**9
+    now = datetime.now(timezone.utc)
+    preferences = {
+        "team_text": team,
+        "date_start": now.isoformat(),
+        "date_end": (now + timedelta(days=games + 2)).isoformat(),
+        "budget_total": 300,
+    }
+    variants = {
+        "full ranked list": {},
+        "limit=20": {"limit": 20},
+        "limit=20 summary": {"limit": 20, "fields": "summary"},
+        "full list summary": {"fields": "summary"},
+    }
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/search", json={"preferences": preferences})
+        for label, extra in variants.items():
+            samples, size = [], 0
+            for _ in range(iterations):
+                started = time.perf_counter()
+                resp = await client.post("/search", json={"preferences": preferences, **extra})
+                samples.append(time.perf_counter() - started)
+                resp.raise_for_status()
+                size = len(resp.content)
+            pct = percentiles(samples)
+            print(f"{label:<20} {size / 1024:9.1f} KiB  p50={pct['p50_ms']:7.1f}ms  p99={pct['p99_ms']:7.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.games, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
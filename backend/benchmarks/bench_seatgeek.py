@@ -0,0 +1,57 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import time
+
+import httpx
+
+from app.core.config import settings
+from tests.seatgeek_standin import create_app, make_events
+from app.providers.tickets import SeatGeekProvider
+from app.services.fanout import bounded_gather
+from app.services.http import HttpPool
+
+
+async def run(per_page: int, max_pages: int, use_stats: bool, games_per_team: int, latency: float) -> tuple[float, int, int]:
+    events = make_events(["New York Yankees"], per_team=games_per_team)
+    app = create_app(events, latency_seconds=latency)
+    pool = HttpPool()
+    await pool.start(transport=httpx.ASGITransport(app=app))
+    provider = SeatGeekProvider("id", "secret", http=pool, base_url="http://seatgeek.test/2")
+    provider.per_page, provider.max_pages = per_page, max_pages
+    SeatGeekProvider._stats.clear()
+    first = min(e["datetime_utc"] for e in events)
+    start = datetime.fromisoformat(first).replace(tzinfo=timezone.utc) - timedelta(hours=1)
+    started = time.perf_counter()
+    games = await provider.list_games("New York Yankees", start, start + timedelta(days=games_per_team + 1))
+    if use_stats:
+        await provider.prime_tickets([g.game_id for g in games])
+    else:
+        SeatGeekProvider._stats.clear()
+    tickets = await bounded_gather(
+        [lambda g=g: provider.search_tickets(g.game_id, 2, (0, 1000)) for g in games],
+        limit=settings.ticket_lookup_concurrency,
+        timeout_seconds=30,
+    )
+    elapsed = time.perf_counter() - started
+    await pool.close()
+    SeatGeekProvider._stats.clear()
+    return elapsed, app.state.requests, sum(t is not None for t in tickets)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=180)
+    parser.add_argument("--latency-ms", type=float, default=30)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    before = asyncio.run(run(20, 1, False, args.games, latency))
+    after = asyncio.run(run(settings.seatgeek_per_page, settings.seatgeek_max_pages, True, args.games, latency))
+    print(f"{args.games} scheduled games, {args.latency_ms:.0f}ms per stand-in request")
+    print(f"single page + per-event stats  requests={before[1]:4d}  priced={before[2]:4d}  total={before[0] * 1000:8.1f}ms")
+    print(f"paged + list/bulk stats        requests={after[1]:4d}  priced={after[2]:4d}  total={after[0] * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
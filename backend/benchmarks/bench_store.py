@@ -0,0 +1,68 @@
+"""Microbenchmark SQLiteStore methods (ops/sec), pooled WAL connections vs. connect-per-call.
+
+Run from backend/: python -m benchmarks.bench_store
+"""
+import argparse
+from contextlib import contextmanager
+import sqlite3
+import tempfile
+import time
+
+from app.models.schemas import ConnectedCalendarProvider
+from app.services.store import SQLiteStore
+
+
+class ConnectPerCallStore(SQLiteStore):
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+def bench_methods(store: SQLiteStore, iterations: int) -> dict[str, float]:
+    plan = store.create_plan(owner_user_id="alex", name="Bench")
+    store.join_plan(plan.id, "brian")
+    provider = ConnectedCalendarProvider(provider="google", account_email="alex@example.com", token_encrypted="t")
+    store.set_user_provider("alex", provider)
+    store.get_preferences("alex")
+
+    ops = {
+        "log": lambda: store.log("search_run", {"team": "Yankees", "user_id": "alex"}),
+        "plan_exists": lambda: store.plan_exists(plan.id),
+        "get_plan": lambda: store.get_plan(plan.id),
+        "get_user_providers": lambda: store.get_user_providers("alex"),
+        "get_preferences": lambda: store.get_preferences("alex"),
+        "set_user_provider": lambda: store.set_user_provider("alex", provider),
+    }
+    results = {}
+    for name, op in ops.items():
+        started = time.perf_counter()
+        for _ in range(iterations):
+            op()
+        results[name] = iterations / (time.perf_counter() - started)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before = bench_methods(ConnectPerCallStore(f"{tmp}/per_call.db"), args.iterations)
+        pooled_store = SQLiteStore(f"{tmp}/pooled.db")
+        after = bench_methods(pooled_store, args.iterations)
+        pooled_store.close()
+
+    print(f"{'method':<20}{'connect/call':>14}{'pooled WAL':>14}{'speedup':>10}")
+    for name in before:
+        print(f"{name:<20}{before[name]:>12.0f}/s{after[name]:>12.0f}/s{after[name] / before[name]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
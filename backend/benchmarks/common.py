@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import statistics
+
+from app.models.records import GameRecord, TicketRecord
+from app.providers.calendar import BusyInterval, CalendarProvider
+from app.providers.tickets import TicketProvider
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    p99_index = min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))
+    return {"p50_ms": statistics.median(ordered) * 1000, "p99_ms": ordered[p99_index] * 1000}
+
+
+def make_games(team: str, count: int, start: datetime | None = None) -> list[GameRecord]:
+    start = start or datetime.now(timezone.utc) + timedelta(days=1)
+    games = []
+    for i in range(count):
+        tip = start + timedelta(days=i, hours=i % 6)
+        games.append(
+            GameRecord(
+                game_id=f"{team.lower().replace(' ', '-')}-{i}",
+                league="MLB",
+                team=team,
+                opponent=f"Opponent {i % 15}",
+                start_time_utc=tip,
+                end_time_utc=tip + timedelta(hours=3),
+                venue="Yankee Stadium",
+                venue_zip="10451",
+                lat=40.8296,
+                lon=-73.9262,
+                giveaway_text="Bobblehead night" if i % 4 == 0 else None,
+                ticket_url=f"https://example.com/{i}",
+            )
+        )
+    return games
+
+
+class LatencyTicketProvider(TicketProvider):
+    def __init__(self, team: str, games: int = 40, latency_seconds: float = 0.02):
+        self.latency_seconds = latency_seconds
+        self._games = make_games(team, games)
+        self.calls = 0
+
+    async def list_games(self, team: str, date_start: datetime, date_end: datetime) -> list[GameRecord]:
+        await asyncio.sleep(self.latency_seconds)
+        return list(self._games)
+
+    async def search_tickets(self, game_id: str, party_size: int, price_bounds: tuple[float, float]) -> TicketRecord | None:
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        median = 40 + sum(map(ord, game_id)) % 40
+        return TicketRecord(
+            game_id=game_id,
+            min_price=median * 0.7,
+            median_price=median,
+            availability_count=50,
+            estimated_total=median * party_size * 1.25,
+            best_value_score=max(0.0, 100 - median),
+            deep_link=f"https://example.com/tickets/{game_id}",
+        )
+
+
+
+class LatencyCalendarProvider(CalendarProvider):
+    def __init__(self, name: str, latency_seconds: float = 0.08, batch_size: int = 50):
+        self.provider_name = name
+        self.latency_seconds = latency_seconds
+        self.batch_size = batch_size
+        self.calls = 0
+
+    async def get_freebusy(self, time_min: datetime, time_max: datetime, calendars: list[str]) -> list[BusyInterval]:
+        by_account = await self.get_freebusy_many(time_min, time_max, calendars)
+        return [interval for account in calendars for interval in by_account[account]]
+
+    async def get_freebusy_many(self, time_min: datetime, time_max: datetime, calendars: list[str]) -> dict[str, list[BusyInterval]]:
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        return {c: [BusyInterval(start=time_min + timedelta(hours=i), end=time_min + timedelta(hours=i, minutes=30)) for i in range(20)] for c in calendars}
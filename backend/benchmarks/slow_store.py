@@ -0,0 +1,21 @@
+from contextlib import contextmanager
+import time
+
+from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+
+class SlowDiskStore(SQLiteStore):
+    def __init__(self, db_path: str, delay_seconds: float, **kwargs):
+        self.delay_seconds = delay_seconds
+        super().__init__(db_path, **kwargs)
+
+    @contextmanager
+    def _connect(self):
+        time.sleep(self.delay_seconds)
+        with super()._connect() as conn:
+            yield conn
+
+
+class InlineAsyncStore(AsyncSQLiteStore):
+    async def _run(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
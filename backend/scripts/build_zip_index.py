@@ -0,0 +1,22 @@
+"""Rebuild app/fixtures/zip_centroids.bin from the CSV source.
+
+The bundled CSV holds the Census Gazetteer interior points of standard ZIP
+Code Tabulation Areas (public domain); PO box and unique ZIPs have no ZCTA.
+
+Run from backend/: python -m scripts.build_zip_index [csv] [out]
+"""
+from pathlib import Path
+import sys
+
+from app.services.geo import DEFAULT_ZIP_INDEX_PATH, build_zip_index
+
+
+def main():
+    csv_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ZIP_INDEX_PATH.with_suffix(".csv")
+    out_path = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ZIP_INDEX_PATH
+    count = build_zip_index(csv_path, out_path)
+    print(f"wrote {count} ZIP centroids to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,21 @@
+import os
+from pathlib import Path
+import tempfile
+
+# The store singleton opens STORE_DB_PATH on import; keep test runs out of the checkout.
+os.environ["STORE_DB_PATH"] = str(Path(tempfile.mkdtemp(prefix="gameday-tests-")) / "gameday.db")
+
 import pytest
+from app.providers.tickets import ESPNProvider
 from app.services.store import store
 
 
 @pytest.fixture(autouse=True)
 def reset_store():
     store.reset()
+    ESPNProvider._scoreboards.clear()
+    ESPNProvider._tickets.clear()
     yield
     store.reset()
+    ESPNProvider._scoreboards.clear()
+    ESPNProvider._tickets.clear()
@@ -0,0 +1,80 @@
+"""Offline stand-in for the SeatGeek events API.
+
+Serve it locally with ``uvicorn tests.seatgeek_standin:app --port 8081`` and
+set ``SEATGEEK_BASE_URL=http://127.0.0.1:8081/2``, or mount it in-process with
+``httpx.ASGITransport(app=create_app(...))``.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI, HTTPException, Request
+
+
+def make_events(teams: list[str], per_team: int, start: datetime | None = None) -> list[dict]:
+    start = start or datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    events = []
+    for t, team in enumerate(teams):
+        for i in range(per_team):
+            event_id = 1_000_000 + t * 10_000 + i
+            median = 40 + event_id % 60
+            events.append(
+                {
+                    "id": event_id,
+                    "type": "mlb",
+                    "short_title": f"Rival {i % 12} vs {team}",
+                    "datetime_utc": (start + timedelta(days=i, hours=t % 5)).strftime("%Y-%m-%dT%H:%M:%S"),
+                    "url": f"https://seatgeek.example/e/{event_id}",
+                    "venue": {"name": f"{team} Park", "postal_code": "10451", "location": {"lat": 40.83, "lon": -73.93}},
+                    "stats": {"lowest_price": round(median * 0.7, 2), "median_price": median, "listing_count": 100 + i},
+                }
+            )
+    return events
+
+
+def create_app(events: list[dict], latency_seconds: float = 0.0) -> FastAPI:
+    app = FastAPI(title="SeatGeek stand-in")
+    app.state.requests = 0
+    by_id = {str(e["id"]): e for e in events}
+
+    @app.middleware("http")
+    async def count_and_delay(request: Request, call_next):
+        app.state.requests += 1
+        if latency_seconds:
+            await asyncio.sleep(latency_seconds)
+        return await call_next(request)
+
+    @app.get("/2/events")
+    async def list_events(request: Request):
+        params = request.query_params
+        per_page = int(params.get("per_page", 10))
+        page = int(params.get("page", 1))
+        if "id" in params:
+            matches = [by_id[i] for i in params["id"].split(",") if i in by_id]
+        else:
+            q = (params.get("q") or "").lower()
+            gte, lte = params.get("datetime_utc.gte"), params.get("datetime_utc.lte")
+            matches = [
+                e
+                for e in events
+                if q in e["short_title"].lower()
+                and (gte is None or _ts(e["datetime_utc"]) >= _ts(gte))
+                and (lte is None or _ts(e["datetime_utc"]) <= _ts(lte))
+            ]
+        window = matches[(page - 1) * per_page : page * per_page]
+        return {"meta": {"total": len(matches), "page": page, "per_page": per_page}, "events": window}
+
+    @app.get("/2/events/{event_id}")
+    async def get_event(event_id: str):
+        if event_id not in by_id:
+            raise HTTPException(status_code=404, detail="event not found")
+        return by_id[event_id]
+
+    return app
+
+
+def _ts(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed
+
+
+app = create_app(make_events(["New York Yankees", "Chicago Cubs", "Seattle Mariners"], per_team=180))
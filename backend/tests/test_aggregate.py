@@ -0,0 +1,143 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.records import GameRecord, TicketRecord
+from app.providers.aggregate import AggregateTicketProvider
+from app.providers.tickets import PartialScheduleError, TicketProvider
+from app.services.circuit import CircuitBreaker
+
+START = datetime(2030, 7, 4, 23, 5, tzinfo=timezone.utc)
+
+
+def _game(game_id: str, opponent: str, venue: str, start: datetime = START) -> GameRecord:
+    return GameRecord(game_id=game_id, league="MLB", team="New York Yankees", opponent=opponent, start_time_utc=start, end_time_utc=start, venue=venue, venue_zip="10451", lat=40.8, lon=-73.9)
+
+
+def _ticket(game_id: str, median: float) -> TicketRecord:
+    return TicketRecord(game_id=game_id, min_price=median * 0.7, median_price=median, availability_count=10, estimated_total=median * 2.5, best_value_score=100 - median, deep_link="https://t.example")
+
+
+class StubProvider(TicketProvider):
+    def __init__(self, source: str, games: list[GameRecord], median: float | None, delay: float = 0.0, fail: bool = False):
+        self.source = source
+        self.games = games
+        self.median = median
+        self.delay = delay
+        self.fail = fail
+        self.ticket_calls: list[str] = []
+
+    async def list_games(self, team, date_start, date_end):
+        if self.fail:
+            raise RuntimeError(f"{self.source} down")
+        return list(self.games)
+
+    async def search_tickets(self, game_id, party_size, price_bounds):
+        self.ticket_calls.append(game_id)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.source} down")
+        return None if self.median is None else _ticket(game_id, self.median)
+
+    def owns_game_id(self, game_id):
+        return game_id.startswith(self.source)
+
+
+def test_games_are_deduplicated_across_sources_by_time_venue_and_opponent():
+    fast = StubProvider("sg", [_game("sg-1", "Boston Red Sox", "Yankee Stadium"), _game("sg-2", "Tampa Bay Rays", "Yankee Stadium", START + timedelta(days=1))], 40)
+    slow = StubProvider("espn", [_game("espn-9", "Boston  Red-Sox", "Yankee Stadium"), _game("espn-7", "Toronto Blue Jays", "Rogers Centre")], 55)
+    aggregate = AggregateTicketProvider([fast, slow])
+
+    async def scenario():
+        games = await aggregate.list_games("New York Yankees", START - timedelta(days=1), START + timedelta(days=5))
+        ticket = await aggregate.search_tickets("espn-7", 2, (0, 500))
+        return games, ticket
+
+    games, ticket = asyncio.run(scenario())
+    assert aggregate.source == "sg+espn"
+    assert [g.game_id for g in games] == ["sg-1", "sg-2", "espn-7"]
+    assert ticket.game_id == "espn-7" and fast.ticket_calls == []
+
+
+def test_seatgeek_short_titles_match_espn_display_names():
+    # SeatGeek opponents are what's left of short_title once the searched team is
+    # removed; venue names differ between the sources too.
+    seatgeek = StubProvider("sg", [
+        _game("sg-1", "Boston Red Sox at", "Yankee Stadium - Bronx"),
+        _game("sg-2", "Rays at Yankee", "Yankee Stadium - Bronx", START + timedelta(days=1)),
+        _game("sg-3", "Orioles at Yankee", "Yankee Stadium - Bronx", START + timedelta(days=2)),
+    ], 40)
+    espn = StubProvider("espn", [
+        _game("espn-1", "Boston Red Sox", "Yankee Stadium"),
+        _game("espn-2", "Tampa Bay Rays", "Yankee Stadium", START + timedelta(days=1)),
+        _game("espn-3", "Toronto Blue Jays", "Rogers Centre", START + timedelta(days=2)),
+    ], 55)
+    aggregate = AggregateTicketProvider([seatgeek, espn])
+    games = asyncio.run(aggregate.list_games("New York Yankees", START - timedelta(days=1), START + timedelta(days=5)))
+    assert [g.game_id for g in games] == ["sg-1", "sg-2", "sg-3", "espn-3"]
+    assert aggregate._owners("sg-2") == {0: "sg-2", 1: "espn-2"}
+
+
+def test_ticket_lookup_races_aliases_and_takes_the_fastest_answer():
+    quick = StubProvider("sg", [_game("sg-1", "Boston Red Sox", "Yankee Stadium")], 40, delay=0.01)
+    slow = StubProvider("espn", [_game("espn-9", "Boston Red Sox", "Yankee Stadium")], 55, delay=0.5)
+    aggregate = AggregateTicketProvider([slow, quick], ticket_budget_seconds=1)
+
+    async def scenario():
+        await aggregate.list_games("New York Yankees", START, START)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        ticket = await aggregate.search_tickets("espn-9", 2, (0, 500))
+        return ticket, loop.time() - started
+
+    ticket, elapsed = asyncio.run(scenario())
+    assert ticket.game_id == "espn-9" and ticket.median_price == 40
+    assert elapsed < 0.3
+    assert slow.ticket_calls == ["espn-9"] and quick.ticket_calls == ["sg-1"]
+
+
+def test_failing_provider_trips_its_circuit_and_stops_adding_latency():
+    broken = StubProvider("sg", [], 40, fail=True)
+    healthy = StubProvider("espn", [_game("espn-1", "Boston Red Sox", "Yankee Stadium")], 50)
+    aggregate = AggregateTicketProvider([broken, healthy], failure_threshold=2, reset_seconds=60)
+
+    async def scenario():
+        for _ in range(3):
+            with pytest.raises(PartialScheduleError) as partial:
+                await aggregate.list_games("New York Yankees", START, START)
+        return partial.value.games
+
+    assert [g.game_id for g in asyncio.run(scenario())] == ["espn-1"]
+    assert aggregate.stats()["sg"]["state"] == "open"
+    assert aggregate.stats()["sg"]["short_circuits"] == 1
+    assert aggregate.stats()["espn"]["state"] == "closed"
+
+
+def test_all_sources_failing_raises():
+    aggregate = AggregateTicketProvider([StubProvider("sg", [], None, fail=True), StubProvider("espn", [], None, fail=True)])
+    with pytest.raises(RuntimeError):
+        asyncio.run(aggregate.list_games("New York Yankees", START, START))
+
+
+def test_slow_lookup_past_budget_counts_as_failure():
+    slow = StubProvider("sg", [], 40, delay=1)
+    aggregate = AggregateTicketProvider([slow], ticket_budget_seconds=0.05, failure_threshold=1)
+    assert asyncio.run(aggregate.search_tickets("sg-5", 2, (0, 500))) is None
+    assert aggregate.stats()["sg"]["state"] == "open"
+
+
+def test_circuit_breaker_half_opens_after_reset():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 11
+    assert breaker.state == "half_open" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    now[0] = 22
+    breaker.record_success()
+    assert breaker.state == "closed"
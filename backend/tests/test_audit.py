@@ -0,0 +1,52 @@
+import asyncio
+
+from app.services.audit import AuditWriter
+from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+
+def audit_rows(store: SQLiteStore) -> list[str]:
+    with store._connect() as conn:
+        return [r["event"] for r in conn.execute("SELECT event FROM audit ORDER BY id")]
+
+
+def test_async_writer_batches_and_flushes_on_close(tmp_path):
+    store = SQLiteStore(str(tmp_path / "audit.db"))
+    writer = AuditWriter(AsyncSQLiteStore(store), batch_size=100, flush_interval_seconds=10)
+
+    async def scenario():
+        await writer.start()
+        for i in range(250):
+            await writer.log("search_run", {"i": i})
+        await writer.close()
+
+    asyncio.run(scenario())
+    assert len(audit_rows(store)) == 250
+    assert writer.batches == 3
+
+
+def test_async_writer_flushes_on_interval(tmp_path):
+    store = SQLiteStore(str(tmp_path / "audit.db"))
+    writer = AuditWriter(AsyncSQLiteStore(store), batch_size=100, flush_interval_seconds=0.02)
+
+    async def scenario():
+        await writer.start()
+        await writer.log("plan_joined", {"plan_id": "p1"})
+        assert audit_rows(store) == []
+        await asyncio.sleep(0.2)
+        flushed = audit_rows(store)
+        await writer.close()
+        return flushed
+
+    assert asyncio.run(scenario()) == ["plan_joined"]
+
+
+def test_sync_mode_writes_immediately(tmp_path):
+    store = SQLiteStore(str(tmp_path / "audit.db"))
+    writer = AuditWriter(AsyncSQLiteStore(store), asynchronous=False)
+
+    async def scenario():
+        await writer.start()
+        await writer.log("provider_connected", {"provider": "google"})
+        return audit_rows(store), writer.running
+
+    assert asyncio.run(scenario()) == (["provider_connected"], False)
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+import random
+
+from app.models.records import GameRecord
+from app.models.schemas import Preferences
+from app.providers.calendar import BusyInterval
+from app.services.availability import available_games
+from app.services.scoring import is_available
+
+BASE = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+
+def make_game(i: int, start: datetime, end: datetime) -> GameRecord:
+    return GameRecord(game_id=str(i), league="MLB", team="Yankees", opponent="Red Sox", start_time_utc=start, end_time_utc=end, venue="x", venue_zip="1", lat=0, lon=0)
+
+
+def reference(games, busy_by_participant, pref):
+    return [g for g in games if all(is_available(g, busy, pref) for busy in busy_by_participant.values())]
+
+
+def test_matches_is_available_on_random_calendars():
+    rng = random.Random(7)
+    for trial in range(30):
+        pref = Preferences(date_start=BASE, date_end=BASE, buffer_before_mins=rng.choice([0, 30, 60]), buffer_after_mins=rng.choice([0, 45, 90]))
+        games = []
+        for i in range(60):
+            start = BASE + timedelta(minutes=15 * rng.randrange(0, 4000))
+            games.append(make_game(i, start, start + timedelta(minutes=15 * rng.randrange(0, 16))))
+        busy = {}
+        for p in range(rng.randrange(1, 5)):
+            intervals = []
+            for _ in range(rng.randrange(0, 80)):
+                start = BASE + timedelta(minutes=15 * rng.randrange(0, 4000))
+                intervals.append(BusyInterval(start=start, end=start + timedelta(minutes=15 * rng.randrange(0, 24))))
+            busy[f"p{p}"] = intervals
+        assert available_games(games, busy, pref) == reference(games, busy, pref), trial
+
+
+def test_touching_and_zero_length_edges():
+    pref = Preferences(date_start=BASE, date_end=BASE, buffer_before_mins=0, buffer_after_mins=0)
+    seam = BASE + timedelta(hours=2)
+    busy = {
+        "a": [BusyInterval(start=BASE, end=seam)],
+        "b": [BusyInterval(start=seam, end=seam + timedelta(hours=2)), BusyInterval(start=BASE + timedelta(hours=6), end=BASE + timedelta(hours=6))],
+    }
+    games = [
+        make_game(0, seam, seam),
+        make_game(1, BASE + timedelta(hours=5), BASE + timedelta(hours=7)),
+        make_game(2, BASE + timedelta(hours=4), BASE + timedelta(hours=6)),
+        make_game(3, BASE + timedelta(hours=1), BASE + timedelta(hours=3)),
+    ]
+    assert [g.game_id for g in available_games(games, busy, pref)] == [g.game_id for g in reference(games, busy, pref)] == ["0", "2"]
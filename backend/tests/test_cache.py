@@ -0,0 +1,55 @@
+from app.services.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_expired_entries_are_swept_without_being_read():
+    clock = FakeClock()
+    cache = TTLCache(ttl_seconds=10, clock=clock)
+    for i in range(5):
+        cache.set(f"k{i}", i)
+    clock.now = 11
+    cache.set("fresh", "x")
+    assert len(cache) == 1
+    assert cache.get("fresh") == "x"
+    assert cache.stats()["expirations"] == 5
+
+
+def test_lru_eviction_by_entries_and_counters():
+    cache = TTLCache(ttl_seconds=60, max_entries=2, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 1, 1)
+
+
+def test_eviction_by_approximate_bytes():
+    cache = TTLCache(ttl_seconds=60, max_bytes=4096, clock=FakeClock())
+    for i in range(10):
+        cache.set(f"k{i}", "x" * 1000)
+    assert 0 < len(cache) < 10
+    assert cache.stats()["approx_bytes"] <= 4096
+    assert cache.get("k9") is not None
+
+
+def test_reset_key_keeps_new_expiry():
+    clock = FakeClock()
+    cache = TTLCache(ttl_seconds=10, clock=clock)
+    cache.set("k", 1)
+    clock.now = 5
+    cache.set("k", 2)
+    clock.now = 12
+    assert cache.get("k") == 2
+    clock.now = 15
+    assert cache.get("k") is None
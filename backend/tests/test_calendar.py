@@ -0,0 +1,162 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+import random
+
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.main import app
+from app.providers.calendar import BusyInterval, CalendarProvider, MockCalendarProvider
+from app.services.freebusy import FreeBusyCache
+
+BASE = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def _linear(data: dict, time_min: datetime, time_max: datetime, accounts: list[str]) -> list[BusyInterval]:
+    intervals = []
+    for account in accounts:
+        for item in data["accounts"].get(account, []):
+            start, end = datetime.fromisoformat(item["start"]), datetime.fromisoformat(item["end"])
+            if start < time_max and end > time_min:
+                intervals.append(BusyInterval(start=max(start, time_min), end=min(end, time_max)))
+    return intervals
+
+
+def test_indexed_queries_match_linear_scan(tmp_path):
+    rng = random.Random(11)
+    data = {"accounts": {}}
+    for a in range(5):
+        items = []
+        for _ in range(200):
+            start = BASE + timedelta(minutes=rng.randrange(0, 60 * 24 * 60))
+            end = start + timedelta(minutes=rng.choice([15, 30, 60, 240, 60 * 24 * 3]))
+            items.append({"start": start.isoformat(), "end": end.isoformat()})
+        data["accounts"][f"a{a}@example.com"] = items
+    path = tmp_path / "freebusy.json"
+    path.write_text(json.dumps(data))
+    provider = MockCalendarProvider(str(path))
+
+    for _ in range(200):
+        time_min = BASE + timedelta(minutes=rng.randrange(-600, 60 * 24 * 60))
+        time_max = time_min + timedelta(minutes=rng.randrange(1, 60 * 24 * 10))
+        accounts = rng.sample(sorted(data["accounts"]) + ["missing@example.com"], 3)
+        got = asyncio.run(provider.get_freebusy(time_min, time_max, accounts))
+        expected = _linear(data, time_min, time_max, accounts)
+        key = lambda i: (i.start, i.end)
+        assert sorted(got, key=key) == sorted(expected, key=key)
+
+
+class CountingCalendar(CalendarProvider):
+    provider_name = "counting"
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def get_freebusy(self, time_min, time_max, calendars):
+        self.calls.extend(calendars)
+        return [BusyInterval(start=time_min, end=time_min + timedelta(hours=1)) for _ in calendars]
+
+
+def test_freebusy_cache_reuses_windows_until_invalidated():
+    cache = FreeBusyCache(ttl_seconds=60)
+    provider = CountingCalendar()
+    window = (BASE, BASE + timedelta(days=7))
+
+    async def scenario():
+        first = await cache.get_freebusy(provider, *window, ["a@x", "b@x"])
+        await cache.get_freebusy(provider, *window, ["b@x", "a@x"])
+        await cache.get_freebusy(provider, BASE, BASE + timedelta(days=8), ["a@x"])
+        cache.invalidate("b@x")
+        await cache.get_freebusy(provider, *window, ["a@x", "b@x"])
+        return first
+
+    first = asyncio.run(scenario())
+    assert len(first) == 2
+    assert provider.calls == ["a@x", "b@x", "a@x", "b@x"]
+
+
+def test_invalidated_generations_expire_with_the_windows_they_orphaned():
+    cache = FreeBusyCache(ttl_seconds=0.01)
+    provider = CountingCalendar()
+    window = (BASE, BASE + timedelta(days=7))
+
+    async def scenario():
+        await cache.get_freebusy(provider, *window, ["a@x"])
+        cache.invalidate(*(f"user{i}@x" for i in range(100)), "a@x")
+        await cache.get_freebusy(provider, *window, ["a@x"])
+        await asyncio.sleep(0.05)
+        cache.invalidate("b@x")
+
+    asyncio.run(scenario())
+    assert provider.calls == ["a@x", "a@x"]
+    assert len(cache._generations) == 1
+
+
+def test_connect_and_disconnect_invalidate_cached_freebusy(monkeypatch):
+    calendar = CountingCalendar()
+    monkeypatch.setattr(routes, "calendar_providers", {"google": calendar, "microsoft": calendar, "mock": calendar})
+    monkeypatch.setattr(routes, "freebusy_cache", FreeBusyCache(ttl_seconds=60))
+    client = TestClient(app)
+    headers = {"X-User-Id": "cal-user"}
+    plan_id = client.post("/plans", json={"name": "Cal"}, headers=headers).json()["plan"]["id"]
+    assert client.post("/auth/google/callback", params={"account_email": "cal@example.com"}, headers=headers).status_code == 200
+
+    now = datetime.now(timezone.utc)
+    body = {
+        "plan_id": plan_id,
+        "preferences": {"team_text": "Yankees", "date_start": now.isoformat(), "date_end": (now + timedelta(days=30)).isoformat(), "party_size": 2, "budget_total": 300},
+    }
+    for _ in range(2):
+        assert client.post("/search", json=body, headers=headers).status_code == 200
+    assert calendar.calls == ["cal@example.com"]
+
+    client.post("/auth/google/callback", params={"account_email": "cal@example.com"}, headers=headers)
+    client.post("/search", json=body, headers=headers)
+    assert calendar.calls == ["cal@example.com"] * 2
+
+    client.post("/disconnect/google", headers=headers)
+    client.post("/auth/google/callback", params={"account_email": "cal@example.com"}, headers=headers)
+    client.post("/search", json=body, headers=headers)
+    assert calendar.calls == ["cal@example.com"] * 3
+
+
+class BatchCalendar(CalendarProvider):
+    def __init__(self, name: str, batch_size: int, delay: float = 0.05):
+        self.provider_name = name
+        self.batch_size = batch_size
+        self.delay = delay
+        self.batches: list[list[str]] = []
+
+    async def get_freebusy_many(self, time_min, time_max, calendars):
+        self.batches.append(list(calendars))
+        await asyncio.sleep(self.delay)
+        return {c: [BusyInterval(start=time_min, end=time_min + timedelta(minutes=len(c)))] for c in calendars}
+
+
+def test_participants_are_batched_per_provider_and_fanned_back_out():
+    google, microsoft = BatchCalendar("google", batch_size=2), BatchCalendar("microsoft", batch_size=50)
+    cache = FreeBusyCache(ttl_seconds=60)
+    participants = {
+        "u1": [("google", "a@g"), ("microsoft", "a@m")],
+        "u2": [("google", "bb@g")],
+        "u3": [("google", "ccc@g"), ("microsoft", "cc@m")],
+        "u4": [("google", "a@g")],
+    }
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        busy = await cache.get_participants_freebusy({"google": google, "microsoft": microsoft}, BASE, BASE + timedelta(days=1), participants)
+        return busy, loop.time() - started
+
+    busy, elapsed = asyncio.run(scenario())
+    assert google.batches == [["a@g", "bb@g"], ["ccc@g"]]
+    assert microsoft.batches == [["a@m", "cc@m"]]
+    assert elapsed < 0.15
+    assert {pid: [i.end - i.start for i in items] for pid, items in busy.items()} == {
+        "u1": [timedelta(minutes=3), timedelta(minutes=3)],
+        "u2": [timedelta(minutes=4)],
+        "u3": [timedelta(minutes=5), timedelta(minutes=4)],
+        "u4": [timedelta(minutes=3)],
+    }
@@ -0,0 +1,139 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+
+from app.providers.calendar import BusyInterval, CalendarProvider, MockCalendarProvider
+from app.services.freebusy import FreeBusyCache
+from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+BASE = datetime(2030, 3, 1, tzinfo=timezone.utc)
+
+
+def _fixture(tmp_path) -> str:
+    data = {
+        "accounts": {
+            "a@example.com": [
+                {"start": (BASE + timedelta(days=d, hours=18)).isoformat(), "end": (BASE + timedelta(days=d, hours=20)).isoformat()}
+                for d in range(0, 120, 3)
+            ],
+            "b@example.com": [{"start": (BASE + timedelta(days=2)).isoformat(), "end": (BASE + timedelta(days=3)).isoformat()}],
+        }
+    }
+    path = tmp_path / "freebusy.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def _spans(busy: dict) -> dict:
+    return {account: sorted((i.start, i.end) for i in items) for account, items in busy.items()}
+
+
+def test_mock_changes_return_snapshot_then_deltas(tmp_path):
+    provider = MockCalendarProvider(_fixture(tmp_path))
+
+    async def scenario():
+        snapshot = await provider.get_changes("b@example.com", None)
+        added = provider.add_busy("b@example.com", BASE + timedelta(days=10), BASE + timedelta(days=10, hours=1))
+        provider.add_busy("a@example.com", BASE, BASE + timedelta(hours=1))
+        provider.remove_busy("b@example.com", next(iter(snapshot.upserts)))
+        delta = await provider.get_changes("b@example.com", snapshot.next_sync_token)
+        empty = await provider.get_changes("b@example.com", delta.next_sync_token)
+        foreign = await MockCalendarProvider(_fixture(tmp_path)).get_changes("b@example.com", delta.next_sync_token)
+        return snapshot, added, delta, empty, foreign
+
+    snapshot, added, delta, empty, foreign = asyncio.run(scenario())
+    assert snapshot.full and len(snapshot.upserts) == 1
+    assert not delta.full and list(delta.upserts) == [added] and delta.deletes == list(snapshot.upserts)
+    assert not empty.full and not empty.upserts and not empty.deletes
+    assert foreign.full
+
+
+def test_searches_read_local_intervals_and_only_pull_deltas(tmp_path):
+    provider = MockCalendarProvider(_fixture(tmp_path))
+    store = AsyncSQLiteStore(SQLiteStore(str(tmp_path / "sync.db")))
+    now = [1000.0]
+    cache = FreeBusyCache(ttl_seconds=0, store=store, sync_interval_seconds=60, clock=lambda: now[0])
+    accounts = ["a@example.com", "b@example.com"]
+
+    async def scenario():
+        results = []
+        for days in (7, 30, 90):
+            window = (BASE, BASE + timedelta(days=days))
+            synced = await cache.get_synced_freebusy(provider, *window, accounts)
+            results.append((synced, await provider.get_freebusy_many(*window, accounts)))
+        requests_after_windows = provider.change_requests
+
+        provider.add_busy("a@example.com", BASE + timedelta(days=1, hours=9), BASE + timedelta(days=1, hours=10))
+        stale = await cache.get_synced_freebusy(provider, BASE, BASE + timedelta(days=7), accounts)
+        now[0] += 61
+        fresh = await cache.get_synced_freebusy(provider, BASE, BASE + timedelta(days=7), accounts)
+        expected = await provider.get_freebusy_many(BASE, BASE + timedelta(days=7), accounts)
+        return results, requests_after_windows, stale, fresh, expected
+
+    results, requests_after_windows, stale, fresh, expected = asyncio.run(scenario())
+    for synced, direct in results:
+        assert _spans(synced) == _spans(direct)
+    assert requests_after_windows == 2
+    assert len(stale["a@example.com"]) == 3
+    assert _spans(fresh) == _spans(expected) and len(fresh["a@example.com"]) == 4
+    assert cache.stats()["upstream_syncs"] == 4
+
+
+class BrokenSync(CalendarProvider):
+    provider_name = "broken"
+    supports_sync = True
+
+    async def get_changes(self, calendar, sync_token):
+        raise RuntimeError("sync unavailable")
+
+    async def get_freebusy(self, time_min, time_max, calendars):
+        return [BusyInterval(start=time_min, end=time_min + timedelta(hours=1)) for _ in calendars]
+
+
+def test_failed_first_sync_falls_back_to_freebusy(tmp_path):
+    cache = FreeBusyCache(ttl_seconds=60, store=AsyncSQLiteStore(SQLiteStore(str(tmp_path / "sync.db"))))
+    busy = asyncio.run(cache.get_participants_freebusy({"google": BrokenSync()}, BASE, BASE + timedelta(days=1), {"u1": [("google", "x@example.com")]}))
+    assert [(i.start, i.end) for i in busy["u1"]] == [(BASE, BASE + timedelta(hours=1))]
+
+
+def test_sync_state_is_kept_per_connection_and_failures_fall_back(tmp_path, caplog):
+    provider = MockCalendarProvider(_fixture(tmp_path))
+    store = AsyncSQLiteStore(SQLiteStore(str(tmp_path / "sync.db")))
+    now = [1000.0]
+    cache = FreeBusyCache(ttl_seconds=0, store=store, sync_interval_seconds=60, clock=lambda: now[0])
+    window = (BASE, BASE + timedelta(days=7))
+    participants = {"u1": [("google", "b@example.com")], "u2": [("microsoft", "b@example.com")]}
+
+    async def scenario():
+        await cache.get_participants_freebusy({"google": provider, "microsoft": provider}, *window, participants)
+        google = await store.get_calendar_sync("google", ["b@example.com"])
+        await cache.forget("microsoft", "b@example.com")
+        kept = await store.get_calendar_sync("google", ["b@example.com"])
+        now[0] += 61
+        # The google mirror is stale and its sync now fails: the direct answer is served.
+        return google, kept, await cache.get_participants_freebusy({"google": BrokenSync()}, *window, {"u1": participants["u1"]})
+
+    google, kept, busy = asyncio.run(scenario())
+    assert google == kept and provider.change_requests == 2
+    assert [(i.start, i.end) for i in busy["u1"]] == [(BASE, BASE + timedelta(hours=1))]
+    assert "calendar sync failed for google b@example.com" in caplog.text
+
+
+def test_forget_drops_local_intervals_and_sync_state(tmp_path):
+    provider = MockCalendarProvider(_fixture(tmp_path))
+    store = AsyncSQLiteStore(SQLiteStore(str(tmp_path / "sync.db")))
+    cache = FreeBusyCache(ttl_seconds=300, store=store)
+
+    async def scenario():
+        await cache.get_synced_freebusy(provider, BASE, BASE + timedelta(days=7), ["b@example.com"])
+        before = await store.get_calendar_sync("mock", ["b@example.com"])
+        await cache.forget("mock", "b@example.com")
+        after = await store.get_calendar_sync("mock", ["b@example.com"])
+        busy = await store.get_busy_intervals("mock", ["b@example.com"], 0, 2**62)
+        resynced = await cache.get_synced_freebusy(provider, BASE, BASE + timedelta(days=7), ["b@example.com"])
+        return before, after, busy, resynced
+
+    before, after, busy, resynced = asyncio.run(scenario())
+    assert "b@example.com" in before and after == {}
+    assert busy == {"b@example.com": []}
+    assert len(resynced["b@example.com"]) == 1 and provider.change_requests == 2
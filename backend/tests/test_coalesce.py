@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from app.services.cache import TTLCache
+from app.services.coalesce import SingleFlight, cached_fetch
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_concurrent_misses_share_one_fetch():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["game"]
+
+    async def scenario():
+        cache, flight = TTLCache(ttl_seconds=60), SingleFlight()
+        results = await asyncio.gather(*(cached_fetch(cache, flight, "games:x", fetch) for _ in range(10)))
+        return results, len(flight)
+
+    results, inflight = asyncio.run(scenario())
+    assert calls == 1
+    assert results == [["game"]] * 10
+    assert inflight == 0
+
+
+def test_waiters_share_the_fetch_exception():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        cache, flight = TTLCache(ttl_seconds=60), SingleFlight()
+        return await asyncio.gather(*(cached_fetch(cache, flight, "k", fetch) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_stale_while_revalidate_serves_expired_value_and_refreshes():
+    clock = FakeClock()
+    cache, flight = TTLCache(ttl_seconds=10, stale_seconds=60, clock=clock), SingleFlight()
+    versions = iter(["v2", "v3"])
+
+    async def fetch():
+        await asyncio.sleep(0)
+        return next(versions)
+
+    async def scenario():
+        cache.set("k", "v1")
+        clock.now = 15
+        served = await cached_fetch(cache, flight, "k", fetch, stale_while_revalidate=True)
+        await asyncio.sleep(0.01)
+        return served, await cached_fetch(cache, flight, "k", fetch, stale_while_revalidate=True)
+
+    assert asyncio.run(scenario()) == ("v1", "v2")
+    assert cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.parametrize("swr", [False, True])
+def test_values_past_stale_window_are_refetched(swr):
+    clock = FakeClock()
+    cache, flight = TTLCache(ttl_seconds=10, stale_seconds=5, clock=clock), SingleFlight()
+
+    async def fetch():
+        return "fresh"
+
+    cache.set("k", "old")
+    clock.now = 20
+    assert asyncio.run(cached_fetch(cache, flight, "k", fetch, stale_while_revalidate=swr)) == "fresh"
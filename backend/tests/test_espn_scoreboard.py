@@ -0,0 +1,170 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.api import routes
+from app.providers.tickets import ESPNProvider, ProviderUnavailableError
+from app.services.http import HttpPool
+from app.services.schedule import ScheduleStore
+from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+
+def _event(event_id: str, home: str, away: str, start: datetime, summary: str = "Tickets as low as $40") -> dict:
+    return {
+        "id": event_id,
+        "date": start.strftime("%Y-%m-%dT%H:%MZ"),
+        "links": [{"href": f"https://espn.example/{event_id}"}],
+        "competitions": [
+            {
+                "competitors": [{"team": {"displayName": home}}, {"team": {"displayName": away}}],
+                "venue": {"fullName": f"{home} Park", "address": {"zipCode": "98134", "latitude": 47.59, "longitude": -122.33}},
+                "tickets": [{"summary": summary, "links": [{"href": f"https://tickets.example/{event_id}"}]}],
+            }
+        ],
+    }
+
+
+def test_league_scoreboard_is_fetched_once_and_shared_across_teams():
+    start = datetime(2030, 6, 1, tzinfo=timezone.utc)
+    events = [
+        _event("1", "New York Yankees", "Chicago Cubs", start + timedelta(days=1, hours=18)),
+        _event("2", "Seattle Mariners", "Oakland Athletics", start + timedelta(days=2, hours=2)),
+        _event("3", "Houston Astros", "Texas Rangers", start + timedelta(days=3, hours=1)),
+    ]
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"events": events})
+
+    async def scenario():
+        pool = HttpPool()
+        await pool.start(transport=httpx.MockTransport(handler))
+        end = start + timedelta(days=7)
+        teams = ["New York Yankees", "Chicago Cubs", "Seattle Mariners", "Houston Astros", "Los Angeles Dodgers"]
+        results = await asyncio.gather(*(ESPNProvider(http=pool).list_games(team, start, end) for team in teams))
+        provider = ESPNProvider(http=pool)
+        cubs = await provider.list_games("Chicago Cubs", start, end)
+        ticket = await provider.search_tickets("espn-1", 4, (0, 500))
+        await pool.close()
+        return dict(zip(teams, results)), cubs, ticket
+
+    by_team, cubs, ticket = asyncio.run(scenario())
+    assert seen == ["/apis/site/v2/sports/baseball/mlb/scoreboard"]
+    assert [g.opponent for g in by_team["New York Yankees"]] == ["Chicago Cubs"]
+    assert [(g.game_id, g.opponent) for g in by_team["Chicago Cubs"]] == [("espn-1", "New York Yankees")]
+    assert [g.game_id for g in by_team["Seattle Mariners"]] == ["espn-2"]
+    assert by_team["Los Angeles Dodgers"] == []
+    assert [g.game_id for g in cubs] == ["espn-1"]
+    assert ticket is not None and ticket.min_price == 40 and ticket.estimated_total == ticket.median_price * 4 * 1.25
+
+
+def test_failed_scoreboard_fetch_is_not_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"events": []})
+
+    async def scenario():
+        pool = HttpPool()
+        await pool.start(transport=httpx.MockTransport(handler))
+        provider = ESPNProvider(http=pool)
+        now = datetime(2030, 6, 1, tzinfo=timezone.utc)
+        with pytest.raises(ProviderUnavailableError):
+            await provider.list_games("Boston Celtics", now, now)
+        second = await provider.list_games("Miami Heat", now, now)
+        await pool.close()
+        return second
+
+    assert asyncio.run(scenario()) == []
+    assert len(calls) == 2
+
+
+def test_ticket_summaries_outlive_the_provider_that_listed_games():
+    start = datetime(2030, 6, 1, tzinfo=timezone.utc)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"events": [_event("9", "Boston Celtics", "Miami Heat", start + timedelta(hours=20))]})
+
+    async def scenario():
+        pool = HttpPool()
+        await pool.start(transport=httpx.MockTransport(handler))
+        await ESPNProvider(http=pool).list_games("Boston Celtics", start, start + timedelta(days=1))
+        await pool.close()
+        fresh = ESPNProvider(http=pool)
+        return (
+            await fresh.search_tickets("espn-9", 2, (0, 500)),
+            await fresh.search_tickets("espn-9", 2, (0, 10)),
+            await fresh.search_tickets("espn-unknown", 2, (0, 500)),
+        )
+
+    in_budget, over_budget, unknown = asyncio.run(scenario())
+    assert in_budget is not None and in_budget.game_id == "espn-9"
+    assert over_budget is None and unknown is None
+    assert ESPNProvider.stats()["tickets"]["entries"] == 1
+
+
+def test_ticket_provider_is_a_singleton():
+    assert routes.get_ticket_provider() is routes.get_ticket_provider()
+
+
+def test_tickets_survive_a_restart_that_serves_games_from_the_schedule_store(tmp_path):
+    start = datetime(2031, 5, 1, tzinfo=timezone.utc)
+    db = str(tmp_path / "schedule.db")
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"events": [_event("77", "Boston Red Sox", "New York Yankees", start + timedelta(hours=23))]})
+
+    async def scenario():
+        pool = HttpPool()
+        await pool.start(transport=httpx.MockTransport(handler))
+        provider = ESPNProvider(http=pool)
+        schedule = ScheduleStore(AsyncSQLiteStore(SQLiteStore(db)), freshness_seconds=3600)
+        listed = await schedule.list_games(provider, "New York Yankees", start, start + timedelta(days=1))
+        # A new worker: nothing indexed in memory, games served from SQLite.
+        ESPNProvider._tickets.clear()
+        ESPNProvider._scoreboards.clear()
+        restarted = ScheduleStore(AsyncSQLiteStore(SQLiteStore(db)), freshness_seconds=3600)
+        served = await restarted.list_games(provider, "New York Yankees", start, start + timedelta(days=1))
+        ticket = await provider.search_tickets("espn-77", 2, (0, 500))
+        await pool.close()
+        return listed, served, ticket
+
+    listed, served, ticket = asyncio.run(scenario())
+    assert served == listed and [g.game_id for g in served] == ["espn-77"]
+    assert len(calls) == 1
+    assert ticket is not None and ticket.min_price == 40 and ticket.deep_link == "https://tickets.example/77"
+
+
+def test_late_local_games_survive_split_refresh_runs(tmp_path):
+    day = datetime(2031, 6, 10, tzinfo=timezone.utc)
+    # 7:10 pm Pacific on June 10 is 02:10Z on June 11; ESPN files it under 20310610.
+    late = _event("88", "Seattle Mariners", "New York Yankees", day + timedelta(days=1, hours=2, minutes=10))
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        first, last = request.url.params["dates"].split("-")
+        requested.append((first, last))
+        return httpx.Response(200, json={"events": [late] if first <= "20310610" <= last else []})
+
+    async def scenario():
+        pool = HttpPool()
+        await pool.start(transport=httpx.MockTransport(handler))
+        provider = ESPNProvider(http=pool)
+        schedule = ScheduleStore(AsyncSQLiteStore(SQLiteStore(str(tmp_path / "schedule.db"))), freshness_seconds=3600)
+        local_day = await schedule.list_games(provider, "Seattle Mariners", day, day + timedelta(hours=23))
+        next_day = await schedule.list_games(provider, "Seattle Mariners", day + timedelta(days=1), day + timedelta(days=1, hours=23))
+        await pool.close()
+        return local_day, next_day
+
+    local_day, next_day = asyncio.run(scenario())
+    assert local_day == []
+    assert [g.game_id for g in next_day] == ["espn-88"]
+    assert requested[-1] == ("20310610", "20310612")
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.records import GameRecord
+from app.services.geo import DEFAULT_DISTANCE_MILES, DistanceCalculator, ZipIndex, build_zip_index
+from app.services.scoring import haversine_miles
+
+
+def make_game(venue: str, lat: float, lon: float) -> GameRecord:
+    now = datetime.now(timezone.utc)
+    return GameRecord(game_id=venue, league="MLB", team="Yankees", opponent="Red Sox", start_time_utc=now, end_time_utc=now, venue=venue, venue_zip="0", lat=lat, lon=lon)
+
+
+def test_zip_index_round_trip(tmp_path):
+    csv_path = tmp_path / "zips.csv"
+    csv_path.write_text("zip,lat,lon\n98101,47.6114,-122.3305\n02108,42.3576,-71.0685\n10001,40.7506,-73.9972\n")
+    build_zip_index(csv_path, tmp_path / "zips.bin")
+    index = ZipIndex(tmp_path / "zips.bin")
+
+    assert len(index) == 3
+    assert index.lookup("02108") == pytest.approx((42.3576, -71.0685), abs=1e-4)
+    assert index.lookup("10001-1234") == pytest.approx((40.7506, -73.9972), abs=1e-4)
+    assert index.lookup("99999") is None
+    assert index.lookup("abc") is None
+
+
+def test_bundled_index_covers_fixture_venues_and_the_country():
+    index = ZipIndex()
+    assert index.lookup("10001") is not None
+    assert index.lookup("10451") is not None
+    assert len(index) > 30_000
+    assert index.lookup("59715") == pytest.approx((45.7, -111.0), abs=0.5)
+
+
+def test_venue_distances_match_haversine_and_memoize():
+    calculator = DistanceCalculator(ZipIndex())
+    origin = ZipIndex().lookup("10001")
+    games = [make_game("Yankee Stadium", 40.8296, -73.9262), make_game("Fenway Park", 42.3467, -71.0972), make_game("Yankee Stadium", 40.8296, -73.9262)]
+
+    distances = calculator.venue_distances("10001", games)
+
+    assert distances[0] == distances[2]
+    assert distances[0] == pytest.approx(haversine_miles(origin[0], origin[1], 40.8296, -73.9262))
+    assert distances[1] == pytest.approx(haversine_miles(origin[0], origin[1], 42.3467, -71.0972))
+    assert len(calculator._pairs) == 2
+    assert calculator.venue_distances("00000", games) == [DEFAULT_DISTANCE_MILES] * 3
+    assert calculator.venue_distances("10001", [make_game("TBD", 0.0, 0.0)]) == [DEFAULT_DISTANCE_MILES]
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import httpx
+
+from app.providers.tickets import ESPNProvider
+from app.services.http import HttpPool
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"events": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_pool_reuses_connections_across_requests():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def scenario():
+        pool = HttpPool(max_connections=4)
+        await pool.start()
+        for _ in range(3):
+            async with pool.session() as client:
+                (await client.get(url)).raise_for_status()
+        stats = pool.stats()
+        await pool.close()
+        return stats, pool.client
+
+    try:
+        stats, client_after_close = asyncio.run(scenario())
+    finally:
+        server.shutdown()
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+    assert client_after_close is None
+
+
+def test_providers_use_injected_pool():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"events": []})
+
+    async def scenario():
+        pool = HttpPool()
+        await pool.start(transport=httpx.MockTransport(handler))
+        provider = ESPNProvider(http=pool)
+        now = datetime.now(timezone.utc)
+        games = await provider.list_games("New York Yankees", now, now)
+        await pool.close()
+        return games
+
+    assert asyncio.run(scenario()) == []
+    assert seen == ["/apis/site/v2/sports/baseball/mlb/scoreboard"]
@@ -0,0 +1,44 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from app.services.jsonstream import iter_array_items
+
+
+def _collect(raw: bytes, key: str, chunk_size: int) -> list:
+    async def chunks():
+        for i in range(0, len(raw), chunk_size):
+            yield raw[i : i + chunk_size]
+
+    async def scenario():
+        return [item async for item in iter_array_items(chunks(), key)]
+
+    return asyncio.run(scenario())
+
+
+def test_items_match_full_parse_for_any_chunking():
+    rng = random.Random(7)
+    document = {
+        "leagues": [{"name": "Major League Baseball", "season": {"year": 2030}}],
+        "events": [
+            {"id": str(i), "name": f"Game {i} — Café", "score": rng.random() * 10**6, "n": 12345678901234, "ok": i % 2 == 0, "x": None}
+            for i in range(50)
+        ],
+        "day": {"date": "2030-06-01"},
+    }
+    raw = json.dumps(document, ensure_ascii=False, indent=1).encode()
+    for chunk_size in (1, 2, 7, 64, 4096, len(raw)):
+        assert _collect(raw, "events", chunk_size) == document["events"]
+
+
+def test_missing_or_empty_array_yields_nothing():
+    assert _collect(b'{"leagues": [], "events": []}', "events", 3) == []
+    assert _collect(b'{"leagues": [1, 2]}', "events", 3) == []
+    assert _collect(b"{}", "events", 1) == []
+
+
+def test_truncated_stream_raises():
+    with pytest.raises(ValueError):
+        _collect(b'{"events": [{"id": 1}, {"id": 2', "events", 4)
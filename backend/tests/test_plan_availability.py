@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import random
+
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.main import app
+from app.providers.calendar import BusyInterval
+from app.services.availability import BusyIndex, to_micros
+from app.services.plan_availability import PlanAvailability, PlanBitmap
+
+ORIGIN = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def test_bitmap_matches_exact_index():
+    rng = random.Random(5)
+    bitmap = PlanBitmap(ORIGIN, slot_minutes=15, slots=30 * 96)
+    busy = {}
+    for user in ("u1", "u2", "u3"):
+        intervals = []
+        for _ in range(60):
+            start = ORIGIN + timedelta(minutes=rng.randrange(-600, 31 * 24 * 60))
+            end = start + timedelta(minutes=rng.choice([0, 7, 15, 45, 120, 600]))
+            intervals.append(BusyInterval(start=start, end=end))
+        busy[user] = intervals
+        bitmap.set_participant(user, intervals)
+    bitmap.rebuild()
+
+    index = BusyIndex.union(busy.values())
+    windows = []
+    for _ in range(3000):
+        start = to_micros(ORIGIN) + rng.randrange(0, 29 * 24 * 60) * 60_000_000 + rng.choice([0, 1, 29_999_999])
+        windows.append((start, start + rng.choice([0, 1, 15, 90, 240]) * 60_000_000))
+    assert bitmap.covers(windows)
+    assert bitmap.available_mask(windows) == index.available_mask(windows)
+    assert any(bitmap.busy_slots(s, e) == 0 for s, e in windows)
+    assert any(bitmap.busy_slots(s, e) and free for (s, e), free in zip(windows, bitmap.available_mask(windows)))
+
+
+def test_touching_and_inverted_intervals_fall_back_to_exact_checks():
+    bitmap = PlanBitmap(ORIGIN, slot_minutes=15, slots=96)
+    bitmap.set_participant("u1", [BusyInterval(start=ORIGIN + timedelta(minutes=10), end=ORIGIN + timedelta(minutes=20))])
+    bitmap.rebuild()
+    origin = to_micros(ORIGIN)
+    assert bitmap.is_free(origin + 20 * 60_000_000, origin + 60 * 60_000_000)
+    assert not bitmap.is_free(origin + 19 * 60_000_000, origin + 60 * 60_000_000)
+
+    bitmap.set_participant("u2", [BusyInterval(start=ORIGIN + timedelta(hours=5), end=ORIGIN + timedelta(hours=4))])
+    bitmap.rebuild()
+    assert bitmap.summary()["free_slots"] == 0
+    assert not bitmap.is_free(origin + 180 * 60_000_000, origin + 360 * 60_000_000)
+    assert bitmap.is_free(origin + 270 * 60_000_000, origin + 280 * 60_000_000)
+    assert not bitmap.covers([(origin - 1, origin + 10)])
+
+
+def test_joins_patch_materialized_plans_without_rebuilding():
+    loads = []
+
+    async def load(user_ids, time_min, time_max):
+        loads.append(list(user_ids))
+        hours = {uid: timedelta(hours=int(uid[1:])) for uid in user_ids}
+        return {uid: [BusyInterval(start=time_min + h, end=time_min + h + timedelta(hours=1))] for uid, h in hours.items()}
+
+    async def scenario():
+        availability = PlanAvailability(load, horizon_days=7)
+        await availability.refresh_participant("p1", "u2")
+        first = await availability.get("p1", ["u1"])
+        await availability.refresh_participant("p1", "u2")
+        second = await availability.get("p1", ["u1", "u2"])
+        await availability.get("p1", ["u2", "u1"])
+        return availability, first, second
+
+    availability, first, second = asyncio.run(scenario())
+    assert first is second
+    assert loads == [["u1"], ["u2"]]
+    assert availability.builds == 1
+    assert availability.incremental_updates == 1
+    assert second.summary()["busy_slots"] == 8
+
+
+def test_materialized_plans_are_bounded_by_approximate_bytes():
+    async def load(user_ids, time_min, time_max):
+        return {uid: [BusyInterval(start=time_min + timedelta(days=d), end=time_min + timedelta(days=d, hours=3)) for d in range(100)] for uid in user_ids}
+
+    async def scenario():
+        availability = PlanAvailability(load, horizon_days=120, max_bytes=60_000)
+        for plan_id in ("p1", "p2", "p3"):
+            await availability.get(plan_id, ["u1", "u2"])
+        return availability
+
+    availability = asyncio.run(scenario())
+    stats = availability.stats()
+    assert stats["entries"] == 1 and stats["evictions"] == 2
+    assert 0 < stats["approx_bytes"] <= 60_000
+
+
+def test_readiness_reports_materialized_availability(monkeypatch):
+    availability = PlanAvailability(routes.load_participants_busy, horizon_days=30)
+    monkeypatch.setattr(routes, "plan_availability", availability)
+    client = TestClient(app)
+    plan_id = client.post("/plans", json={"name": "Bitmap"}, headers={"X-User-Id": "b1"}).json()["plan"]["id"]
+    assert "availability" not in client.get(f"/plans/{plan_id}/readiness").json()
+
+    client.post("/auth/google/callback", params={"account_email": "b1@example.com"}, headers={"X-User-Id": "b1"})
+    summary = client.get(f"/plans/{plan_id}/readiness").json()["availability"]
+    assert summary["participants_indexed"] == 1
+    assert summary["slot_minutes"] == 15
+    assert summary["free_slots"] + summary["busy_slots"] == 30 * 96
+
+    client.post(f"/plans/{plan_id}/join", headers={"X-User-Id": "b2"})
+    client.post("/auth/google/callback", params={"account_email": "b2@example.com"}, headers={"X-User-Id": "b2"})
+    assert client.get(f"/plans/{plan_id}/readiness").json()["availability"]["participants_indexed"] == 2
+    assert availability.builds == 1
+    assert availability.incremental_updates == 2
+
+    now = datetime.now(timezone.utc)
+    body = {
+        "plan_id": plan_id,
+        "preferences": {"team_text": "Yankees", "date_start": now.isoformat(), "date_end": (now + timedelta(days=20)).isoformat(), "party_size": 2, "budget_total": 300},
+    }
+    assert client.post("/search", json=body, headers={"X-User-Id": "b1"}).status_code == 200
+    assert availability.builds == 1
@@ -0,0 +1,78 @@
+import asyncio
+from datetime import timedelta
+import time
+
+from app.models.records import GameRecord
+from app.providers.tickets import TicketProvider
+from app.services.prefetch import SchedulePrefetcher, UpstreamBudget
+from app.services.schedule import ScheduleStore
+from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+
+class TeamProvider(TicketProvider):
+    source = "prefetch-test"
+
+    def __init__(self):
+        self.list_calls: list[str] = []
+
+    async def list_games(self, team, date_start, date_end):
+        self.list_calls.append(team)
+        if team == "Broken FC":
+            raise RuntimeError("upstream down")
+        start = date_start + timedelta(days=1)
+        return [GameRecord(game_id=f"{team}-1", league="MLB", team=team, opponent="Opp", start_time_utc=start, end_time_utc=start, venue="x", venue_zip="1", lat=1, lon=1)]
+
+
+def test_run_once_warms_schedules_and_tickets_and_reports_status(tmp_path):
+    provider = TeamProvider()
+    warmed: list[str] = []
+
+    async def warm_ticket(provider, game):
+        warmed.append(game.game_id)
+
+    schedule = ScheduleStore(AsyncSQLiteStore(SQLiteStore(str(tmp_path / "prefetch.db"))), freshness_seconds=3600)
+    prefetcher = SchedulePrefetcher(
+        schedule,
+        teams=["Seattle Mariners", "Broken FC", "Chicago Cubs"],
+        horizon_days=7,
+        interval_seconds=60,
+        jitter_seconds=0,
+        requests_per_minute=600,
+        enabled=False,
+    )
+
+    async def scenario():
+        await prefetcher.start(lambda: provider, warm_ticket)
+        await prefetcher.run_once()
+        return prefetcher.running
+
+    assert asyncio.run(scenario()) is False
+    assert provider.list_calls == ["Seattle Mariners", "Broken FC", "Chicago Cubs"]
+    assert warmed == ["Seattle Mariners-1", "Chicago Cubs-1"]
+    status = prefetcher.status()
+    assert (status["teams"], status["warm_teams"], status["cycles"]) == (3, 2, 1)
+    assert "Broken FC" in status["errors"]
+
+
+def test_upstream_budget_waits_once_tokens_are_spent():
+    budget = UpstreamBudget(requests_per_minute=1200)
+
+    async def scenario():
+        started = time.perf_counter()
+        for _ in range(1200):
+            await budget.acquire()
+        drained = time.perf_counter() - started
+        await budget.acquire()
+        return drained, time.perf_counter() - started - drained
+
+    drained, waited = asyncio.run(scenario())
+    assert drained < 0.5
+    assert waited >= 0.03
+
+
+def test_default_horizon_covers_the_default_search_window():
+    from app.services.prefetch import prefetcher
+    from app.services.store import default_preferences
+
+    window = default_preferences()
+    assert prefetcher.horizon_days > (window.date_end - window.date_start).days
@@ -0,0 +1,53 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.models.records import GameRecord, TicketRecord, game_to_json
+from app.models.schemas import Game, SearchResult, TicketSummary
+from app.providers.tickets import ESPNProvider
+from app.services.store import SQLiteStore
+
+START = datetime(2030, 6, 1, 23, 5, tzinfo=timezone.utc)
+
+
+def _game(game_id: str = "g1") -> GameRecord:
+    return GameRecord(
+        game_id=game_id, league="MLB", team="New York Yankees", opponent="Boston Red Sox",
+        start_time_utc=START, end_time_utc=START + timedelta(hours=3), venue="Yankee Stadium",
+        venue_zip="10451", lat=40.83, lon=-73.93, giveaway_text="Bobblehead",
+    )
+
+
+def test_records_convert_to_the_same_response_models():
+    game = _game()
+    ticket = TicketRecord(game_id="g1", min_price=30.0, median_price=40.5, availability_count=12, estimated_total=101.25, best_value_score=59.5, deep_link="https://t/g1")
+    result = SearchResult(game=Game.model_validate(game), ticket_summary=TicketSummary.model_validate(ticket), score=0.5)
+    expected = SearchResult(
+        game=Game(**{name: getattr(game, name) for name in GameRecord.__slots__}),
+        ticket_summary=TicketSummary(**{name: getattr(ticket, name) for name in TicketRecord.__slots__}),
+        score=0.5,
+    )
+    assert result.model_dump_json() == expected.model_dump_json()
+    assert not hasattr(game, "__dict__")
+
+
+def test_schedule_rows_round_trip_and_read_legacy_json(tmp_path):
+    store = SQLiteStore(str(tmp_path / "records.db"))
+    game = _game()
+    assert GameRecord.from_json(game_to_json(game)) == game
+    legacy = Game.model_validate(game).model_dump_json()
+    assert GameRecord.from_json(legacy) == game
+
+    start_us = int(START.timestamp() * 1_000_000)
+    store.replace_schedule("espn", game.team, ["2030-06-01"], start_us - 1, start_us + 1, [game, Game.model_validate(_game("g2"))], 0)
+    assert store.get_scheduled_games("espn", game.team, start_us, start_us) == [game, _game("g2")]
+
+
+def test_espn_tickets_share_indexed_records_without_copying():
+    ticket = ESPNProvider._ticket_from_summary("espn-1", "Tickets as low as $20", "https://t/1", 2)
+    ESPNProvider._tickets.set("espn-1", ticket)
+    provider = ESPNProvider()
+    assert asyncio.run(provider.search_tickets("espn-1", 2, (0, 100))) is ticket
+    four = asyncio.run(provider.search_tickets("espn-1", 4, (0, 100)))
+    assert four.estimated_total == ticket.median_price * 4 * 1.25
+    assert ticket.estimated_total == ticket.median_price * 2 * 1.25
+    assert asyncio.run(provider.search_tickets("espn-1", 2, (0, 10))) is None
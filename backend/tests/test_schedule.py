@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.records import GameRecord
+from app.providers.tickets import PartialScheduleError, ProviderUnavailableError, TicketProvider
+from app.services.schedule import ScheduleStore
+from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+BASE = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+class CountingProvider(TicketProvider):
+    source = "counting"
+
+    def __init__(self):
+        self.calls: list[tuple[datetime, datetime]] = []
+        self.failure: Exception | None = None
+
+    def supports_team(self, team):
+        return team == "Yankees"
+
+    async def list_games(self, team, date_start, date_end):
+        self.calls.append((date_start, date_end))
+        if self.failure is not None:
+            raise self.failure
+        games = []
+        for day in range(60):
+            start = BASE + timedelta(days=day, hours=23)
+            if date_start <= start <= date_end:
+                games.append(GameRecord(game_id=f"g{day}", league="MLB", team=team, opponent="Red Sox", start_time_utc=start, end_time_utc=start + timedelta(hours=3), venue="x", venue_zip="10451", lat=1, lon=1))
+        return games
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_schedule_is_served_locally_after_restart_and_refreshed_incrementally(tmp_path):
+    db = str(tmp_path / "schedule.db")
+    provider, clock = CountingProvider(), FakeClock()
+
+    async def list_games(schedule: ScheduleStore, days_from: int, days_to: int):
+        return await schedule.list_games(provider, "Yankees", BASE + timedelta(days=days_from), BASE + timedelta(days=days_to))
+
+    first = ScheduleStore(AsyncSQLiteStore(SQLiteStore(db)), freshness_seconds=3600, clock=clock)
+    games = asyncio.run(list_games(first, 0, 9))
+    assert [g.game_id for g in games] == [f"g{d}" for d in range(9)]
+    assert len(provider.calls) == 1
+
+    restarted = ScheduleStore(AsyncSQLiteStore(SQLiteStore(db)), freshness_seconds=3600, clock=clock)
+    assert asyncio.run(list_games(restarted, 0, 9)) == games
+    assert len(provider.calls) == 1
+
+    extended = asyncio.run(list_games(restarted, 5, 14))
+    assert [g.game_id for g in extended] == [f"g{d}" for d in range(5, 14)]
+    assert provider.calls[-1] == (BASE + timedelta(days=10), BASE + timedelta(days=15) - timedelta(microseconds=1))
+
+    clock.now += 7200
+    asyncio.run(list_games(restarted, 0, 2))
+    assert provider.calls[-1] == (BASE, BASE + timedelta(days=3) - timedelta(microseconds=1))
+    assert len(provider.calls) == 3
+
+
+def test_failed_or_partial_refreshes_keep_stored_games_and_stay_stale(tmp_path):
+    sqlite = SQLiteStore(str(tmp_path / "schedule.db"))
+    provider, clock = CountingProvider(), FakeClock()
+    schedule = ScheduleStore(AsyncSQLiteStore(sqlite), freshness_seconds=3600, clock=clock)
+
+    def list_games():
+        return asyncio.run(schedule.list_games(provider, "Yankees", BASE, BASE + timedelta(days=2)))
+
+    def degraded_games():
+        with pytest.raises(PartialScheduleError) as degraded:
+            list_games()
+        return [g.game_id for g in degraded.value.games]
+
+    assert [g.game_id for g in list_games()] == ["g0", "g1"]
+    clock.now += 7200
+    provider.failure = ProviderUnavailableError("503")
+    assert degraded_games() == ["g0", "g1"]
+    assert schedule.failed_refreshes == 1
+
+    fresh = GameRecord(game_id="g9", league="MLB", team="Yankees", opponent="Mets", start_time_utc=BASE + timedelta(hours=12), end_time_utc=BASE + timedelta(hours=15), venue="x", venue_zip="10451", lat=1, lon=1)
+    provider.failure = PartialScheduleError("espn down", [fresh])
+    assert degraded_games() == ["g9", "g0", "g1"]
+    provider.failure = None
+    assert [g.game_id for g in list_games()] == ["g0", "g1"]
+    assert len(provider.calls) == 4
+
+
+def test_unsupported_teams_write_nothing_and_past_days_are_pruned(tmp_path):
+    sqlite = SQLiteStore(str(tmp_path / "schedule.db"))
+    provider, clock = CountingProvider(), FakeClock()
+    schedule = ScheduleStore(AsyncSQLiteStore(sqlite), freshness_seconds=3600, clock=clock)
+    assert asyncio.run(schedule.list_games(provider, "Free Text FC", BASE, BASE + timedelta(days=90))) == []
+    assert provider.calls == []
+
+    asyncio.run(schedule.list_games(provider, "Yankees", BASE, BASE + timedelta(days=9)))
+    clock.now = (BASE + timedelta(days=5, hours=1)).timestamp()
+    games = asyncio.run(schedule.list_games(provider, "Yankees", BASE + timedelta(days=5), BASE + timedelta(days=9)))
+    assert [g.game_id for g in games] == [f"g{d}" for d in range(5, 9)]
+    with sqlite._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 5
+        assert tuple(conn.execute("SELECT MIN(day), COUNT(*) FROM schedule_coverage").fetchone()) == ("2026-06-06", 5)
@@ -1,12 +1,43 @@
-from datetime import datetime, timezone
-from app.models.schemas import Game, TicketSummary, Preferences
-from app.services.scoring import score_game
+from datetime import datetime, timedelta, timezone
+import random
+from app.models.records import GameRecord, TicketRecord
+from app.models.schemas import Preferences
+from app.services.scoring import ScoringColumns, explain, score_game, score_games
 
 
 def test_score_game_budget_reason():
-    game = Game(game_id="1", league="MLB", team="Yankees", opponent="Red Sox", start_time_utc=datetime.now(timezone.utc), end_time_utc=datetime.now(timezone.utc), venue="x", venue_zip="1", lat=1, lon=1, giveaway_text="bobblehead")
-    ticket = TicketSummary(game_id="1", min_price=30, median_price=50, availability_count=100, estimated_total=120, best_value_score=0.8, deep_link="x")
+    game = GameRecord(game_id="1", league="MLB", team="Yankees", opponent="Red Sox", start_time_utc=datetime.now(timezone.utc), end_time_utc=datetime.now(timezone.utc), venue="x", venue_zip="1", lat=1, lon=1, giveaway_text="bobblehead")
+    ticket = TicketRecord(game_id="1", min_price=30, median_price=50, availability_count=100, estimated_total=120, best_value_score=0.8, deep_link="x")
     pref = Preferences(date_start=datetime.now(timezone.utc), date_end=datetime.now(timezone.utc), budget_total=300)
     result = score_game(game, ticket, pref, 5)
     assert result.score > 0.5
     assert any("budget" in r.lower() for r in result.why_recommended)
+
+
+def test_score_games_matches_score_game():
+    rng = random.Random(11)
+    base = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    for trial in range(20):
+        pref = Preferences(
+            date_start=base,
+            date_end=base,
+            budget_total=rng.choice([0, 150, 300]),
+            max_miles=rng.choice([0, 25, 50]),
+            giveaway_only=rng.random() < 0.3,
+            giveaway_keywords=rng.choice([[], ["Bobblehead"], ["towel", "CAP", "jersey"]]),
+            dow_prefs=rng.sample(range(7), rng.randrange(0, 4)),
+            tod_prefs=rng.sample(["morning", "afternoon", "evening"], rng.randrange(0, 3)),
+        )
+        games, tickets, distances = [], [], []
+        for i in range(40):
+            start = base + timedelta(hours=rng.randrange(0, 24 * 30))
+            text = rng.choice([None, "", "Bobblehead night", "Rally towel + cap giveaway"])
+            games.append(GameRecord(game_id=str(i), league="MLB", team="Yankees", opponent="Red Sox", start_time_utc=start, end_time_utc=start, venue="x", venue_zip="1", lat=1, lon=1, giveaway_text=text))
+            tickets.append(TicketRecord(game_id=str(i), min_price=10, median_price=20, availability_count=1, estimated_total=rng.uniform(0, 400), best_value_score=1, deep_link="x"))
+            distances.append(rng.uniform(0, 80))
+
+        scores = score_games(ScoringColumns.from_rows(games, tickets, distances), pref)
+        for game, ticket, distance, score in zip(games, tickets, distances, scores):
+            expected = score_game(game, ticket, pref, distance)
+            assert score == expected.score, trial
+            assert explain(game, ticket, pref, distance) == expected.why_recommended, trial
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
 from app.main import app
@@ -55,10 +56,12 @@ def test_shared_plan_search_flow_after_connecting_accounts():
 
 
 def test_ready_endpoint():
+    from app.api import routes
+
     client = TestClient(app)
     resp = client.get('/ready')
     assert resp.status_code == 200
-    assert 'checks' in resp.json()
+    assert resp.json()['checks']['ticket_provider'] == routes.get_ticket_provider().source
 
 
 def test_search_rate_limit_enforced():
@@ -76,3 +79,143 @@ def test_auth_callback_rejects_unknown_provider():
     resp = client.post('/auth/github/callback')
     assert resp.status_code == 404
     assert resp.json() == {'detail': 'unknown provider'}
+
+
+def test_search_keeps_partial_results_when_ticket_lookups_fail(monkeypatch, caplog):
+    from app.api import routes
+    from app.core.config import settings
+    from app.models.records import GameRecord, TicketRecord
+    from app.providers.tickets import TicketProvider
+
+    now = datetime.now(timezone.utc)
+
+    class FlakyProvider(TicketProvider):
+        async def list_games(self, team, date_start, date_end):
+            return [
+                GameRecord(game_id=f"flaky-{i}", league="MLB", team=team, opponent="Red Sox", start_time_utc=now + timedelta(days=i + 1), end_time_utc=now + timedelta(days=i + 1, hours=3), venue="x", venue_zip="10451", lat=1, lon=1)
+                for i in range(3)
+            ]
+
+        async def search_tickets(self, game_id, party_size, price_bounds):
+            if game_id == "flaky-1":
+                raise RuntimeError("upstream down")
+            if game_id == "flaky-2":
+                await asyncio.sleep(1)
+            return TicketRecord(game_id=game_id, min_price=30, median_price=50, availability_count=10, estimated_total=125, best_value_score=50, deep_link="x")
+
+    monkeypatch.setattr(routes, "get_ticket_provider", lambda: FlakyProvider())
+    monkeypatch.setattr(settings, "ticket_lookup_timeout_seconds", 0.05)
+    client = TestClient(app)
+    pref = Preferences(team_text="Flaky Team", date_start=now, date_end=now + timedelta(days=30), budget_total=300)
+    response = client.post("/search", json={"preferences": pref.model_dump(mode="json")}, headers={"X-User-Id": "flaky-user"})
+    assert response.status_code == 200
+    assert [r["game"]["game_id"] for r in response.json()["ranked"]] == ["flaky-0"]
+    assert "RuntimeError: upstream down" in caplog.text
+    assert "timed out" in caplog.text
+
+
+def test_failed_schedule_refresh_is_not_cached(monkeypatch, tmp_path):
+    from app.api import routes
+    from app.models.records import GameRecord, TicketRecord
+    from app.providers.tickets import ProviderUnavailableError, TicketProvider
+    from app.services.schedule import ScheduleStore
+    from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+    now = datetime.now(timezone.utc)
+
+    class RecoveringProvider(TicketProvider):
+        source = "recovering"
+        calls = 0
+
+        async def list_games(self, team, date_start, date_end):
+            self.calls += 1
+            if self.calls == 1:
+                raise ProviderUnavailableError("scoreboard timed out")
+            return [GameRecord(game_id="r-1", league="MLB", team=team, opponent="Red Sox", start_time_utc=now + timedelta(days=2), end_time_utc=now + timedelta(days=2, hours=3), venue="x", venue_zip="10451", lat=1, lon=1)]
+
+        async def search_tickets(self, game_id, party_size, price_bounds):
+            return TicketRecord(game_id=game_id, min_price=30, median_price=50, availability_count=10, estimated_total=125, best_value_score=50, deep_link="x")
+
+    provider = RecoveringProvider()
+    monkeypatch.setattr(routes, "get_ticket_provider", lambda: provider)
+    monkeypatch.setattr(routes, "schedule_store", ScheduleStore(AsyncSQLiteStore(SQLiteStore(str(tmp_path / "schedule.db"))), freshness_seconds=3600))
+    client = TestClient(app)
+    pref = Preferences(team_text="Recovering Team", date_start=now, date_end=now + timedelta(days=10), budget_total=300)
+    totals = [
+        client.post("/search", json={"preferences": pref.model_dump(mode="json")}, headers={"X-User-Id": f"recover-{i}"}).json()["total"]
+        for i in range(3)
+    ]
+    assert totals == [0, 1, 1]
+    assert provider.calls == 2
+
+
+def test_concurrent_me_requests_do_not_block_event_loop(monkeypatch, tmp_path):
+    import time
+    import httpx
+    from app.api import routes
+    from app.services.store import AsyncSQLiteStore, SQLiteStore
+
+    class SlowStore(SQLiteStore):
+        def get_user_providers(self, user_id):
+            time.sleep(0.1)
+            return super().get_user_providers(user_id)
+
+    slow = AsyncSQLiteStore(SlowStore(str(tmp_path / "slow.db")), max_workers=8)
+    monkeypatch.setattr(routes, "async_store", slow)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.perf_counter()
+            responses = await asyncio.gather(*(client.get("/me", headers={"X-User-Id": f"u{i}"}) for i in range(8)))
+            return time.perf_counter() - started, responses
+
+    elapsed, responses = asyncio.run(scenario())
+    slow.close()
+    assert all(r.status_code == 200 for r in responses)
+    assert elapsed < 0.5
+
+
+def test_search_pagination_matches_full_ranking_and_summary_mode(monkeypatch):
+    from app.api import routes
+    from app.models.records import GameRecord, TicketRecord
+    from app.providers.tickets import TicketProvider
+
+    now = datetime.now(timezone.utc)
+
+    class ManyGamesProvider(TicketProvider):
+        async def list_games(self, team, date_start, date_end):
+            return [
+                GameRecord(game_id=f"page-{i}", league="MLB", team=team, opponent=f"Opp {i}", start_time_utc=now + timedelta(days=i + 1), end_time_utc=now + timedelta(days=i + 1, hours=3), venue="x", venue_zip="10451", lat=1, lon=1)
+                for i in range(10)
+            ]
+
+        async def search_tickets(self, game_id, party_size, price_bounds):
+            price = 40 + int(game_id.split("-")[1]) * 7 % 50
+            return TicketRecord(game_id=game_id, min_price=price, median_price=price, availability_count=10, estimated_total=price * 2.5, best_value_score=50, deep_link=f"https://t/{game_id}")
+
+    monkeypatch.setattr(routes, "get_ticket_provider", lambda: ManyGamesProvider())
+    client = TestClient(app)
+    pref = Preferences(team_text="Paging Team", date_start=now, date_end=now + timedelta(days=30), budget_total=300).model_dump(mode="json")
+    headers = {"X-User-Id": "paging-user"}
+
+    full = client.post("/search", json={"preferences": pref}, headers=headers).json()
+    assert full["total"] == 10 and full["next_cursor"] is None
+
+    ids, cursor = [], None
+    while True:
+        page = client.post("/search", json={"preferences": pref, "limit": 4, "cursor": cursor}, headers=headers).json()
+        assert page["top_three"] == full["top_three"]
+        ids += [r["game"]["game_id"] for r in page["ranked"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert ids == [r["game"]["game_id"] for r in full["ranked"]]
+
+    summary = client.post("/search", json={"preferences": pref, "limit": 2, "fields": "summary"}, headers=headers).json()
+    assert [r["game_id"] for r in summary["ranked"]] == ids[:2]
+    assert "game" not in summary["ranked"][0]
+    assert summary["ranked"][0]["deep_link"].startswith("https://t/")
+
+    bad = client.post("/search", json={"preferences": pref, "cursor": "nope"}, headers=headers)
+    assert bad.status_code == 400
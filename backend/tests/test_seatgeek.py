@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from tests.seatgeek_standin import create_app, make_events
+from app.providers.tickets import SeatGeekProvider
+from app.services.http import HttpPool
+
+
+@pytest.fixture()
+def standin():
+    SeatGeekProvider._stats.clear()
+    start = datetime(2030, 4, 1, tzinfo=timezone.utc)
+    app = create_app(make_events(["New York Yankees", "Chicago Cubs"], per_team=90, start=start))
+    yield app, start
+    SeatGeekProvider._stats.clear()
+
+
+def _run(app, scenario):
+    async def wrapper():
+        pool = HttpPool()
+        await pool.start(transport=httpx.ASGITransport(app=app))
+        provider = SeatGeekProvider("id", "secret", http=pool, base_url="http://seatgeek.test/2")
+        provider.per_page = 25
+        try:
+            return await scenario(provider)
+        finally:
+            await pool.close()
+
+    return asyncio.run(wrapper())
+
+
+def test_list_games_pages_through_the_whole_window(standin):
+    app, start = standin
+
+    async def scenario(provider):
+        return await provider.list_games("New York Yankees", start, start + timedelta(days=200))
+
+    games = _run(app, scenario)
+    assert len(games) == 90
+    assert len({g.game_id for g in games}) == 90
+    assert app.state.requests == 4
+
+
+def test_ticket_stats_come_from_list_and_bulk_responses(standin):
+    app, start = standin
+
+    async def scenario(provider):
+        games = await provider.list_games("Chicago Cubs", start, start + timedelta(days=30))
+        listed = app.state.requests
+        ticket = await provider.search_tickets(games[0].game_id, 4, (0, 500))
+        assert app.state.requests == listed
+
+        SeatGeekProvider._stats.clear()
+        await provider.prime_tickets([g.game_id for g in games] * 2)
+        primed = app.state.requests - listed
+        summaries = [await provider.search_tickets(g.game_id, 2, (0, 500)) for g in games]
+        return ticket, primed, summaries, app.state.requests - listed
+
+    ticket, primed, summaries, after = _run(app, scenario)
+    assert ticket is not None and ticket.estimated_total == ticket.median_price * 4 * 1.25
+    assert ticket.deep_link.startswith("https://seatgeek.example/e/")
+    assert primed == 2
+    assert after == primed
+    assert all(s is not None for s in summaries)
+
+
+def test_search_tickets_falls_back_to_single_event_lookup(standin):
+    app, _ = standin
+
+    async def scenario(provider):
+        in_budget = await provider.search_tickets("1000000", 2, (0, 500))
+        over_budget = await provider.search_tickets("1000000", 2, (0, 1))
+        return in_budget, over_budget
+
+    in_budget, over_budget = _run(app, scenario)
+    assert in_budget is not None and over_budget is None
+    assert app.state.requests == 1
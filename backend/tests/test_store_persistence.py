@@ -1,5 +1,7 @@
-from app.services.store import SQLiteStore
-from app.models.schemas import ConnectedCalendarProvider
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+from app.services.store import MIGRATIONS, SQLiteStore
+from app.models.schemas import ConnectedCalendarProvider, Plan
 
 
 def test_sqlite_store_persists_plans_and_providers(tmp_path):
@@ -23,3 +25,85 @@ def test_sqlite_store_persists_plans_and_providers(tmp_path):
 
     assert loaded.participant_user_ids == ["alex", "brian"]
     assert len(second.get_user_providers("alex")) == 1
+
+
+def test_sqlite_store_reuses_pooled_wal_connections(tmp_path):
+    store = SQLiteStore(str(tmp_path / "pool.db"), pool_size=2)
+
+    def work(i: int):
+        store.set_preferences(f"user-{i}", store.get_preferences(f"user-{i}"))
+        return store.plan_exists("missing")
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        assert not any(pool.map(work, range(50)))
+
+    assert store._opened <= 2
+    with store._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    store.close()
+    assert store._opened == 0
+
+
+def test_legacy_json_schema_is_migrated(tmp_path):
+    db = tmp_path / "legacy.db"
+    plan = Plan(id="p1", name="Legacy", owner_user_id="alex", participant_user_ids=["alex", "brian"])
+    provider = ConnectedCalendarProvider(provider="google", account_email="alex@example.com", token_encrypted="t", scopes=["freebusy.read"])
+    with sqlite3.connect(db) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE providers (user_id TEXT NOT NULL, provider TEXT NOT NULL, provider_json TEXT NOT NULL, PRIMARY KEY (user_id, provider));
+            CREATE TABLE plans (plan_id TEXT PRIMARY KEY, plan_json TEXT NOT NULL);
+            """
+        )
+        conn.execute("INSERT INTO plans VALUES (?, ?)", (plan.id, plan.model_dump_json()))
+        conn.execute("INSERT INTO providers VALUES (?, ?, ?)", ("alex", "google", provider.model_dump_json()))
+
+    store = SQLiteStore(str(db))
+
+    assert store.schema_version == MIGRATIONS[-1][0]
+    assert store.get_plan("p1").participant_user_ids == ["alex", "brian"]
+    assert store.get_user_providers("alex") == [provider]
+    assert store.get_user_plan_ids("brian") == ["p1"]
+    with store._connect() as conn:
+        detail = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT plan_id FROM plan_participants WHERE user_id = ?", ("brian",)
+        ).fetchall()
+    assert any("idx_plan_participants_user" in row["detail"] for row in detail)
+
+
+def test_concurrent_joins_are_atomic(tmp_path):
+    store = SQLiteStore(str(tmp_path / "joins.db"))
+    plan = store.create_plan(owner_user_id="alex", name="Group")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: store.join_plan(plan.id, f"user-{i % 10}"), range(40)))
+
+    participants = store.get_plan(plan.id).participant_user_ids
+    assert participants[0] == "alex"
+    assert sorted(participants[1:]) == sorted(f"user-{i}" for i in range(10))
+    assert store.join_plan("missing-plan", "alex") is False
+
+
+def test_bulk_provider_lookup_for_many_users_is_one_query(tmp_path):
+    store = SQLiteStore(str(tmp_path / "bulk.db"), pool_size=1)
+    user_ids = [f"user-{i}" for i in range(20)]
+    for user_id in user_ids[::2]:
+        for provider in ("google", "microsoft"):
+            store.set_user_provider(
+                user_id,
+                ConnectedCalendarProvider(provider=provider, account_email=f"{user_id}@example.com", token_encrypted="t"),
+            )
+
+    statements = []
+    with store._connect() as conn:
+        conn.set_trace_callback(statements.append)
+    counts = store.count_user_providers(user_ids)
+    providers = store.get_users_providers(user_ids)
+    with store._connect() as conn:
+        conn.set_trace_callback(None)
+
+    assert counts == {user_id: len(store.get_user_providers(user_id)) for user_id in user_ids}
+    assert providers["user-0"] == store.get_user_providers("user-0")
+    assert providers["user-1"] == []
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 2